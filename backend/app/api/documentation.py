@@ -47,7 +47,7 @@ API_DOCS = {
         "/api/analyze": {
             "post": {
                 "summary": "기업 분석",
-                "description": "홈페이지 URL과 이메일을 입력하여 기업을 분석합니다.",
+                "description": "홈페이지 URL과 이메일을 입력하여 기업을 분석합니다. 분석 전에 DNS 조회와 HEAD 요청으로 홈페이지를 점검하며, 도메인이 없으면 422로 거부하고 접속만 실패하면 웹사이트 수집을 생략합니다.",
                 "requestBody": {
                     "required": True,
                     "content": {
@@ -93,8 +93,11 @@ API_DOCS = {
                                         "website": {},
                                         "analysis_date": "2024-01-15 10:30:00",
                                         "confidence_score": 0.85,
-                                        "analysis_method": "AI (GPT-4o-mini)",
+                                        "analysis_method": "AI (openai/gpt-4o-mini)",
                                         "crawl_status": "success",
+                                        "preflight": {"reachable": True, "canonical_url": "https://www.example.com/"},
+                                        "data_provenance": {"real": 6, "sample": 0, "cached": 1, "real_share": 1.0},
+                                        "degraded": False,
                                         "recommendations": []
                                     }
                                 }
@@ -113,10 +116,50 @@ API_DOCS = {
                                 }
                             }
                         }
+                    },
+                    "422": {
+                        "description": "홈페이지 도메인 조회 실패 (사전 점검)",
+                        "content": {
+                            "application/json": {
+                                "example": {
+                                    "success": False,
+                                    "error": "홈페이지에 접속할 수 없습니다: DNS 조회 실패: no-such-host.example",
+                                    "error_code": "UNREACHABLE_HOMEPAGE",
+                                    "details": {
+                                        "url": "https://no-such-host.example",
+                                        "canonical_url": "https://no-such-host.example",
+                                        "resolvable": False,
+                                        "reachable": False,
+                                        "status_code": 0,
+                                        "reason": "DNS 조회 실패: no-such-host.example",
+                                        "elapsed": 0.012
+                                    },
+                                    "timestamp": "2024-01-15T10:30:00"
+                                }
+                            }
+                        }
                     }
                 }
             }
         },
+        "/api/analyze/stream": {
+            "post": {
+                "summary": "기업 분석 (스트리밍)",
+                "description": "/api/analyze와 같은 요청을 받아 진행 상황을 Server-Sent Events로 전송합니다. AI 응답은 JSON 스키마로 제한되며 summary → risks → certifications → confidence_score 순으로 필드가 완성되는 즉시 field 이벤트로 전달됩니다.",
+                "responses": {
+                    "200": {
+                        "description": "이벤트 스트림 (stage, field, result, error)",
+                        "content": {
+                            "text/event-stream": {
+                                "example": "event: stage\ndata: {\"stage\": \"analyzing\", \"company\": \"Example\"}\n\nevent: field\ndata: {\"name\": \"summary\", \"value\": \"기업 분석 요약\"}\n\nevent: result\ndata: {...}\n\n"
+                            }
+                        }
+                    },
+                    "400": {"description": "잘못된 요청"},
+                    "422": {"description": "홈페이지 도메인 조회 실패 (사전 점검)"}
+                }
+            }
+        },
         "/api/consultants": {
             "get": {
                 "summary": "컨설턴트 목록 조회",
@@ -392,6 +435,33 @@ API_DOCS = {
                     }
                 }
             }
+        },
+        "/api/metrics": {
+            "get": {
+                "summary": "서비스 지표 조회",
+                "description": "크롤링, 서킷 브레이커 등 서비스 내부 지표를 조회합니다.",
+                "responses": {
+                    "200": {
+                        "description": "조회 성공",
+                        "content": {
+                            "application/json": {
+                                "example": {
+                                    "counters": {"scraper.fetch.attempts": 12, "scraper.fetch.short_circuited": 3},
+                                    "gauges": {},
+                                    "observations": {},
+                                    "circuit_breaker.web_scraper": {
+                                        "open": 1,
+                                        "half_open": 0,
+                                        "keys": {
+                                            "dead.example.com": {"state": "open", "failures": 3, "retry_in": 241.5}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
         }
     },
     "components": {
@@ -24,6 +24,76 @@ class Config:
     # CORS 설정
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
     
+    # 크롤링 설정
+    SCRAPER_CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.cache/pages')
+    SCRAPER_BUDGET_SECONDS = float(os.getenv('SCRAPER_BUDGET_SECONDS', 20))
+    SCRAPER_BREAKER_THRESHOLD = int(os.getenv('SCRAPER_BREAKER_THRESHOLD', 3))
+    SCRAPER_BREAKER_RESET_SECONDS = float(os.getenv('SCRAPER_BREAKER_RESET_SECONDS', 300))
+    SCRAPER_CONTENT_BUDGET = int(os.getenv('SCRAPER_CONTENT_BUDGET', 1200))
+    
+    # 배치 크롤링 설정
+    ASYNC_FETCH_MAX_IN_FLIGHT = int(os.getenv('ASYNC_FETCH_MAX_IN_FLIGHT', 200))
+    ASYNC_FETCH_PER_HOST = int(os.getenv('ASYNC_FETCH_PER_HOST', 4))
+    ASYNC_FETCH_POLITENESS_DELAY = float(os.getenv('ASYNC_FETCH_POLITENESS_DELAY', 0.25))
+    
+    # 분석 설정
+    ANALYSIS_DEADLINE_SECONDS = float(os.getenv('ANALYSIS_DEADLINE_SECONDS', 60))
+    RULE_ANALYZER_ENABLED = os.getenv('RULE_ANALYZER_ENABLED', 'False').lower() == 'true'
+    RULE_ANALYZER_THRESHOLD = float(os.getenv('RULE_ANALYZER_THRESHOLD', 0.8))
+    MIN_REAL_DATA_SHARE = float(os.getenv('MIN_REAL_DATA_SHARE', 0.5))
+    
+    # LLM 호출 설정
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL', '')
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 8))
+    LLM_MAX_ATTEMPTS = int(os.getenv('LLM_MAX_ATTEMPTS', 4))
+    LLM_REQUEST_TIMEOUT = float(os.getenv('LLM_REQUEST_TIMEOUT', 30))
+    LLM_RETRY_MAX_BACKOFF = float(os.getenv('LLM_RETRY_MAX_BACKOFF', 20))
+    
+    # LLM 공급자·모델 라우팅 설정 (LLM_PROVIDERS: JSON 객체, LLM_ROUTES: JSON 배열)
+    LLM_DEFAULT_PROVIDER = os.getenv('LLM_DEFAULT_PROVIDER', 'openai')
+    LLM_DEFAULT_MODEL = os.getenv('LLM_DEFAULT_MODEL', 'gpt-4o-mini')
+    LLM_PROVIDERS = os.getenv('LLM_PROVIDERS', '')
+    LLM_ROUTES = os.getenv('LLM_ROUTES', '')
+    
+    # LLM 응답 캐시 설정
+    LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', '.cache/llm_responses.sqlite3')
+    LLM_CACHE_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', 604800))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 1000))
+    LLM_PROMPT_TOKEN_BUDGET = int(os.getenv('LLM_PROMPT_TOKEN_BUDGET', 2500))
+    TOKENIZER_LOAD_TIMEOUT = float(os.getenv('TOKENIZER_LOAD_TIMEOUT', 3))
+    
+    # AI 분석 방식 (single: 단일 프롬프트, map_reduce: 출처별 요약 병렬 실행 후 통합)
+    AI_ANALYSIS_MODE = os.getenv('AI_ANALYSIS_MODE', 'single')
+    LLM_DIGEST_TOKEN_BUDGET = int(os.getenv('LLM_DIGEST_TOKEN_BUDGET', 1200))
+    
+    # 일괄 재분석 설정 (프롬프트 변경 후 저장된 분석을 배치 API로 재실행)
+    BULK_REANALYSIS_BATCH_SIZE = int(os.getenv('BULK_REANALYSIS_BATCH_SIZE', 200))
+    BULK_REANALYSIS_CHECKPOINT = os.getenv('BULK_REANALYSIS_CHECKPOINT', '.cache/bulk_reanalysis.json')
+    BULK_REANALYSIS_POLL_INTERVAL = float(os.getenv('BULK_REANALYSIS_POLL_INTERVAL', 30))
+    
+    # 추측 분석 설정 (정족수 출처가 모이면 나머지 출처를 기다리지 않고 분석 시작)
+    SPECULATIVE_ANALYSIS_ENABLED = os.getenv('SPECULATIVE_ANALYSIS_ENABLED', 'False').lower() == 'true'
+    SPECULATIVE_QUORUM = os.getenv('SPECULATIVE_QUORUM', 'dart,news')
+    SPECULATIVE_RERUN_SIGNAL = float(os.getenv('SPECULATIVE_RERUN_SIGNAL', 3.0))
+    
+    # 컨설턴트 색인 설정 (메모리 색인, updated_at 변경분 조회 간격)
+    CONSULTANT_INDEX_REFRESH_INTERVAL = float(os.getenv('CONSULTANT_INDEX_REFRESH_INTERVAL', 60))
+    
+    # 추천 결과 캐시 설정 (컨설턴트 디렉터리 버전이 바뀌면 전체 무효화)
+    RECOMMENDATION_CACHE_MAX_ENTRIES = int(os.getenv('RECOMMENDATION_CACHE_MAX_ENTRIES', 1000))
+    RECOMMENDATION_CACHE_TTL_SECONDS = float(os.getenv('RECOMMENDATION_CACHE_TTL_SECONDS', 600))
+    
+    # 분석 저장 시 matches 테이블에 기록할 상위 매칭 수 (추천 조회는 이 수 이하일 때 기록 사용)
+    MATCH_STORE_LIMIT = int(os.getenv('MATCH_STORE_LIMIT', 10))
+    
+    # 매칭 점수 계산 위치 (memory: 메모리 색인, database: match_consultants 함수로 상위 결과만 조회)
+    MATCHING_BACKEND = os.getenv('MATCHING_BACKEND', 'memory')
+    
+    # 홈페이지 사전 점검 설정
+    PREFLIGHT_ENABLED = os.getenv('PREFLIGHT_ENABLED', 'True').lower() == 'true'
+    PREFLIGHT_DNS_TIMEOUT = float(os.getenv('PREFLIGHT_DNS_TIMEOUT', 1.0))
+    PREFLIGHT_HTTP_TIMEOUT = float(os.getenv('PREFLIGHT_HTTP_TIMEOUT', 1.5))
+    
     # 서버 설정
     PORT = int(os.getenv('PORT', 8000))
     HOST = os.getenv('HOST', '0.0.0.0')
@@ -37,6 +37,7 @@ def create_tables():
         region VARCHAR(100) NOT NULL,
         years_experience INTEGER DEFAULT 0,
         certifications TEXT[],
+        certification_ids INTEGER[] DEFAULT '{}',
         description TEXT,
         rating DECIMAL(3,2) DEFAULT 0.0,
         status VARCHAR(20) DEFAULT 'pending',
@@ -48,6 +49,39 @@ def create_tables():
     CREATE INDEX IF NOT EXISTS idx_consultants_region ON consultants(region);
     CREATE INDEX IF NOT EXISTS idx_consultants_status ON consultants(status);
     CREATE INDEX IF NOT EXISTS idx_consultants_certifications ON consultants USING GIN(certifications);
+    
+    -- 인증 카탈로그 ID (기존 테이블에도 추가)
+    ALTER TABLE consultants ADD COLUMN IF NOT EXISTS certification_ids INTEGER[] DEFAULT '{}';
+    CREATE INDEX IF NOT EXISTS idx_consultants_certification_ids ON consultants USING GIN(certification_ids);
+    CREATE INDEX IF NOT EXISTS idx_consultants_updated_at ON consultants(updated_at);
+    
+    -- 변경 시 updated_at 갱신 (컨설턴트 색인의 변경분 조회 기준)
+    CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.updated_at = NOW();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    
+    DROP TRIGGER IF EXISTS trg_consultants_updated_at ON consultants;
+    CREATE TRIGGER trg_consultants_updated_at BEFORE UPDATE ON consultants
+        FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+    """ + certification_catalog_sql() + """
+    -- 인증 목록이 바뀌면 카탈로그 ID도 함께 갱신 (관리 화면·SQL로 직접 수정해도 어긋나지 않음)
+    CREATE OR REPLACE FUNCTION sync_certification_ids() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.certification_ids = certification_catalog_ids(NEW.certifications);
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    
+    DROP TRIGGER IF EXISTS trg_consultants_certification_ids ON consultants;
+    CREATE TRIGGER trg_consultants_certification_ids BEFORE INSERT OR UPDATE OF certifications ON consultants
+        FOR EACH ROW EXECUTE FUNCTION sync_certification_ids();
+    
+    -- 열 추가 전에 등록된 컨설턴트 채우기 (이미 맞는 행은 건너뜀)
+    UPDATE consultants SET certification_ids = certification_catalog_ids(certifications)
+    WHERE certification_ids IS DISTINCT FROM certification_catalog_ids(certifications);
     """
     
     # Analyses 테이블
@@ -61,6 +95,7 @@ def create_tables():
         summary TEXT NOT NULL,
         risks TEXT[],
         certifications TEXT[],
+        certification_ids INTEGER[] DEFAULT '{}',
         news_data JSONB,
         dart_data JSONB,
         social_data JSONB,
@@ -77,6 +112,14 @@ def create_tables():
     CREATE INDEX IF NOT EXISTS idx_analyses_created_at ON analyses(created_at);
     CREATE INDEX IF NOT EXISTS idx_analyses_risks ON analyses USING GIN(risks);
     CREATE INDEX IF NOT EXISTS idx_analyses_certifications ON analyses USING GIN(certifications);
+    
+    -- 인증 카탈로그 ID (기존 테이블에도 추가)
+    ALTER TABLE analyses ADD COLUMN IF NOT EXISTS certification_ids INTEGER[] DEFAULT '{}';
+    CREATE INDEX IF NOT EXISTS idx_analyses_certification_ids ON analyses USING GIN(certification_ids);
+    
+    -- 열 추가 전에 저장된 분석 결과 채우기 (새 분석은 저장할 때 계산)
+    UPDATE analyses SET certification_ids = certification_catalog_ids(certifications)
+    WHERE COALESCE(certification_ids, '{}') = '{}' AND COALESCE(certifications, '{}') <> '{}';
     """
     
     # Matches 테이블 (컨설턴트 매칭 기록)
@@ -86,25 +129,198 @@ def create_tables():
         analysis_id INTEGER REFERENCES analyses(id) ON DELETE CASCADE,
         consultant_id INTEGER REFERENCES consultants(id) ON DELETE CASCADE,
         company_id INTEGER REFERENCES companies(id) ON DELETE CASCADE,
-        match_score DECIMAL(3,2) DEFAULT 0.0,
+        match_score DOUBLE PRECISION DEFAULT 0.0,
+        match_rank INTEGER,
+        directory_stamp TIMESTAMP WITH TIME ZONE,
         status VARCHAR(20) DEFAULT 'pending',
         created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
         updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
     );
     
+    -- 분석 저장 시 계산한 상위 매칭 (순위, 계산 당시 컨설턴트 updated_at 최댓값)
+    ALTER TABLE matches ALTER COLUMN match_score TYPE DOUBLE PRECISION;
+    ALTER TABLE matches ADD COLUMN IF NOT EXISTS match_rank INTEGER;
+    ALTER TABLE matches ADD COLUMN IF NOT EXISTS directory_stamp TIMESTAMP WITH TIME ZONE;
+    
+    -- 분석별 순위는 하나만 (매칭 기록 교체는 이 색인 기준 upsert, 예전 교체 경합으로 생긴 중복은 최신 행만 남김)
+    DELETE FROM matches m USING matches d
+    WHERE m.analysis_id = d.analysis_id AND m.match_rank = d.match_rank AND m.id < d.id;
+    DROP INDEX IF EXISTS idx_matches_analysis_rank;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_matches_analysis_rank_key ON matches(analysis_id, match_rank)
+        INCLUDE (consultant_id, match_score, directory_stamp);
+    
     CREATE INDEX IF NOT EXISTS idx_matches_analysis_id ON matches(analysis_id);
     CREATE INDEX IF NOT EXISTS idx_matches_consultant_id ON matches(consultant_id);
     CREATE INDEX IF NOT EXISTS idx_matches_company_id ON matches(company_id);
     CREATE INDEX IF NOT EXISTS idx_matches_status ON matches(status);
     """
     
+    # 컨설턴트 매칭 함수 (MatchingService.score_matrix와 같은 가중치·계산 순서, 상위 p_limit명만 반환)
+    match_consultants_sql = """
+    CREATE OR REPLACE FUNCTION consultant_match_score(
+        p_industry_match BOOLEAN, p_matched INTEGER, p_certification_count INTEGER,
+        p_region_match BOOLEAN, p_years INTEGER
+    ) RETURNS DOUBLE PRECISION LANGUAGE sql IMMUTABLE AS $$
+        SELECT LEAST(
+            (CASE WHEN p_industry_match THEN 1.0 ELSE 0.0 END)::float8 * 0.3::float8 +
+            (p_matched::float8 / GREATEST(p_certification_count, 1)) * 0.4::float8 +
+            (CASE WHEN p_region_match THEN 1.0 ELSE 0.5 END)::float8 * 0.1::float8 +
+            (CASE WHEN COALESCE(p_years, 0) <= 3 THEN 0.6
+                  WHEN p_years <= 7 THEN 0.8
+                  WHEN p_years <= 12 THEN 1.0
+                  ELSE 1.2 END)::float8 * 0.2::float8,
+            1.0::float8
+        )
+    $$;
+    
+    CREATE OR REPLACE FUNCTION match_consultants(
+        p_certification_ids INTEGER[],
+        p_certification_count INTEGER,
+        p_industry TEXT DEFAULT NULL,
+        p_region TEXT DEFAULT NULL,
+        p_limit INTEGER DEFAULT 5,
+        p_min_score DOUBLE PRECISION DEFAULT 0.3
+    ) RETURNS TABLE (
+        id INTEGER, name VARCHAR, email VARCHAR, phone VARCHAR, industry VARCHAR, region VARCHAR,
+        years_experience INTEGER, certifications TEXT[], certification_ids INTEGER[], rating DECIMAL,
+        status VARCHAR, match_score DOUBLE PRECISION, industry_match BOOLEAN, region_match BOOLEAN
+    ) LANGUAGE sql STABLE AS $$
+        WITH candidates AS (
+            -- 인증이 하나 이상 겹치는 컨설턴트 (GIN 색인)
+            SELECT c.*, cardinality(ARRAY(
+                SELECT unnest(c.certification_ids) INTERSECT SELECT unnest(p_certification_ids)
+            )) AS matched
+            FROM consultants c
+            WHERE c.status = 'active' AND c.certification_ids && p_certification_ids
+            UNION ALL
+            -- 겹치는 인증이 없는 컨설턴트는 나머지 점수 상위 p_limit명만
+            (SELECT c.*, 0 AS matched
+             FROM consultants c
+             WHERE c.status = 'active' AND NOT (COALESCE(c.certification_ids, '{}') && p_certification_ids)
+             ORDER BY consultant_match_score(
+                 COALESCE(p_industry, '') = '' OR c.industry = p_industry, 0, p_certification_count,
+                 COALESCE(p_region, '') = '' OR c.region = p_region, c.years_experience
+             ) DESC, c.id
+             LIMIT p_limit)
+        ), scored AS (
+            SELECT c.*,
+                   COALESCE(p_industry, '') = '' OR c.industry = p_industry AS is_industry_match,
+                   COALESCE(p_region, '') = '' OR c.region = p_region AS is_region_match
+            FROM candidates c
+        )
+        SELECT s.id, s.name, s.email, s.phone, s.industry, s.region, s.years_experience, s.certifications,
+               s.certification_ids, s.rating, s.status,
+               consultant_match_score(s.is_industry_match, s.matched, p_certification_count,
+                                      s.is_region_match, s.years_experience) AS match_score,
+               s.is_industry_match, s.is_region_match
+        FROM scored s
+        WHERE consultant_match_score(s.is_industry_match, s.matched, p_certification_count,
+                                     s.is_region_match, s.years_experience) > p_min_score
+        ORDER BY match_score DESC, s.id
+        LIMIT p_limit;
+    $$;
+    
+    -- 기준별 추천 후보 (조건은 모두 일치, 요청 인증과 겹치는 수 내림차순·id 순으로 상위 p_limit명만 반환)
+    -- 조건이 일치하면 기준별 점수는 겹치는 인증 수로만 갈리므로 메모리 색인의 점수순 결과와 같은 상위 목록
+    CREATE OR REPLACE FUNCTION search_consultants(
+        p_certification_ids INTEGER[] DEFAULT '{}',
+        p_industry TEXT DEFAULT NULL,
+        p_region TEXT DEFAULT NULL,
+        p_min_experience INTEGER DEFAULT 0,
+        p_limit INTEGER DEFAULT 100
+    ) RETURNS SETOF consultants LANGUAGE sql STABLE AS $$
+        SELECT c.*
+        FROM consultants c
+        WHERE c.status = 'active'
+          AND (COALESCE(p_industry, '') = '' OR c.industry = p_industry)
+          AND (COALESCE(p_region, '') = '' OR c.region = p_region)
+          AND (COALESCE(p_min_experience, 0) <= 0 OR c.years_experience >= p_min_experience)
+          AND (cardinality(COALESCE(p_certification_ids, '{}')) = 0 OR c.certification_ids && p_certification_ids)
+        ORDER BY cardinality(ARRAY(
+                     SELECT unnest(c.certification_ids) INTERSECT SELECT unnest(p_certification_ids)
+                 )) DESC, c.id
+        LIMIT p_limit;
+    $$;
+    """
+    
     return {
         'companies': companies_sql,
         'consultants': consultants_sql,
         'analyses': analyses_sql,
-        'matches': matches_sql
+        'matches': matches_sql,
+        'match_consultants': match_consultants_sql
     }
 
+def certification_catalog_sql() -> str:
+    """
+    인증 카탈로그 별칭 테이블과 변환 함수 SQL
+    
+    CertificationCatalog.catalog_ids와 같은 규칙(우선순위·설명 제거, 비교용 키, 별칭 일치 → 4글자 이상 별칭 포함)으로
+    인증 목록을 카탈로그 ID로 변환하며, 별칭은 certification_catalog.CERTIFICATIONS에서 생성
+    """
+    from app.services.certification_catalog import certification_catalog
+    
+    aliases = ',\n        '.join(
+        "('{}', {}, {})".format(key.replace("'", "''"), certification_id, order)
+        for order, (key, certification_id) in enumerate(certification_catalog.alias_keys())
+    )
+    return """
+    CREATE TABLE IF NOT EXISTS certification_aliases (
+        alias_key TEXT PRIMARY KEY,
+        certification_id INTEGER NOT NULL,
+        alias_order INTEGER NOT NULL
+    );
+    
+    INSERT INTO certification_aliases (alias_key, certification_id, alias_order) VALUES
+        """ + aliases + r"""
+    ON CONFLICT (alias_key) DO UPDATE
+        SET certification_id = EXCLUDED.certification_id, alias_order = EXCLUDED.alias_order;
+    
+    -- 인증 항목의 비교용 키 (JSON 항목·"ISO 27001 (High): 설명" 형식 지원)
+    CREATE OR REPLACE FUNCTION certification_key(p_label TEXT) RETURNS TEXT AS $$
+    DECLARE
+        item_label TEXT := btrim(COALESCE(p_label, ''));
+        formatted TEXT;
+    BEGIN
+        IF left(item_label, 1) = '{' THEN
+            BEGIN
+                item_label := COALESCE(item_label::jsonb ->> 'item', '');
+            EXCEPTION WHEN others THEN
+                NULL;
+            END;
+        END IF;
+        formatted := substring(item_label FROM '(?i)^(.*?)\s*\((?:High|Medium|Low)\)\s*(?::.*)?$');
+        IF formatted IS NOT NULL THEN
+            item_label := formatted;
+        END IF;
+        item_label := btrim(split_part(item_label, ':', 1));
+        RETURN replace(regexp_replace(upper(item_label), '[][[:space:]_/·.,:()-]+', '', 'g'), 'ISOIEC', 'ISO');
+    END;
+    $$ LANGUAGE plpgsql IMMUTABLE;
+    
+    -- 인증 목록의 카탈로그 ID (순서 유지, 중복 제거, 카탈로그에 없는 인증 제외)
+    CREATE OR REPLACE FUNCTION certification_catalog_ids(p_certifications TEXT[]) RETURNS INTEGER[] AS $$
+        SELECT COALESCE(array_agg(matched.certification_id ORDER BY matched.first_position), '{}')
+        FROM (
+            SELECT found.certification_id, min(items.item_order) AS first_position
+            FROM (
+                SELECT certification_key(item) AS item_key, item_order
+                FROM unnest(p_certifications) WITH ORDINALITY AS listed(item, item_order)
+            ) items
+            CROSS JOIN LATERAL (
+                SELECT a.certification_id
+                FROM certification_aliases a
+                WHERE a.alias_key = items.item_key
+                   OR (char_length(a.alias_key) >= 4 AND strpos(items.item_key, a.alias_key) > 0)
+                ORDER BY a.alias_key = items.item_key DESC, char_length(a.alias_key) DESC, a.alias_order
+                LIMIT 1
+            ) found
+            WHERE items.item_key <> ''
+            GROUP BY found.certification_id
+        ) matched
+    $$ LANGUAGE sql STABLE;
+    """
+
 def get_table_schemas():
     """테이블 스키마 정보 반환"""
     return {
@@ -135,6 +351,7 @@ def get_table_schemas():
                 'region (VARCHAR(100))',
                 'years_experience (INTEGER)',
                 'certifications (TEXT[])',
+                'certification_ids (INTEGER[])',
                 'description (TEXT)',
                 'rating (DECIMAL(3,2))',
                 'status (VARCHAR(20))',
@@ -153,6 +370,7 @@ def get_table_schemas():
                 'summary (TEXT)',
                 'risks (TEXT[])',
                 'certifications (TEXT[])',
+                'certification_ids (INTEGER[])',
                 'news_data (JSONB)',
                 'dart_data (JSONB)',
                 'social_data (JSONB)',
@@ -171,7 +389,9 @@ def get_table_schemas():
                 'analysis_id (INTEGER)',
                 'consultant_id (INTEGER)',
                 'company_id (INTEGER)',
-                'match_score (DECIMAL(3,2))',
+                'match_score (DOUBLE PRECISION)',
+                'match_rank (INTEGER)',
+                'directory_stamp (TIMESTAMP)',
                 'status (VARCHAR(20))',
                 'created_at (TIMESTAMP)',
                 'updated_at (TIMESTAMP)'
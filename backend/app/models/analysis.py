@@ -17,6 +17,7 @@ class Analysis:
     summary: str = ""
     risks: List[str] = None
     certifications: List[str] = None
+    certification_ids: List[int] = None  # 인증 카탈로그 ID
     news_data: List[Dict] = None
     dart_data: List[Dict] = None
     social_data: List[Dict] = None
@@ -32,6 +33,8 @@ class Analysis:
             self.risks = []
         if self.certifications is None:
             self.certifications = []
+        if self.certification_ids is None:
+            self.certification_ids = []
         if self.news_data is None:
             self.news_data = []
         if self.dart_data is None:
@@ -50,6 +53,7 @@ class Analysis:
             'summary': self.summary,
             'risks': self.risks,
             'certifications': self.certifications,
+            'certification_ids': self.certification_ids,
             'news_data': self.news_data,
             'dart_data': self.dart_data,
             'social_data': self.social_data,
@@ -73,6 +77,7 @@ class Analysis:
             summary=data.get('summary', ''),
             risks=data.get('risks', []),
             certifications=data.get('certifications', []),
+            certification_ids=data.get('certification_ids') or [],
             news_data=data.get('news_data', []),
             dart_data=data.get('dart_data', []),
             social_data=data.get('social_data', []),
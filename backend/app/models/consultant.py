@@ -17,6 +17,7 @@ class Consultant:
     region: str = ""
     years_experience: int = 0
     certifications: List[str] = None
+    certification_ids: List[int] = None  # 인증 카탈로그 ID
     description: Optional[str] = None
     rating: float = 0.0
     status: str = "pending"  # pending, active, inactive
@@ -26,6 +27,8 @@ class Consultant:
     def __post_init__(self):
         if self.certifications is None:
             self.certifications = []
+        if self.certification_ids is None:
+            self.certification_ids = []
     
     def to_dict(self) -> Dict:
         """딕셔너리로 변환"""
@@ -38,6 +41,7 @@ class Consultant:
             'region': self.region,
             'years_experience': self.years_experience,
             'certifications': self.certifications,
+            'certification_ids': self.certification_ids,
             'description': self.description,
             'rating': self.rating,
             'status': self.status,
@@ -57,6 +61,7 @@ class Consultant:
             region=data.get('region', ''),
             years_experience=data.get('years_experience', 0),
             certifications=data.get('certifications', []),
+            certification_ids=data.get('certification_ids') or [],
             description=data.get('description'),
             rating=data.get('rating', 0.0),
             status=data.get('status', 'pending'),
@@ -2,10 +2,16 @@
 InsightMatch2 API Routes
 """
 
-from flask import Blueprint, request, jsonify
+import json
+import queue
+import threading
+from flask import Blueprint, Response, request, jsonify
 from app.services.analyzer import CompanyAnalyzer
 from app.services.consultant_service import ConsultantService
 from app.services.recommendation_service import RecommendationService
+from app.services.metrics import metrics
+from app.services.preflight import PreflightChecker
+from app.config import Config
 from app.middleware.response_formatter import ResponseFormatter
 from app.api.validators import APIValidators
 from app.api.documentation import get_api_docs
@@ -17,6 +23,7 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 analyzer = CompanyAnalyzer()
 consultant_service = ConsultantService()
 recommendation_service = RecommendationService()
+preflight_checker = PreflightChecker()
 
 @api_bp.route('/health', methods=['GET'])
 def health_check():
@@ -41,8 +48,13 @@ def analyze_company():
         if validation_error:
             return validation_error
         
+        # 홈페이지 사전 점검 (도메인이 없으면 거부, 접속 불가면 웹사이트 수집 생략)
+        preflight, preflight_error = _run_preflight(data['homepage'])
+        if preflight_error:
+            return preflight_error
+        
         # 기업 분석 실행
-        result = analyzer.analyze(data['homepage'], data['email'])
+        result = analyzer.analyze(data['homepage'], data['email'], preflight)
         
         return ResponseFormatter.success(
             data=result,
@@ -56,6 +68,69 @@ def analyze_company():
             status_code=500
         )
 
+@api_bp.route('/analyze/stream', methods=['POST'])
+def analyze_company_stream():
+    """기업 분석 스트리밍 API (Server-Sent Events)"""
+    try:
+        data = request.get_json()
+        
+        # 유효성 검사
+        validation_error = APIValidators.validate_analyze_request(data)
+        if validation_error:
+            return validation_error
+        
+        preflight, preflight_error = _run_preflight(data['homepage'])
+        if preflight_error:
+            return preflight_error
+        
+        # 분석은 별도 스레드에서 실행하고 이벤트를 큐로 전달
+        events = queue.Queue()
+        
+        def run_analysis():
+            try:
+                result = analyzer.analyze(data['homepage'], data['email'], preflight,
+                                          on_event=lambda event, payload: events.put((event, payload)))
+                events.put(('result', result))
+            except Exception as e:
+                events.put(('error', {'error': f'분석 중 오류가 발생했습니다: {str(e)}', 'error_code': 'ANALYSIS_ERROR'}))
+            finally:
+                events.put(None)
+        
+        threading.Thread(target=run_analysis, daemon=True).start()
+        
+        def generate():
+            while True:
+                item = events.get()
+                if item is None:
+                    break
+                event, payload = item
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+        
+        return Response(generate(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        
+    except Exception as e:
+        return ResponseFormatter.error(
+            message=f'분석 중 오류가 발생했습니다: {str(e)}',
+            error_code="ANALYSIS_ERROR",
+            status_code=500
+        )
+
+def _run_preflight(homepage):
+    """홈페이지 사전 점검 (도메인 조회 실패 시 422 응답 반환)"""
+    if not Config.PREFLIGHT_ENABLED:
+        return None, None
+    
+    preflight = preflight_checker.check(homepage)
+    if not preflight.resolvable:
+        return preflight, ResponseFormatter.error(
+            message=f"홈페이지에 접속할 수 없습니다: {preflight.reason}",
+            error_code="UNREACHABLE_HOMEPAGE",
+            status_code=422,
+            details=preflight.to_dict()
+        )
+    return preflight, None
+
 @api_bp.route('/consultants', methods=['GET'])
 def get_consultants():
     """컨설턴트 목록 조회 API"""
@@ -182,6 +257,21 @@ def get_recommendations_by_criteria():
                 status_code=500
             )
 
+@api_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """서비스 지표 조회 API"""
+    try:
+        return ResponseFormatter.success(
+            data=metrics.snapshot(),
+            message="서비스 지표를 성공적으로 조회했습니다."
+        )
+    except Exception as e:
+        return ResponseFormatter.error(
+            message=f'지표 조회 중 오류가 발생했습니다: {str(e)}',
+            error_code="METRICS_ERROR",
+            status_code=500
+        )
+
 @api_bp.route('/docs', methods=['GET'])
 def get_api_documentation():
     """API 문서 조회"""
@@ -3,30 +3,81 @@ AI 분석 서비스
 OpenAI GPT-4o-mini를 활용한 기업 리스크 분석
 """
 
-import os
 import json
-from typing import Dict, List, Optional
-from openai import OpenAI
+import time
+import concurrent.futures
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .llm_client import LLMClient
+from .llm_providers import LLMRouter, Route
+from .json_stream import IncrementalJSONParser
+from .metrics import metrics
+from .llm_cache import LLMResponseCache
+from .prompt_assembler import PromptAssembler, PromptSection
+from .prompt_templates import PromptTemplates
+from app.config import Config
+
+FieldCallback = Callable[[str, Any], None]
+
+# 출처별 요약(맵) 호출용 스레드 풀 (동시 호출 수는 LLMClient 세마포어가 제한)
+_map_executor = concurrent.futures.ThreadPoolExecutor(max_workers=12, thread_name_prefix='llm-map')
 
 class AIAnalyzer:
     """AI 분석 서비스 클래스"""
     
+    # 스트리밍 시 요약이 먼저 완성되도록 summary를 첫 필드로 고정
+    RESPONSE_FIELDS = ('summary', 'risks', 'certifications', 'confidence_score')
+    ANALYSIS_ITEM_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "item": {"type": "string"},
+            "priority": {"type": "string", "enum": ["High", "Medium", "Low"]},
+            "description": {"type": "string"}
+        },
+        "required": ["item", "priority", "description"],
+        "additionalProperties": False
+    }
+    RESPONSE_FORMAT = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "company_risk_analysis",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "summary": {"type": "string"},
+                    "risks": {"type": "array", "items": ANALYSIS_ITEM_SCHEMA},
+                    "certifications": {"type": "array", "items": ANALYSIS_ITEM_SCHEMA},
+                    "confidence_score": {"type": "number"}
+                },
+                "required": list(RESPONSE_FIELDS),
+                "additionalProperties": False
+            }
+        }
+    }
+    
     def __init__(self):
-        self.client = None
-        self.api_key = os.getenv('OPENAI_API_KEY')
+        # 기본 공급자·모델 (작업별 라우팅 규칙이 없으면 모든 호출에 사용)
+        self.router = LLMRouter.from_config()
+        self.api_key = self.router.default.provider.api_key
+        self.model = self.router.default.model
+        self.client = self.router.client(self.router.default.provider)
+        self.response_cache = LLMResponseCache()
+        self.prompt_assembler = PromptAssembler(Config.LLM_PROMPT_TOKEN_BUDGET)
+        self.digest_assembler = PromptAssembler(Config.LLM_DIGEST_TOKEN_BUDGET, self.prompt_assembler.counter)
+        self.analysis_mode = Config.AI_ANALYSIS_MODE
         
-        if self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
-            print("✅ OpenAI GPT-4o-mini 클라이언트 초기화 완료")
+        if self.client:
+            print(f"✅ LLM 클라이언트 초기화 완료 ({self.router.default.provider.name}/{self.model})")
         else:
             print("⚠️ OpenAI API 키가 없습니다. 샘플 분석을 사용합니다.")
     
-    def analyze_company_risks(self, public_data: Dict) -> Dict:
+    def analyze_company_risks(self, public_data: Dict, deadline: Optional[float] = None) -> Dict:
         """
         기업 리스크 AI 분석
         
         Args:
             public_data: 수집된 공개정보
+            deadline: 분석 마감 시각 (time.monotonic 기준, 선택사항)
             
         Returns:
             Dict: AI 분석 결과
@@ -35,153 +86,360 @@ class AIAnalyzer:
             if not self.client:
                 return self._get_sample_analysis(public_data)
             
-            # 프롬프트 생성
-            prompt = self._build_analysis_prompt(public_data)
+            messages, params, _ = self._build_request(public_data, deadline)
             
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 기업 리스크 분석 전문가입니다. 주어진 공개정보를 바탕으로 기업의 리스크를 분석하고 필요한 인증을 추천해주세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=2000
-            )
+            # OpenAI API 호출 (동일한 입력이면 캐시된 응답 사용)
+            ai_response, route = self._complete_text(messages, params, deadline)
             
-            # 응답 파싱
-            ai_response = response.choices[0].message.content.strip()
-            analysis_result = self._parse_ai_response(ai_response, public_data)
+            # 응답 파싱 (라우팅된 공급자·모델을 분석 방법으로 기록)
+            analysis_result = self._parse_ai_response(ai_response, public_data, route)
             
             return analysis_result
             
         except Exception as e:
             print(f"❌ AI 분석 중 오류: {str(e)}")
-            return self._get_sample_analysis(public_data)
+            return self._get_sample_analysis(public_data, f'AI 호출 실패: {type(e).__name__}')
     
-    def _build_analysis_prompt(self, public_data: Dict) -> str:
-        """분석 프롬프트 생성"""
+    def analyze_company_risks_stream(self, public_data: Dict, on_field: FieldCallback,
+                                     deadline: Optional[float] = None) -> Dict:
+        """
+        기업 리스크 AI 분석 (스트리밍, 완성된 필드부터 콜백 호출)
+        
+        Args:
+            public_data: 수집된 공개정보
+            on_field: 필드 완성 시 호출할 콜백 (필드명, 값)
+            deadline: 분석 마감 시각 (time.monotonic 기준, 선택사항)
+            
+        Returns:
+            Dict: AI 분석 결과
+        """
+        try:
+            if not self.client:
+                return self._emit_fields(self._get_sample_analysis(public_data), on_field)
+            
+            messages, params, prompt_report = self._build_request(public_data, deadline)
+            
+            client, route = self._route('analysis', messages)
+            model = route.model
+            cache_key = self.response_cache.fingerprint(model, messages, params)
+            cached = self._cached_response(cache_key)
+            if cached:
+                print("♻️ 캐시된 AI 분석 응답 사용")
+                return self._emit_fields(self._parse_ai_response(cached['content'], public_data, route), on_field)
+            
+            started = time.monotonic()
+            parser = IncrementalJSONParser()
+            chunks = []
+            for text in client.stream(deadline=deadline, model=model, messages=messages, **params):
+                chunks.append(text)
+                for key, value in parser.feed(text):
+                    if len(parser.fields) == 1:
+                        metrics.observe('llm.time_to_first_field_ms', (time.monotonic() - started) * 1000)
+                    on_field(key, value)
+            metrics.observe('llm.stream_total_ms', (time.monotonic() - started) * 1000)
+            
+            ai_response = ''.join(chunks).strip()
+            # 스트리밍 응답에는 사용량이 없으므로 토큰 수를 직접 계산
+            total_tokens = prompt_report['total'] + self.prompt_assembler.counter.count(ai_response)
+            # 잘리거나 JSON이 아닌 응답은 캐시하지 않고 다음 요청에서 다시 호출
+            if self._load_json(ai_response) is not None:
+                self.response_cache.set(cache_key, model, ai_response, total_tokens)
+            
+            analysis_result = self._parse_ai_response(ai_response, public_data, route)
+            # 스트림 중 완성되지 못한 필드는 최종 결과로 보냄
+            for key in self.RESPONSE_FIELDS:
+                if key not in parser.fields:
+                    on_field(key, analysis_result.get(key))
+            return analysis_result
+            
+        except Exception as e:
+            print(f"❌ AI 스트리밍 분석 중 오류: {str(e)}")
+            return self._emit_fields(
+                self._get_sample_analysis(public_data, f'AI 호출 실패: {type(e).__name__}'), on_field
+            )
+    
+    def _route(self, task: str, messages: List[Dict]) -> Tuple[LLMClient, Route]:
+        """작업과 입력 토큰 수에 맞는 클라이언트와 실제 사용할 공급자·모델 (라우팅된 공급자의 API 키가 없으면 기본값)"""
+        default = Route(self.router.default.provider, self.model)
+        if not self.router.rules:
+            return self.client, default
+        
+        prompt_tokens = sum(self.prompt_assembler.counter.count(message['content']) for message in messages)
+        route = self.router.route(task, prompt_tokens)
+        if route.provider is self.router.default.provider:
+            return self.client, route
+        client = self.router.client(route.provider)
+        if not client:
+            return self.client, default
+        return client, route
+    
+    def _complete_text(self, messages: List[Dict], params: Dict, deadline: Optional[float] = None,
+                       task: str = 'analysis') -> Tuple[str, Route]:
+        """LLM 응답 텍스트와 사용한 공급자·모델 (동일한 입력이면 캐시된 응답 사용, 429/5xx는 마감 시각 안에서 재시도)"""
+        client, route = self._route(task, messages)
+        model = route.model
+        cache_key = self.response_cache.fingerprint(model, messages, params)
+        cached = self._cached_response(cache_key)
+        if cached:
+            print("♻️ 캐시된 AI 응답 사용")
+            return cached['content'], route
+        
+        response = client.complete(
+            deadline=deadline,
+            model=model,
+            messages=messages,
+            **params
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        total_tokens = response.usage.total_tokens if response.usage else 0
+        # 잘리거나 JSON이 아닌 응답은 캐시하지 않고 다음 요청에서 다시 호출
+        if self._load_json(ai_response) is not None:
+            self.response_cache.set(cache_key, model, ai_response, total_tokens)
+        return ai_response, route
+    
+    def _cached_response(self, cache_key: str) -> Optional[Dict]:
+        """캐시된 응답 (JSON으로 읽을 수 없는 항목은 삭제하고 None)"""
+        cached = self.response_cache.get(cache_key)
+        if cached and self._load_json(cached['content']) is None:
+            print("⚠️ 캐시된 AI 응답을 읽을 수 없어 삭제 후 다시 호출")
+            self.response_cache.delete(cache_key)
+            metrics.increment('llm_cache.invalid')
+            return None
+        return cached
+    
+    @staticmethod
+    def _load_json(ai_response: str) -> Optional[Dict]:
+        """응답에서 JSON 객체 추출 (없거나 잘렸으면 None)"""
+        json_start = ai_response.find('{')
+        json_end = ai_response.rfind('}') + 1
+        if json_start == -1 or json_end == 0:
+            return None
+        try:
+            parsed = json.loads(ai_response[json_start:json_end])
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+    
+    def _build_request(self, public_data: Dict, deadline: Optional[float] = None) -> Tuple[List[Dict], Dict, Dict]:
+        """
+        채팅 메시지와 생성 파라미터, 프롬프트 토큰 보고서 구성 (map_reduce 모드는 출처별 요약을 먼저 실행)
+        
+        분석기는 요청 스레드가 함께 쓰는 전역 객체이므로 보고서는 호출마다 반환값으로 전달
+        """
+        if self.analysis_mode == 'map_reduce':
+            prompt, report = self._build_reduce_prompt(public_data, deadline)
+        else:
+            prompt, report = self._build_analysis_prompt(public_data)
+        messages, params = self._wrap_prompt(prompt)
+        return messages, params, report
+    
+    def build_chat_request(self, public_data: Dict) -> Dict:
+        """
+        단일 프롬프트 요청 본문 (일괄 재분석용, chat.completions.create 인자와 같은 형식)
+        
+        일괄 처리는 호출 결과를 기다릴 수 없으므로 map_reduce 모드에서도 단일 프롬프트 사용
+        """
+        messages, params = self._wrap_prompt(self._build_analysis_prompt(public_data)[0])
+        return {'model': self._route('batch', messages)[1].model, 'messages': messages, **params}
+    
+    def _wrap_prompt(self, prompt: str) -> Tuple[List[Dict], Dict]:
+        """분석 프롬프트를 채팅 메시지와 생성 파라미터로 구성"""
+        messages = [
+            {
+                "role": "system",
+                "content": "당신은 기업 리스크 분석 전문가입니다. 주어진 공개정보를 바탕으로 기업의 리스크를 분석하고 필요한 인증을 추천해주세요."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        params = {"temperature": 0.3, "max_tokens": 2000, "response_format": self.RESPONSE_FORMAT}
+        return messages, params
+    
+    def _build_reduce_prompt(self, public_data: Dict, deadline: Optional[float] = None) -> Tuple[str, Dict]:
+        """
+        출처별 요약(맵)을 병렬 실행한 뒤 통합(리듀스) 프롬프트 생성
+        
+        소요 시간은 전체 토큰 수가 아니라 가장 느린 요약 호출에 맞춰짐
+        """
+        company = public_data.get('company', 'Unknown')
+        started = time.monotonic()
+        
+        map_prompts = {}
+        news_items = [f"- {news.get('title', '')}: {news.get('snippet', '')}" for news in public_data.get('news', [])]
+        if news_items:
+            map_prompts['뉴스 리스크 요약'] = PromptTemplates.get_news_digest_prompt(
+                company, self._assemble_digest_input('news', news_items, 120)
+            )
+        dart_items = [f"- {dart.get('title', '')} ({dart.get('type', '')}): {dart.get('snippet', '')}"
+                      for dart in public_data.get('dart', [])]
+        if dart_items:
+            map_prompts['공시 리스크 요약'] = PromptTemplates.get_filing_digest_prompt(
+                company, self._assemble_digest_input('dart', dart_items, 80)
+            )
+        website = public_data.get('website') or {}
+        if website:
+            website_items = [
+                f"- 제목: {website.get('title', 'N/A')}",
+                f"- 설명: {website.get('description', 'N/A')}",
+                f"- 키워드: {', '.join(website.get('keywords', [])[:20])}",
+                f"- 회사 정보: {json.dumps(website.get('company_info', {}), ensure_ascii=False)}"
+            ]
+            if website.get('content_excerpt'):
+                website_items.append(f"- 본문 발췌: {website['content_excerpt']}")
+            map_prompts['웹사이트 컴플라이언스 요약'] = PromptTemplates.get_website_digest_prompt(
+                company, self._assemble_digest_input('website', website_items, None)
+            )
+        
+        digests = {name: '자료 없음' for name in ('뉴스 리스크 요약', '공시 리스크 요약', '웹사이트 컴플라이언스 요약')}
+        if map_prompts:
+            futures = {
+                name: _map_executor.submit(self._run_digest, name, prompt, deadline)
+                for name, prompt in map_prompts.items()
+            }
+            for name, future in futures.items():
+                digests[name] = future.result()
+            if all(digests[name] is None for name in map_prompts):
+                raise RuntimeError('출처별 요약 호출이 모두 실패했습니다.')
+            digests = {name: digest or '요약 실패' for name, digest in digests.items()}
+        
+        metrics.observe('llm.map_reduce.map_wall_ms', (time.monotonic() - started) * 1000)
+        prompt = PromptTemplates.get_reduce_prompt(company, digests)
+        
+        # 통합 프롬프트는 예산 조립을 거치지 않으므로 전체를 고정 토큰으로 기록
+        total = self.prompt_assembler.counter.count(prompt)
+        report = {
+            'budget': self.prompt_assembler.budget,
+            'method': self.prompt_assembler.counter.method,
+            'fixed': total,
+            'sections': {},
+            'dropped': {},
+            'total': total
+        }
+        return prompt, report
+    
+    def _run_digest(self, name: str, prompt: str, deadline: Optional[float]) -> Optional[str]:
+        """출처별 요약 호출 1건 (실패 시 None)"""
+        started = time.monotonic()
+        messages = [
+            {"role": "system", "content": "당신은 기업 공개정보에서 리스크 신호를 추리는 분석가입니다. 간결한 JSON으로만 답하세요."},
+            {"role": "user", "content": prompt}
+        ]
+        params = {"temperature": 0.2, "max_tokens": 400, "response_format": {"type": "json_object"}}
+        try:
+            return self._complete_text(messages, params, deadline, task='digest')[0]
+        except Exception as e:
+            print(f"⚠️ {name} 실패: {str(e)}")
+            metrics.increment('llm.map_reduce.map_failures')
+            return None
+        finally:
+            metrics.observe('llm.map_reduce.map_ms', (time.monotonic() - started) * 1000)
+    
+    def _assemble_digest_input(self, name: str, items: List[str], max_item_tokens: Optional[int]) -> str:
+        """출처별 요약 입력을 요약 토큰 예산 안에서 구성"""
+        section = PromptSection(name, name, items, max_item_tokens=max_item_tokens)
+        text, _ = self.digest_assembler.assemble('', [section], '')
+        # 구역 제목 줄은 템플릿에 이미 설명되어 있으므로 제외
+        return text.strip().split('\n', 1)[-1]
+    
+    def _emit_fields(self, analysis_result: Dict, on_field: FieldCallback) -> Dict:
+        """분석 결과 필드를 순서대로 콜백 전달"""
+        for key in self.RESPONSE_FIELDS:
+            on_field(key, analysis_result.get(key))
+        return analysis_result
+    
+    def _build_analysis_prompt(self, public_data: Dict) -> Tuple[str, Dict]:
+        """
+        분석 프롬프트 생성 (토큰 예산 안에서 공시 → 뉴스 → 웹사이트 순으로 채움, 공시·뉴스는 구역 상한 적용)
+        
+        고정 지시문과 응답 형식을 앞에, 기업별 자료를 뒤에 두어 제공자 프롬프트 캐시가 앞부분을 재사용하게 함
+        (고정 지시문은 자료 예산에서 제외하고, 캐시 최소 길이에 못 미치면 보고서에 표시)
+        """
         company = public_data.get('company', 'Unknown')
-        news_count = len(public_data.get('news', []))
-        dart_count = len(public_data.get('dart', []))
-        social_count = len(public_data.get('social', []))
         website = public_data.get('website', {})
         
+        company_items = [
+            f"회사명: {company}",
+            f"뉴스 건수: {len(public_data.get('news', []))}건",
+            f"DART 공시 건수: {len(public_data.get('dart', []))}건",
+            f"소셜 미디어 건수: {len(public_data.get('social', []))}건"
+        ]
+        
         # 뉴스 요약
-        news_summary = []
-        for news in public_data.get('news', [])[:5]:  # 최대 5개
-            news_summary.append(f"- {news.get('title', '')}: {news.get('snippet', '')[:100]}...")
+        news_items = [
+            f"- {news.get('title', '')}: {news.get('snippet', '')}"
+            for news in public_data.get('news', [])
+        ]
         
         # DART 공시 요약
-        dart_summary = []
-        for dart in public_data.get('dart', [])[:5]:  # 최대 5개
-            dart_summary.append(f"- {dart.get('title', '')}: {dart.get('snippet', '')}")
+        dart_items = [
+            f"- {dart.get('title', '')}: {dart.get('snippet', '')}"
+            for dart in public_data.get('dart', [])
+        ]
         
-        # 웹사이트 정보
-        website_info = ""
+        # 웹사이트 정보 (본문 발췌는 남은 예산만큼만)
+        website_items = []
         if website:
-            website_info = f"""
-웹사이트 정보:
-- 제목: {website.get('title', 'N/A')}
-- 설명: {website.get('description', 'N/A')}
-- 키워드: {', '.join(website.get('keywords', [])[:10])}
-- 회사 정보: {json.dumps(website.get('company_info', {}), ensure_ascii=False)}
-"""
+            website_items = [
+                f"- 제목: {website.get('title', 'N/A')}",
+                f"- 설명: {website.get('description', 'N/A')}",
+                f"- 키워드: {', '.join(website.get('keywords', [])[:10])}",
+                f"- 회사 정보: {json.dumps(website.get('company_info', {}), ensure_ascii=False)}"
+            ]
+            if website.get('content_excerpt'):
+                website_items.append(f"- 본문 발췌: {website['content_excerpt']}")
         
-        prompt = f"""
-다음은 {company} 기업의 공개정보 분석 요청입니다.
-
-=== 기업 정보 ===
-회사명: {company}
-뉴스 건수: {news_count}건
-DART 공시 건수: {dart_count}건
-소셜 미디어 건수: {social_count}건
-
-=== 뉴스 요약 ===
-{chr(10).join(news_summary) if news_summary else "뉴스 정보 없음"}
-
-=== DART 공시 요약 ===
-{chr(10).join(dart_summary) if dart_summary else "공시 정보 없음"}
-
-=== 웹사이트 정보 ===
-{website_info if website_info else "웹사이트 정보 없음"}
-
-=== 분석 요청 ===
-위 공개정보를 바탕으로 다음을 분석해주세요:
-
-1. **핵심 요약** (3문장 이내)
-   - 기업의 현재 상황과 주요 특징
-
-2. **리스크 분석** (5개 항목)
-   - 정보보안 관련 리스크
-   - 품질관리 관련 리스크
-   - 환경경영 관련 리스크
-   - 규제준수 관련 리스크
-   - 기타 경영 리스크
-
-3. **권장 인증** (5개 항목)
-   - ISO 27001 (정보보안)
-   - ISO 9001 (품질관리)
-   - ISO 14001 (환경경영)
-   - ISO 27701 (개인정보보호)
-   - 기타 관련 인증
-
-4. **우선순위** (각 항목별)
-   - 리스크 우선순위 (High/Medium/Low)
-   - 인증 우선순위 (High/Medium/Low)
-
-응답은 다음 JSON 형식으로 해주세요:
-{{
-    "summary": "핵심 요약",
-    "risks": [
-        {{"item": "리스크 항목", "priority": "High/Medium/Low", "description": "상세 설명"}}
-    ],
-    "certifications": [
-        {{"item": "인증 항목", "priority": "High/Medium/Low", "description": "상세 설명"}}
-    ],
-    "confidence_score": 0.85
-}}
-"""
+        sections = [
+            PromptSection('company', '기업 정보', company_items, priority=0),
+            PromptSection('news', '뉴스 요약', news_items, priority=2, max_item_tokens=120,
+                          max_tokens=int(self.prompt_assembler.budget * 0.45), empty_text='뉴스 정보 없음'),
+            PromptSection('dart', 'DART 공시 요약', dart_items, priority=1, max_item_tokens=80,
+                          max_tokens=int(self.prompt_assembler.budget * 0.25), empty_text='공시 정보 없음'),
+            PromptSection('website', '웹사이트 정보', website_items, priority=3, empty_text='웹사이트 정보 없음')
+        ]
+        
+        prompt, report = self.prompt_assembler.assemble('', sections, '', prefix=PromptTemplates.ANALYSIS_INSTRUCTIONS)
+        report['prefix_cacheable'] = report['prefix'] >= PromptTemplates.PROMPT_CACHE_MIN_TOKENS
+        print(f"🧮 프롬프트 {report['total']}토큰 (고정 지시문 {report['prefix']}"
+              f"{'' if report['prefix_cacheable'] else ', 캐시 최소 길이 미만'}, 자료 예산 {report['budget']}, {report['sections']})")
         
-        return prompt
+        return prompt, report
     
-    def _parse_ai_response(self, ai_response: str, public_data: Dict) -> Dict:
-        """AI 응답 파싱"""
+    def _parse_ai_response(self, ai_response: str, public_data: Dict, route: Optional[Route] = None) -> Dict:
+        """AI 응답 파싱 (route: 응답을 만든 공급자·모델, 생략하면 기본값)"""
+        method = self._analysis_method(route)
         try:
             # JSON 부분 추출
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
+            parsed = self._load_json(ai_response)
             
-            if json_start != -1 and json_end != -1:
-                json_str = ai_response[json_start:json_end]
-                parsed = json.loads(json_str)
-                
+            if parsed is not None:
                 # 기본 구조 보장
                 result = {
                     'summary': parsed.get('summary', '분석 결과를 생성할 수 없습니다.'),
                     'risks': parsed.get('risks', []),
                     'certifications': parsed.get('certifications', []),
                     'confidence_score': parsed.get('confidence_score', 0.8),
-                    'analysis_method': 'AI (GPT-4o-mini)',
+                    'analysis_method': method,
                     'analysis_date': self._get_current_date()
                 }
                 
                 return result
             else:
                 # JSON 파싱 실패 시 텍스트에서 추출
-                return self._extract_from_text(ai_response, public_data)
+                return self._extract_from_text(ai_response, public_data, method)
                 
         except Exception as e:
             print(f"⚠️ AI 응답 파싱 실패: {str(e)}")
-            return self._extract_from_text(ai_response, public_data)
+            return self._extract_from_text(ai_response, public_data, method)
+    
+    def _analysis_method(self, route: Optional[Route] = None) -> str:
+        """분석 방법 표기 (예: AI (openai/gpt-4o-mini))"""
+        route = route or Route(self.router.default.provider, self.model)
+        return f'AI ({route.provider.name}/{route.model})'
     
-    def _extract_from_text(self, text: str, public_data: Dict) -> Dict:
+    def _extract_from_text(self, text: str, public_data: Dict, method: Optional[str] = None) -> Dict:
         """텍스트에서 정보 추출"""
         # 기본 분석 결과 생성
         company = public_data.get('company', 'Unknown')
@@ -203,11 +461,11 @@ DART 공시 건수: {dart_count}건
                 {'item': 'GDPR 컴플라이언스', 'priority': 'Medium', 'description': 'EU 개인정보보호 규정 준수'}
             ],
             'confidence_score': 0.7,
-            'analysis_method': 'AI (GPT-4o-mini) - 텍스트 추출',
+            'analysis_method': f'{method or self._analysis_method()} - 텍스트 추출',
             'analysis_date': self._get_current_date()
         }
     
-    def _get_sample_analysis(self, public_data: Dict) -> Dict:
+    def _get_sample_analysis(self, public_data: Dict, reason: str = 'API 키 없음') -> Dict:
         """샘플 분석 결과 생성"""
         company = public_data.get('company', 'Unknown')
         
@@ -228,7 +486,7 @@ DART 공시 건수: {dart_count}건
                 {'item': 'GDPR 컴플라이언스', 'priority': 'Medium', 'description': 'EU 개인정보보호 규정 준수로 글로벌 진출 대비'}
             ],
             'confidence_score': 0.85,
-            'analysis_method': 'Sample Analysis (API 키 없음)',
+            'analysis_method': f'Sample Analysis ({reason})',
             'analysis_date': self._get_current_date()
         }
     
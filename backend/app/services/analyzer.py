@@ -3,15 +3,25 @@
 """
 
 import re
+import time
+import concurrent.futures
 from urllib.parse import urlparse
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from .crawler import CrawlerService
 from .ai_analyzer import AIAnalyzer
+from .rule_analyzer import RuleBasedAnalyzer
 from .database_service import DatabaseService
 from .recommendation_service import RecommendationService
+from .certification_catalog import certification_catalog
+from .preflight import PreflightResult
+from .metrics import metrics
+from app.config import Config
 from app.models.company import Company
 from app.models.analysis import Analysis
 
+# 추측 분석 실행용 스레드 풀
+_speculation_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='speculative-analysis')
+
 class CompanyAnalyzer:
     """기업 분석 서비스 클래스"""
     
@@ -19,31 +29,56 @@ class CompanyAnalyzer:
         self.analyzer_name = "InsightMatch2 Analyzer"
         self.crawler = CrawlerService()
         self.ai_analyzer = AIAnalyzer()
+        self.rule_analyzer = RuleBasedAnalyzer()
         self.db_service = DatabaseService()
         self.recommendation_service = RecommendationService()
     
-    def analyze(self, homepage: str, email: str) -> Dict:
+    def analyze(self, homepage: str, email: str, preflight: Optional[PreflightResult] = None,
+                on_event: Optional[Callable[[str, Dict], None]] = None) -> Dict:
         """
         기업 분석 실행
         
         Args:
             homepage: 기업 홈페이지 URL
             email: 사용자 이메일
+            preflight: 홈페이지 사전 점검 결과 (선택사항)
+            on_event: 진행 상황 콜백 (이벤트명, 내용), 지정하면 AI 분석을 스트리밍으로 실행
             
         Returns:
             Dict: 분석 결과
         """
         try:
+            # 분석 마감 시각
+            deadline = time.monotonic() + Config.ANALYSIS_DEADLINE_SECONDS
+            
             # 기업명 추출
             company_name = self.extract_company_name(homepage)
             
             # 공개정보 수집
             print(f"🔍 {company_name} 공개정보 수집 시작...")
-            public_data = self.crawler.crawl_public_data(homepage, company_name)
+            if on_event:
+                on_event('stage', {'stage': 'crawling', 'company': company_name})
+            ai_analysis = None
+            if preflight and not preflight.reachable:
+                # 접속 불가 홈페이지는 재시도 없이 웹사이트 수집 생략
+                print(f"⚠️ 홈페이지 접속 불가, 웹사이트 수집 생략: {preflight.reason}")
+                public_data = self.crawler.crawl_public_data(homepage, company_name, deadline, skip_website=True)
+            else:
+                # 리다이렉트를 따라간 최종 URL로 수집
+                crawl_url = preflight.canonical_url if preflight else homepage
+                if Config.SPECULATIVE_ANALYSIS_ENABLED and not on_event:
+                    public_data, ai_analysis = self._speculative_analysis(company_name, crawl_url, deadline)
+                else:
+                    public_data = self.crawler.crawl_public_data(crawl_url, company_name, deadline)
             
-            # AI 분석 실행
-            print(f"🤖 {company_name} AI 분석 시작...")
-            ai_analysis = self.ai_analyzer.analyze_company_risks(public_data)
+            # 실데이터가 부족하면 LLM 호출과 DB 저장 없이 간이 분석만 반환
+            real_share = public_data.get('provenance', {}).get('real_share', 1.0)
+            degraded = real_share < Config.MIN_REAL_DATA_SHARE
+            if degraded:
+                ai_analysis = self._degraded_analysis(company_name, public_data, real_share, on_event)
+            elif ai_analysis is None:
+                # 리스크 분석 실행 (규칙 기반 → AI)
+                ai_analysis = self._run_analysis(company_name, public_data, deadline, on_event)
             
             # 분석 결과 통합
             result = {
@@ -60,9 +95,18 @@ class CompanyAnalyzer:
                 'analysis_date': ai_analysis.get('analysis_date', self._get_current_date()),
                 'confidence_score': ai_analysis.get('confidence_score', 0.85),
                 'analysis_method': ai_analysis.get('analysis_method', 'Unknown'),
-                'crawl_status': public_data.get('status', 'unknown')
+                'crawl_status': public_data.get('status', 'unknown'),
+                'preflight': preflight.to_dict() if preflight else None,
+                'data_provenance': public_data.get('provenance', {}),
+                'degraded': degraded
             }
             
+            if degraded:
+                print(f"⏭️ {company_name} 실데이터 부족으로 DB 저장 생략")
+                result['recommendations'] = []
+                result['recommendation_summary'] = {}
+                return result
+            
             # 데이터베이스에 저장
             saved_analysis = self._save_analysis_to_db(company_name, homepage, email, result, public_data, ai_analysis)
             
@@ -82,6 +126,149 @@ class CompanyAnalyzer:
         except Exception as e:
             raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
     
+    def _run_analysis(self, company_name: str, public_data: Dict, deadline: float,
+                      on_event: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """리스크 분석 실행 (규칙 기반 분석 신뢰도가 기준 이상이면 LLM 호출 생략)"""
+        started = time.perf_counter()
+        metrics.increment('analysis.requests')
+        
+        if on_event:
+            on_event('stage', {'stage': 'analyzing', 'company': company_name})
+        
+        # Tier 0: 규칙 기반 분석
+        if Config.RULE_ANALYZER_ENABLED:
+            rule_analysis = self.rule_analyzer.analyze(public_data)
+            if rule_analysis['confidence_score'] >= Config.RULE_ANALYZER_THRESHOLD:
+                print(f"⚡ {company_name} 규칙 기반 분석 사용 (신뢰도 {rule_analysis['confidence_score']})")
+                metrics.increment('analysis.tier0_served')
+                self._record_tier0_share()
+                self._emit_fields(rule_analysis, on_event)
+                return rule_analysis
+        
+        # AI 분석 실행
+        print(f"🤖 {company_name} AI 분석 시작...")
+        if on_event:
+            ai_analysis = self.ai_analyzer.analyze_company_risks_stream(
+                public_data,
+                lambda name, value: on_event('field', {'name': name, 'value': self._format_field(name, value)}),
+                deadline
+            )
+        else:
+            ai_analysis = self.ai_analyzer.analyze_company_risks(public_data, deadline)
+        
+        metrics.observe('analysis.llm_path_ms', (time.perf_counter() - started) * 1000)
+        self._record_tier0_share()
+        return ai_analysis
+    
+    def _speculative_analysis(self, company_name: str, homepage: str, deadline: float) -> Tuple[Dict, Optional[Dict]]:
+        """
+        추측 분석 실행
+        
+        정족수 출처(기본: 공시·뉴스)가 모이면 느린 출처(홈페이지)를 기다리지 않고 분석을 시작하고,
+        늦게 도착한 출처가 리스크 신호를 크게 바꾸면 추측 결과를 버림
+        
+        Returns:
+            Tuple[Dict, Optional[Dict]]: (전체 공개정보, 추측 분석 결과 또는 재분석이 필요하면 None)
+        """
+        job = self.crawler.start_crawl(homepage, company_name, deadline)
+        quorum = [source.strip() for source in Config.SPECULATIVE_QUORUM.split(',') if source.strip()]
+        job.wait_for(quorum, deadline)
+        
+        late_sources = job.pending_sources()
+        partial = job.snapshot()
+        if not late_sources or partial['provenance']['real_share'] < Config.MIN_REAL_DATA_SHARE:
+            # 이미 모두 도착했거나 정족수 자료만으로는 분석할 수 없는 경우
+            return job.result(), None
+        
+        print(f"🏃 {company_name} 정족수 출처 수집 완료, {', '.join(late_sources)} 대기 중 분석 시작")
+        metrics.increment('analysis.speculation.started')
+        speculation_started = time.monotonic()
+        finished_at = {}
+        
+        def analyze_partial():
+            # 완료 콜백은 result() 대기가 풀린 뒤에 실행될 수 있으므로 분석 스레드에서 직접 기록
+            try:
+                return self._run_analysis(company_name, partial, deadline)
+            finally:
+                finished_at['analysis'] = time.monotonic()
+        
+        speculative = _speculation_executor.submit(analyze_partial)
+        
+        public_data = job.result()
+        # 완료 시각은 수집 스레드에서 기록하므로 result() 이후에는 모두 있음
+        late_arrival = max(job.completed_at[source] for source in late_sources)
+        
+        if public_data['provenance']['real_share'] < Config.MIN_REAL_DATA_SHARE:
+            metrics.increment('analysis.speculation.discarded')
+            self._record_speculation_kept_share()
+            self._count_wasted_speculation(speculative)
+            return public_data, None
+        if self._late_sources_material(partial, public_data):
+            print(f"🔁 {company_name} 늦게 도착한 출처의 리스크 신호가 커서 재분석")
+            metrics.increment('analysis.speculation.rerun')
+            self._record_speculation_kept_share()
+            self._count_wasted_speculation(speculative)
+            return public_data, None
+        
+        ai_analysis = speculative.result()
+        # 추측하지 않았다면 마지막 출처 도착 후 분석 시간만큼 더 걸렸음
+        analysis_seconds = finished_at['analysis'] - speculation_started
+        saved = late_arrival + analysis_seconds - max(finished_at['analysis'], late_arrival)
+        print(f"✅ {company_name} 추측 분석 결과 사용 ({saved * 1000:.0f}ms 단축)")
+        metrics.increment('analysis.speculation.kept')
+        metrics.observe('analysis.speculation.saved_ms', saved * 1000)
+        self._record_speculation_kept_share()
+        return public_data, ai_analysis
+    
+    def _late_sources_material(self, partial: Dict, public_data: Dict) -> bool:
+        """늦게 도착한 출처가 분석 입력을 크게 바꾸는지 (규칙 기반 신호로 판단)"""
+        before = self.rule_analyzer.analyze(partial)
+        after = self.rule_analyzer.analyze(public_data)
+        
+        signaled_before = {cert['item'] for cert in before['certifications'] if cert['priority'] != 'Low'}
+        signaled_after = {cert['item'] for cert in after['certifications'] if cert['priority'] != 'Low'}
+        added_signal = sum(after['rule_signals'].values()) - sum(before['rule_signals'].values())
+        return signaled_before != signaled_after or added_signal >= Config.SPECULATIVE_RERUN_SIGNAL
+    
+    def _count_wasted_speculation(self, speculative: concurrent.futures.Future):
+        """버린 추측 분석이 LLM을 호출했으면 낭비된 호출로 기록 (이미 실행 중이므로 끝난 뒤 판단)"""
+        def record(future: concurrent.futures.Future):
+            if future.exception() is None and future.result().get('analysis_method') != RuleBasedAnalyzer.ANALYSIS_METHOD:
+                metrics.increment('analysis.speculation.wasted_llm_calls')
+        speculative.add_done_callback(record)
+    
+    def _record_speculation_kept_share(self):
+        """추측 분석 결과를 그대로 사용한 비율 기록"""
+        started = metrics.get_counter('analysis.speculation.started')
+        if started:
+            metrics.set_gauge('analysis.speculation.kept_share',
+                              round(metrics.get_counter('analysis.speculation.kept') / started, 3))
+    
+    def _degraded_analysis(self, company_name: str, public_data: Dict, real_share: float,
+                           on_event: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """샘플 데이터 위주일 때의 간이 분석 (규칙 기반, 낮은 신뢰도)"""
+        print(f"⚠️ {company_name} 실데이터 비율 {real_share:.0%}, LLM 호출 생략")
+        metrics.increment('analysis.degraded')
+        
+        analysis = self.rule_analyzer.analyze(public_data)
+        analysis['confidence_score'] = min(analysis['confidence_score'], 0.5)
+        analysis['analysis_method'] = f'Degraded (실데이터 비율 {real_share:.0%})'
+        self._emit_fields(analysis, on_event)
+        return analysis
+    
+    def _emit_fields(self, analysis: Dict, on_event: Optional[Callable[[str, Dict], None]]):
+        """분석 결과 필드를 스트리밍 이벤트로 전달"""
+        if not on_event:
+            return
+        for name in AIAnalyzer.RESPONSE_FIELDS:
+            on_event('field', {'name': name, 'value': self._format_field(name, analysis.get(name))})
+    
+    def _record_tier0_share(self):
+        """규칙 기반 분석으로 처리한 비율 기록"""
+        requests = metrics.get_counter('analysis.requests')
+        if requests:
+            metrics.set_gauge('analysis.tier0_share', round(metrics.get_counter('analysis.tier0_served') / requests, 3))
+    
     def extract_company_name(self, homepage_url: str) -> str:
         """
         홈페이지 URL에서 기업명 추출
@@ -162,6 +349,14 @@ class CompanyAnalyzer:
             }
         ]
     
+    def _format_field(self, name: str, value):
+        """스트리밍 필드 값을 최종 결과와 같은 형식으로 변환"""
+        if name == 'risks':
+            return self._format_risks(value or [])
+        if name == 'certifications':
+            return self._format_certifications(value or [])
+        return value
+    
     def _format_risks(self, risks: List[Dict]) -> List[str]:
         """리스크 데이터 포맷팅"""
         if not risks:
@@ -251,6 +446,7 @@ class CompanyAnalyzer:
                 summary=result.get('summary', ''),
                 risks=ai_analysis.get('risks', []),
                 certifications=ai_analysis.get('certifications', []),
+                certification_ids=certification_catalog.catalog_ids(ai_analysis.get('certifications', [])),
                 news_data=public_data.get('news', []),
                 dart_data=public_data.get('dart', []),
                 social_data=public_data.get('social', []),
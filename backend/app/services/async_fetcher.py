@@ -0,0 +1,131 @@
+"""
+비동기 대량 수집 엔진
+asyncio 기반으로 수백 건의 홈페이지·RSS 요청을 동시에 처리 (동기 서비스에서 호출 가능)
+"""
+
+import time
+import asyncio
+import concurrent.futures
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+import httpx
+from requests.structures import CaseInsensitiveDict
+from app.config import Config
+from .metrics import metrics
+
+FetchRequest = Union[str, Tuple[str, Dict]]
+
+@dataclass
+class FetchResult:
+    """수집 결과 모델 (requests.Response와 같은 속성 이름 사용)"""
+    url: str
+    status_code: int = 0
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    content: bytes = b''
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """정상 응답 여부 (304 포함)"""
+        return self.error is None and 200 <= self.status_code < 400
+
+class _HostSlot:
+    """호스트별 동시 요청 제한 및 요청 간격 관리"""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0
+
+class AsyncFetchEngine:
+    """비동기 수집 엔진 클래스"""
+
+    def __init__(self, max_in_flight: Optional[int] = None, per_host_limit: Optional[int] = None,
+                 politeness_delay: Optional[float] = None, timeout: float = 15.0,
+                 user_agent: Optional[str] = None):
+        self.max_in_flight = max_in_flight or Config.ASYNC_FETCH_MAX_IN_FLIGHT
+        self.per_host_limit = per_host_limit or Config.ASYNC_FETCH_PER_HOST
+        self.politeness_delay = Config.ASYNC_FETCH_POLITENESS_DELAY if politeness_delay is None else politeness_delay
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    def fetch_all(self, requests: List[FetchRequest]) -> List[FetchResult]:
+        """
+        여러 URL 동시 수집 (동기 호출용)
+
+        Args:
+            requests: URL 또는 (URL, 요청 헤더) 목록
+
+        Returns:
+            List[FetchResult]: 요청 순서와 같은 순서의 수집 결과
+        """
+        coroutine = self.fetch_all_async(requests)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # 이미 이벤트 루프가 실행 중인 스레드에서는 별도 스레드에서 실행
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def fetch_all_async(self, requests: List[FetchRequest]) -> List[FetchResult]:
+        """여러 URL 동시 수집 (비동기)"""
+        if not requests:
+            return []
+
+        global_semaphore = asyncio.Semaphore(self.max_in_flight)
+        host_slots: Dict[str, _HostSlot] = {}
+        limits = httpx.Limits(max_connections=self.max_in_flight,
+                              max_keepalive_connections=self.max_in_flight)
+        headers = {'User-Agent': self.user_agent} if self.user_agent else None
+
+        started = time.perf_counter()
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, headers=headers,
+                                     follow_redirects=True) as client:
+            tasks = []
+            for request in requests:
+                url, request_headers = (request, {}) if isinstance(request, str) else request
+                host = urlparse(url).netloc
+                slot = host_slots.setdefault(host, _HostSlot(self.per_host_limit))
+                tasks.append(self._fetch_one(client, url, request_headers, global_semaphore, slot))
+            results = await asyncio.gather(*tasks)
+
+        metrics.observe('async_fetch.batch_seconds', time.perf_counter() - started)
+        return list(results)
+
+    async def _fetch_one(self, client: httpx.AsyncClient, url: str, headers: Dict,
+                         global_semaphore: asyncio.Semaphore, slot: _HostSlot) -> FetchResult:
+        """단일 URL 수집"""
+        async with slot.semaphore:
+            await self._wait_politeness(slot)
+            async with global_semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url, headers=headers)
+                    metrics.increment('async_fetch.requests')
+                    return FetchResult(
+                        url=url,
+                        status_code=response.status_code,
+                        headers=CaseInsensitiveDict(response.headers),
+                        content=response.content,
+                        elapsed=time.perf_counter() - started
+                    )
+                except Exception as e:
+                    metrics.increment('async_fetch.errors')
+                    return FetchResult(url=url, error=str(e) or type(e).__name__,
+                                       elapsed=time.perf_counter() - started)
+
+    async def _wait_politeness(self, slot: _HostSlot):
+        """같은 호스트에 대한 요청 시작 간격 유지"""
+        if self.politeness_delay <= 0:
+            return
+
+        async with slot.lock:
+            now = time.monotonic()
+            wait = slot.next_start - now
+            slot.next_start = max(now, slot.next_start) + self.politeness_delay
+        if wait > 0:
+            await asyncio.sleep(wait)
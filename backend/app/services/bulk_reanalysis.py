@@ -0,0 +1,318 @@
+"""
+일괄 재분석 서비스
+프롬프트 변경 후 저장된 분석 결과의 AI 단계를 배치 API로 다시 실행하고 결과를 되돌려 저장
+"""
+
+import os
+import json
+import time
+import uuid
+import requests
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from .ai_analyzer import AIAnalyzer
+from .database_service import DatabaseService
+from .certification_catalog import certification_catalog
+from .metrics import metrics
+from app.config import Config
+from app.models.analysis import Analysis
+
+class BatchBackend(ABC):
+    """일괄 처리 백엔드 기본 클래스 (메서드를 모두 구현해야 생성 가능)"""
+
+    # 더 이상 진행되지 않는 배치 상태
+    FINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+    @abstractmethod
+    def submit(self, batch_requests: List[Dict]) -> str:
+        """
+        요청 묶음 제출
+
+        Args:
+            batch_requests: custom_id와 body(chat.completions 요청 본문)를 가진 요청 목록
+
+        Returns:
+            str: 배치 ID
+        """
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """배치 상태 (validating, in_progress, finalizing, completed, failed, expired, cancelled)"""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Dict[str, Dict]:
+        """완료된 배치 결과 (custom_id별 {'content': 응답 텍스트} 또는 {'error': 오류})"""
+
+class OpenAIBatchBackend(BatchBackend):
+    """
+    OpenAI Batch API 백엔드 (/v1/files, /v1/batches)
+
+    설치된 SDK 버전에 배치 API가 없어 HTTP로 직접 호출
+    """
+
+    ENDPOINT = '/v1/chat/completions'
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: float = 60):
+        self.api_key = api_key or Config.OPENAI_API_KEY
+        self.base_url = (base_url or Config.OPENAI_BASE_URL or 'https://api.openai.com/v1').rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {self.api_key}'
+
+    def submit(self, batch_requests: List[Dict]) -> str:
+        """JSONL 입력 파일 업로드 후 배치 생성"""
+        lines = [
+            json.dumps({'custom_id': request['custom_id'], 'method': 'POST', 'url': self.ENDPOINT,
+                        'body': request['body']}, ensure_ascii=False)
+            for request in batch_requests
+        ]
+        upload = self.session.post(
+            f'{self.base_url}/files',
+            data={'purpose': 'batch'},
+            files={'file': ('reanalysis.jsonl', '\n'.join(lines).encode('utf-8'), 'application/jsonl')},
+            timeout=self.timeout
+        )
+        upload.raise_for_status()
+
+        batch = self.session.post(
+            f'{self.base_url}/batches',
+            json={'input_file_id': upload.json()['id'], 'endpoint': self.ENDPOINT, 'completion_window': '24h'},
+            timeout=self.timeout
+        )
+        batch.raise_for_status()
+        return batch.json()['id']
+
+    def status(self, batch_id: str) -> str:
+        """배치 상태 조회"""
+        return self._get_batch(batch_id)['status']
+
+    def results(self, batch_id: str) -> Dict[str, Dict]:
+        """결과 파일과 오류 파일을 읽어 custom_id별로 정리"""
+        batch = self._get_batch(batch_id)
+        results = {}
+        for file_id in (batch.get('output_file_id'), batch.get('error_file_id')):
+            if not file_id:
+                continue
+            response = self.session.get(f'{self.base_url}/files/{file_id}/content', timeout=self.timeout)
+            response.raise_for_status()
+            for line in response.text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    results[record['custom_id']] = self._parse_record(record)
+        return results
+
+    def _get_batch(self, batch_id: str) -> Dict:
+        """배치 정보 조회"""
+        response = self.session.get(f'{self.base_url}/batches/{batch_id}', timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _parse_record(record: Dict) -> Dict:
+        """결과 파일 한 줄을 응답 텍스트 또는 오류로 변환"""
+        if record.get('error'):
+            return {'error': record['error'].get('message', str(record['error']))}
+        response = record.get('response') or {}
+        if response.get('status_code') != 200:
+            return {'error': f"HTTP {response.get('status_code')}"}
+        return {'content': response['body']['choices'][0]['message']['content']}
+
+class LocalBatchBackend(BatchBackend):
+    """
+    로컬 대역 백엔드 (테스트·소규모 실행용)
+
+    제출 즉시 요청을 하나씩 실행하고 결과를 메모리에 보관하므로 프로세스가 끝나면 진행 중 배치는 사라짐
+    """
+
+    def __init__(self, handler: Callable[[Dict], str]):
+        self.handler = handler
+        self.batches: Dict[str, Dict[str, Dict]] = {}
+
+    def submit(self, batch_requests: List[Dict]) -> str:
+        """요청 묶음 즉시 실행"""
+        batch_id = f'local_batch_{uuid.uuid4().hex[:12]}'
+        results = {}
+        for request in batch_requests:
+            try:
+                results[request['custom_id']] = {'content': self.handler(request['body'])}
+            except Exception as e:
+                results[request['custom_id']] = {'error': str(e)}
+        self.batches[batch_id] = results
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        """배치 상태 (알 수 없는 배치는 만료로 간주)"""
+        return 'completed' if batch_id in self.batches else 'expired'
+
+    def results(self, batch_id: str) -> Dict[str, Dict]:
+        """배치 결과"""
+        return self.batches.get(batch_id, {})
+
+class BulkReanalysisRunner:
+    """일괄 재분석 실행 클래스"""
+
+    ANALYSIS_METHOD = 'AI Batch (GPT-4o-mini)'
+
+    def __init__(self, backend: BatchBackend, db_service: Optional[DatabaseService] = None,
+                 ai_analyzer: Optional[AIAnalyzer] = None, checkpoint_path: Optional[str] = None,
+                 batch_size: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.backend = backend
+        self.db_service = db_service or DatabaseService()
+        self.ai_analyzer = ai_analyzer or AIAnalyzer()
+        self.checkpoint_path = checkpoint_path or Config.BULK_REANALYSIS_CHECKPOINT
+        self.batch_size = batch_size or Config.BULK_REANALYSIS_BATCH_SIZE
+        self.poll_interval = Config.BULK_REANALYSIS_POLL_INTERVAL if poll_interval is None else poll_interval
+
+    def run(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        일괄 재분석 실행 (중단된 실행은 체크포인트부터 이어서 진행)
+
+        Args:
+            limit: 이번 실행에서 새로 제출할 최대 분석 건수 (선택사항)
+
+        Returns:
+            Dict: 진행 상황 (last_id, pending, retry, updated, failed)
+        """
+        state = self._load_checkpoint()
+
+        # 이전 실행에서 제출만 하고 결과를 반영하지 못한 배치부터 처리
+        for batch_id in list(state['pending']):
+            self._collect(batch_id, state)
+
+        # 만료·취소된 배치의 분석은 한 번 더 제출
+        retry_ids, state['retry'] = state['retry'], []
+        for start in range(0, len(retry_ids), self.batch_size):
+            self._submit(self.db_service.get_analyses_by_ids(retry_ids[start:start + self.batch_size]), state)
+        for batch_id in list(state['pending']):
+            self._collect(batch_id, state, retry=False)
+
+        submitted = 0
+        while limit is None or submitted < limit:
+            page_size = self.batch_size if limit is None else min(self.batch_size, limit - submitted)
+            analyses = self.db_service.list_analyses(after_id=state['last_id'], limit=page_size)
+            if not analyses:
+                break
+
+            state['last_id'] = analyses[-1].id
+            self._submit(analyses, state)
+            submitted += len(analyses)
+
+        for batch_id in list(state['pending']):
+            self._collect(batch_id, state, retry=False)
+
+        print(f"🎉 일괄 재분석 완료: 갱신 {state['updated']}건, 실패 {len(state['failed'])}건")
+        return state
+
+    def _submit(self, analyses: List[Analysis], state: Dict):
+        """배치 제출 (결과를 받기 전에 제출 사실부터 기록해 중단되어도 중복 제출하지 않음)"""
+        if not analyses:
+            return
+        batch_requests = [self._build_batch_request(analysis) for analysis in analyses]
+        batch_id = self.backend.submit(batch_requests)
+        print(f"📦 배치 {batch_id} 제출 ({len(analyses)}건, id {analyses[0].id}~{analyses[-1].id})")
+        metrics.increment('bulk_reanalysis.submitted', len(analyses))
+
+        state['pending'][batch_id] = [analysis.id for analysis in analyses]
+        self._save_checkpoint(state)
+
+    def _build_batch_request(self, analysis: Analysis) -> Dict:
+        """저장된 수집 자료로 배치 요청 생성"""
+        return {
+            'custom_id': f'analysis-{analysis.id}',
+            'body': self.ai_analyzer.build_chat_request(self._public_data(analysis))
+        }
+
+    @staticmethod
+    def _public_data(analysis: Analysis) -> Dict:
+        """저장된 분석 결과를 수집 자료 형식으로 변환"""
+        return {
+            'company': analysis.company_name,
+            'homepage': analysis.homepage,
+            'news': analysis.news_data or [],
+            'dart': analysis.dart_data or [],
+            'social': analysis.social_data or [],
+            'website': analysis.website_data or {}
+        }
+
+    def _collect(self, batch_id: str, state: Dict, retry: bool = True):
+        """
+        배치 완료 대기 후 결과 저장
+
+        만료·취소된 배치에서 결과를 받지 못한 분석은 retry가 참이면 재제출 대상으로, 아니면 실패로 기록
+        """
+        status = self._wait(batch_id)
+        analysis_ids = state['pending'][batch_id]
+        # 만료된 배치도 처리된 요청의 결과는 있을 수 있음
+        results = self.backend.results(batch_id) if status in ('completed', 'expired', 'cancelled') else {}
+
+        for analysis_id in analysis_ids:
+            result = results.get(f'analysis-{analysis_id}')
+            if result and 'content' in result and self._write_back(analysis_id, result['content']):
+                state['updated'] += 1
+                metrics.increment('bulk_reanalysis.updated')
+            elif result is None and retry and status != 'failed':
+                state['retry'].append(analysis_id)
+            else:
+                reason = (result or {}).get('error', f'배치 상태 {status}')
+                print(f"⚠️ 분석 {analysis_id} 재분석 실패: {reason}")
+                if analysis_id not in state['failed']:
+                    state['failed'].append(analysis_id)
+                metrics.increment('bulk_reanalysis.failed')
+
+        del state['pending'][batch_id]
+        self._save_checkpoint(state)
+
+    def _wait(self, batch_id: str) -> str:
+        """배치가 끝날 때까지 상태 확인"""
+        while True:
+            status = self.backend.status(batch_id)
+            if status in BatchBackend.FINAL_STATUSES:
+                return status
+            print(f"⏳ 배치 {batch_id} 상태: {status}")
+            time.sleep(self.poll_interval)
+
+    def _write_back(self, analysis_id: int, content: str) -> bool:
+        """
+        재분석 결과 저장 (분석 id 기준 갱신이므로 여러 번 반영해도 결과가 같음)
+
+        응답이 JSON 객체가 아니면 기본 문구로 덮어쓰지 않고 실패 처리
+        """
+        try:
+            parsed = json.loads(content)
+        except ValueError:
+            return False
+        if not isinstance(parsed, dict):
+            return False
+        
+        updated = self.db_service.update_analysis_result(analysis_id, {
+            'summary': parsed.get('summary', ''),
+            'risks': parsed.get('risks', []),
+            'certifications': parsed.get('certifications', []),
+            'certification_ids': certification_catalog.catalog_ids(parsed.get('certifications', [])),
+            'confidence_score': parsed.get('confidence_score', 0.8),
+            'analysis_method': self.ANALYSIS_METHOD
+        })
+        # 인증이 바뀌었으므로 기록된 매칭은 갱신에 성공한 뒤에만 삭제 (다음 추천 조회 때 다시 계산)
+        if updated:
+            self.db_service.replace_matches(analysis_id, None, [])
+        return updated
+
+    def _load_checkpoint(self) -> Dict:
+        """체크포인트 읽기"""
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                state = json.load(f)
+            print(f"↩️ 체크포인트에서 재개 (id {state['last_id']} 이후, 진행 중 배치 {len(state['pending'])}개)")
+            state.setdefault('retry', [])
+            return state
+        return {'last_id': 0, 'pending': {}, 'retry': [], 'updated': 0, 'failed': []}
+
+    def _save_checkpoint(self, state: Dict):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f'{self.checkpoint_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(temp_path, self.checkpoint_path)
@@ -0,0 +1,160 @@
+"""
+인증 카탈로그
+AI 분석 결과("ISO 27001 (High): ...", "GDPR 컴플라이언스")와 컨설턴트 등록 값의 표기 차이를 별칭으로 흡수해 정수 ID로 변환
+"""
+
+import re
+import json
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (ID, 정식 명칭, 별칭) - ID는 DB certification_ids 열에 저장되므로 변경하지 말고 추가만 할 것
+CERTIFICATIONS = [
+    (1, 'ISO 9001', ['품질경영시스템', 'QMS']),
+    (2, 'ISO 14001', ['환경경영시스템', 'EMS']),
+    (3, 'ISO 27001', ['정보보안경영시스템', '정보보안 관리시스템', 'ISMS 국제표준']),
+    (4, 'ISO 27701', ['개인정보보호 관리시스템', 'PIMS']),
+    (5, 'ISO 45001', ['안전보건경영시스템', 'OHSAS 18001']),
+    (6, 'ISO 13485', ['의료기기 품질경영시스템']),
+    (7, 'ISO 20000', ['IT 서비스 관리', 'ITSM']),
+    (8, 'ISO 21001', ['교육기관 경영시스템']),
+    (9, 'ISO 22301', ['업무연속성 경영시스템', 'BCMS']),
+    (10, 'ISO 37001', ['부패방지경영시스템']),
+    (11, 'ISO 50001', ['에너지경영시스템']),
+    (12, 'ISO 22000', ['식품안전경영시스템']),
+    (13, 'GDPR', ['EU 개인정보보호 규정', '유럽 개인정보보호법']),
+    (14, 'ISMS-P', ['정보보호 및 개인정보보호 관리체계']),
+    (15, 'ISMS', ['정보보호 관리체계']),
+    (16, 'HACCP', ['식품안전관리인증']),
+    (17, 'GMP', ['우수의약품 제조관리기준']),
+    (18, 'CMMI', []),
+    (19, 'SOC 2', ['SOC2']),
+    (20, 'PCI DSS', []),
+    (21, 'CSAP', ['클라우드 보안인증']),
+    (22, 'ESG 인증', ['ESG', 'K-ESG', 'ESG 경영']),
+]
+
+# 카탈로그에 없는 인증의 프로세스 내 ID 시작값 (DB에는 저장하지 않음)
+LOCAL_ID_START = 10000
+
+# 문자열 변환 결과 보관 상한 (분석 결과의 설명 문구가 계속 달라지므로 넘으면 비움)
+INTERN_CACHE_SIZE = 50000
+
+# GPT 형식 항목의 우선순위·설명 부분 ("ISO 27001 (High): 설명")
+_FORMATTED_ITEM = re.compile(r'^(.*?)\s*\((?:High|Medium|Low)\)\s*(?::.*)?$', re.IGNORECASE | re.DOTALL)
+_KEY_PUNCTUATION = re.compile(r'[\s\-_/·.,:()\[\]]+')
+
+def certification_label(certification) -> str:
+    """인증 항목에서 명칭만 추출 (dict 항목, JSON 문자열, 우선순위·설명이 붙은 문자열 지원)"""
+    if isinstance(certification, str) and certification.lstrip().startswith('{'):
+        try:
+            certification = json.loads(certification)
+        except ValueError:
+            pass
+    if isinstance(certification, dict):
+        certification = certification.get('item', '')
+
+    label = str(certification or '').strip()
+    formatted = _FORMATTED_ITEM.match(label)
+    if formatted:
+        label = formatted.group(1)
+    return label.split(':', 1)[0].strip()
+
+def certification_key(label: str) -> str:
+    """비교용 키 (대문자, 공백·구두점 제거, ISO/IEC → ISO)"""
+    return _KEY_PUNCTUATION.sub('', label.upper()).replace('ISOIEC', 'ISO')
+
+class CertificationCatalog:
+    """인증 카탈로그 클래스"""
+
+    def __init__(self, entries=CERTIFICATIONS):
+        self._names: Dict[int, str] = {}
+        self._ids: Dict[str, int] = {}
+        for certification_id, name, aliases in entries:
+            self._names[certification_id] = name
+            for alias in [name] + list(aliases):
+                self._ids[certification_key(alias)] = certification_id
+        # 포함 검색은 긴 키부터 (ISMSP가 ISMS보다 먼저), 3글자 이하 약어는 오탐이 많아 제외
+        self._keys_by_length = sorted((key for key in self._ids if len(key) >= 4), key=len, reverse=True)
+
+        self._local_ids: Dict[str, int] = {}
+        # 문자열 항목별 변환 결과 (같은 표기가 반복되므로 정규식 처리를 한 번만)
+        self._interned: Dict[str, Optional[int]] = {}
+        self._lock = threading.Lock()
+
+    def alias_keys(self) -> List[Tuple[str, int]]:
+        """(비교용 키, 카탈로그 ID) 목록 (DB 별칭 테이블 적재용, 포함 검색 동순위는 이 순서를 따름)"""
+        return list(self._ids.items())
+
+    def lookup(self, certification) -> Optional[int]:
+        """카탈로그 ID (별칭 일치 → 별칭 포함 순, 없으면 None)"""
+        key = certification_key(certification_label(certification))
+        if not key:
+            return None
+        if key in self._ids:
+            return self._ids[key]
+        for alias in self._keys_by_length:
+            if alias in key:
+                return self._ids[alias]
+        return None
+
+    def intern(self, certification, assign: bool = True) -> Optional[int]:
+        """
+        정수 ID (카탈로그에 없으면 같은 표기끼리 같은 프로세스 내 ID, 빈 값은 None)
+
+        Args:
+            certification: 인증 항목
+            assign: 카탈로그에 없는 표기에 새 ID를 부여할지 여부 (분석·요청 쪽 표기는 False,
+                보유한 컨설턴트가 없는 표기는 어차피 매칭되지 않으므로 ID를 만들지 않고 None)
+        """
+        if isinstance(certification, str):
+            certification_id = self._interned.get(certification)
+            if certification_id is None:
+                certification_id = self._intern(certification, assign)
+                # 부여되지 않은 표기는 나중에 컨설턴트가 등록할 수 있으므로 기억하지 않음
+                if certification_id is not None:
+                    if len(self._interned) >= INTERN_CACHE_SIZE:
+                        self._interned.clear()
+                    self._interned[certification] = certification_id
+            return certification_id
+        return self._intern(certification, assign)
+
+    def _intern(self, certification, assign: bool) -> Optional[int]:
+        """정수 ID 변환"""
+        certification_id = self.lookup(certification)
+        if certification_id is not None:
+            return certification_id
+
+        label = certification_label(certification)
+        key = certification_key(label)
+        if not key:
+            return None
+        with self._lock:
+            if key not in self._local_ids:
+                if not assign:
+                    return None
+                local_id = LOCAL_ID_START + len(self._local_ids)
+                self._local_ids[key] = local_id
+                self._names[local_id] = label
+            return self._local_ids[key]
+
+    def intern_all(self, certifications: Iterable, assign: bool = True) -> List[int]:
+        """인증 목록의 정수 ID (순서 유지, 중복 제거, assign은 intern과 같음)"""
+        ids = []
+        for certification in certifications or []:
+            certification_id = self.intern(certification, assign)
+            if certification_id is not None and certification_id not in ids:
+                ids.append(certification_id)
+        return ids
+
+    def catalog_ids(self, certifications: Iterable) -> List[int]:
+        """DB에 저장할 카탈로그 ID 목록 (카탈로그에 없는 인증 제외)"""
+        return [certification_id for certification_id in self.intern_all(certifications, assign=False)
+                if certification_id < LOCAL_ID_START]
+
+    def name(self, certification_id: int) -> str:
+        """정식 명칭"""
+        return self._names.get(certification_id, str(certification_id))
+
+# 전역 인증 카탈로그
+certification_catalog = CertificationCatalog()
@@ -0,0 +1,101 @@
+"""
+문자 인코딩 감지
+HTTP 헤더 → BOM → <meta charset> → UTF-8 검증 → 통계적 감지(앞부분만) 순으로 판별
+"""
+
+import re
+import codecs
+from typing import Optional, Tuple
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:  # requests 설치 시 함께 설치되지만 없을 경우 통계적 감지 생략
+    from_bytes = None
+
+# 서버 기본값으로 잘못 붙는 경우가 많아 신뢰하지 않는 헤더 인코딩
+UNTRUSTED_HEADER_CHARSETS = {'iso8859-1', 'cp1252', 'ascii'}
+
+# 상위 호환 인코딩으로 대체 (EUC-KR 페이지에 확장 완성형 문자가 섞여 있는 경우 대비)
+SUPERSET_CHARSETS = {'euc_kr': 'cp949'}
+
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+META_SCAN_BYTES = 4096
+STATISTICAL_SCAN_BYTES = 16384
+
+HEADER_CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+def normalize_charset(label: Optional[str]) -> Optional[str]:
+    """인코딩 이름 정규화 (알 수 없는 이름은 None)"""
+    if not label:
+        return None
+
+    try:
+        name = codecs.lookup(label.strip().strip('"\'')).name
+    except LookupError:
+        return None
+
+    return SUPERSET_CHARSETS.get(name, name)
+
+def detect_encoding(content: bytes, content_type: str = '') -> Tuple[str, str]:
+    """
+    응답 본문의 인코딩 감지
+
+    Args:
+        content: 응답 본문 바이트
+        content_type: Content-Type 헤더 값
+
+    Returns:
+        Tuple[str, str]: (인코딩, 감지 방법)
+    """
+    # 1. HTTP 헤더
+    header_match = HEADER_CHARSET_PATTERN.search(content_type or '')
+    header_charset = normalize_charset(header_match.group(1)) if header_match else None
+    if header_charset and header_charset not in UNTRUSTED_HEADER_CHARSETS:
+        return header_charset, 'header'
+
+    # 2. BOM
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding, 'bom'
+
+    # 3. <meta charset> / http-equiv (앞부분만 검사)
+    meta_match = META_CHARSET_PATTERN.search(content[:META_SCAN_BYTES])
+    if meta_match:
+        meta_charset = normalize_charset(meta_match.group(1).decode('ascii', errors='ignore'))
+        if meta_charset:
+            return meta_charset, 'meta'
+
+    # 4. UTF-8 검증 (앞부분만, 잘린 멀티바이트 문자는 허용)
+    prefix = content[:STATISTICAL_SCAN_BYTES]
+    if _is_valid_utf8(prefix):
+        return 'utf-8', 'utf8'
+
+    # 5. 통계적 감지 (앞부분만)
+    if from_bytes is not None:
+        best = from_bytes(prefix).best()
+        encoding = normalize_charset(best.encoding) if best else None
+        if encoding:
+            return encoding, 'statistical'
+
+    # 신뢰하지 않았던 헤더 값이라도 있으면 사용
+    if header_charset:
+        return header_charset, 'header'
+
+    return 'utf-8', 'default'
+
+def _is_valid_utf8(data: bytes) -> bool:
+    """UTF-8 디코딩 가능 여부"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        decoder.decode(data, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
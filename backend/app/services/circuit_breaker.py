@@ -0,0 +1,92 @@
+"""
+서킷 브레이커
+최근 실패한 대상(도메인 등)에 대한 요청을 즉시 차단
+"""
+
+import time
+import threading
+from typing import Dict
+from .metrics import metrics
+
+class CircuitBreaker:
+    """키(도메인)별 서킷 브레이커
+
+    상태 전이:
+        closed    → 연속 실패가 failure_threshold에 도달하면 open
+        open      → reset_timeout이 지나면 half_open (시험 요청 1건 허용)
+        half_open → 시험 요청 성공 시 closed, 실패 시 다시 open
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict] = {}
+
+        metrics.register_collector(f'circuit_breaker.{name}', self.snapshot)
+
+    def allow(self, key: str) -> bool:
+        """요청 허용 여부 확인"""
+        with self._lock:
+            state = self._states.get(key)
+            if not state or state['state'] == self.CLOSED:
+                return True
+
+            # open: 재시도 시간이 지나면 시험 요청 1건 허용
+            # half_open: 시험 요청 결과가 기록되지 않은 채 재시도 시간이 지나면 다시 허용
+            now = time.monotonic()
+            if now - state['opened_at'] < self.reset_timeout:
+                return False
+
+            state['state'] = self.HALF_OPEN
+            state['opened_at'] = now
+            return True
+
+    def record_success(self, key: str):
+        """요청 성공 기록"""
+        with self._lock:
+            self._states.pop(key, None)
+
+    def record_failure(self, key: str):
+        """요청 실패 기록"""
+        with self._lock:
+            state = self._states.setdefault(key, {'state': self.CLOSED, 'failures': 0, 'opened_at': 0.0})
+            state['failures'] += 1
+
+            if state['state'] == self.HALF_OPEN or state['failures'] >= self.failure_threshold:
+                if state['state'] != self.OPEN:
+                    metrics.increment(f'circuit_breaker.{self.name}.opened')
+                state['state'] = self.OPEN
+                state['opened_at'] = time.monotonic()
+
+    def get_state(self, key: str) -> str:
+        """키의 현재 상태 조회"""
+        with self._lock:
+            state = self._states.get(key)
+            return state['state'] if state else self.CLOSED
+
+    def snapshot(self) -> Dict:
+        """브레이커 상태 요약"""
+        now = time.monotonic()
+        with self._lock:
+            keys = {}
+            for key, state in self._states.items():
+                retry_in = 0.0
+                if state['state'] == self.OPEN:
+                    retry_in = max(0.0, self.reset_timeout - (now - state['opened_at']))
+                keys[key] = {
+                    'state': state['state'],
+                    'failures': state['failures'],
+                    'retry_in': round(retry_in, 1)
+                }
+
+            return {
+                'open': sum(1 for s in keys.values() if s['state'] == self.OPEN),
+                'half_open': sum(1 for s in keys.values() if s['state'] == self.HALF_OPEN),
+                'keys': keys
+            }
@@ -0,0 +1,243 @@
+"""
+컨설턴트 메모리 색인
+활성 컨설턴트를 한 번 불러와 인증·업종·지역별 목록으로 보관하고 이후에는 updated_at 변경분만 조회
+"""
+
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+from app.config import Config
+from app.models.consultant import Consultant
+from .certification_catalog import certification_catalog
+from .consultant_matrix import ConsultantMatrix
+from .database_service import DatabaseService
+from .metrics import metrics
+
+# 변경분 조회 시 겹쳐 읽는 구간 (커밋이 늦은 트랜잭션의 updated_at 누락 방지)
+POLL_OVERLAP = timedelta(seconds=5)
+
+class ConsultantIndex:
+    """컨설턴트 메모리 색인 클래스"""
+
+    def __init__(self, db_service: Optional[DatabaseService] = None, refresh_interval: Optional[float] = None,
+                 backend: Optional[str] = None):
+        self._db_service = db_service
+        self.refresh_interval = (Config.CONSULTANT_INDEX_REFRESH_INTERVAL
+                                 if refresh_interval is None else refresh_interval)
+        # database 방식은 매칭을 DB 함수로 하므로 변경 기준 시각도 전체 로드 없이 DB에서 조회
+        self.backend = Config.MATCHING_BACKEND if backend is None else backend
+        self.version = 0
+
+        self._consultants: Dict[int, Consultant] = {}
+        self._ordered: List[Consultant] = []
+        self._by_certification: Dict[int, Set[int]] = {}
+        self._by_industry: Dict[str, Set[int]] = {}
+        self._by_region: Dict[str, Set[int]] = {}
+        self._matrix: Optional[ConsultantMatrix] = None
+        self._matrix_version = -1
+
+        self._loaded = False
+        self._polled_at = 0.0
+        self._high_water: Optional[datetime] = None
+        self._remote_stamp: Optional[datetime] = None
+        self._remote_checked_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def db_service(self) -> DatabaseService:
+        """데이터베이스 서비스 (처음 사용할 때 생성)"""
+        if self._db_service is None:
+            self._db_service = DatabaseService()
+        return self._db_service
+
+    def consultants(self) -> List[Consultant]:
+        """활성 컨설턴트 전체 (id 순)"""
+        with self._lock:
+            self._ensure_fresh()
+            return self._ordered
+
+    def get(self, consultant_id: int) -> Optional[Consultant]:
+        """id로 활성 컨설턴트 조회"""
+        with self._lock:
+            self._ensure_fresh()
+            return self._consultants.get(consultant_id)
+
+    def get_many(self, consultant_ids: List[int]) -> Optional[List[Optional[Consultant]]]:
+        """
+        id 목록으로 활성 컨설턴트 조회 (요청 순서, 없거나 비활성이면 None 항목)
+
+        database 방식은 전체를 불러오지 않고 해당 id만 조회 (조회 실패 시 None)
+        """
+        if self.backend == 'database':
+            consultants = self.db_service.get_consultants_by_ids(consultant_ids)
+            if consultants is not None:
+                by_id = {consultant.id: consultant for consultant in consultants if consultant.status == 'active'}
+                return [by_id.get(consultant_id) for consultant_id in consultant_ids]
+            if self.db_service.is_available():
+                return None
+        with self._lock:
+            self._ensure_fresh()
+            return [self._consultants.get(consultant_id) for consultant_id in consultant_ids]
+
+    def stamp(self) -> Optional[datetime]:
+        """디렉터리 변경 기준 시각 (반영된 컨설턴트 updated_at 최댓값, database 방식은 DB 최댓값)"""
+        with self._lock:
+            if self.backend == 'database' and self._refresh_remote_stamp():
+                return self._remote_stamp
+            self._ensure_fresh()
+            return self._high_water
+
+    def lookup(self, industry: str = '', certifications: Optional[List[str]] = None, region: str = '') -> List[Consultant]:
+        """
+        조건에 맞는 컨설턴트 조회 (업종·지역은 일치, 인증은 하나 이상 보유)
+
+        Args:
+            industry: 업종
+            certifications: 인증 목록
+            region: 지역
+
+        Returns:
+            List[Consultant]: 컨설턴트 목록 (id 순)
+        """
+        with self._lock:
+            self._ensure_fresh()
+            ids: Optional[Set[int]] = None
+            if industry:
+                ids = set(self._by_industry.get(industry, ()))
+            if region:
+                ids = self._intersect(ids, self._by_region.get(region, set()))
+            if certifications:
+                holders = set()
+                for certification_id in certification_catalog.intern_all(certifications, assign=False):
+                    holders |= self._by_certification.get(certification_id, set())
+                ids = self._intersect(ids, holders)
+
+            if ids is None:
+                return list(self._ordered)
+            return [self._consultants[consultant_id] for consultant_id in sorted(ids)]
+
+    def matrix(self) -> ConsultantMatrix:
+        """매칭 점수 계산용 열 지향 표현 (색인이 바뀐 경우에만 다시 생성)"""
+        with self._lock:
+            self._ensure_fresh()
+            if self._matrix_version != self.version:
+                self._matrix = ConsultantMatrix(self._ordered)
+                self._matrix_version = self.version
+            return self._matrix
+
+    def directory_version(self) -> int:
+        """컨설턴트 디렉터리 버전 (등록·변경이 반영될 때마다 증가, database 방식은 DB 변경 시각이 바뀔 때마다 증가)"""
+        with self._lock:
+            if self.backend == 'database' and self._refresh_remote_stamp():
+                return self.version
+            self._ensure_fresh()
+            return self.version
+
+    def invalidate(self):
+        """색인 무효화 (버전을 바로 올리고 다음 조회 때 전체를 다시 불러옴)"""
+        with self._lock:
+            self._loaded = False
+            self._remote_checked_at = None
+            self.version += 1
+
+    def _refresh_remote_stamp(self) -> bool:
+        """
+        DB의 컨설턴트 updated_at 최댓값 갱신 (조회 간격마다 한 행만 조회, 값이 바뀌면 버전 증가)
+
+        Returns:
+            bool: DB 기준 시각을 쓸 수 있는지 여부 (로컬 모드는 False)
+        """
+        if not self.db_service.is_available():
+            return False
+        now = time.monotonic()
+        if self._remote_checked_at is None or now - self._remote_checked_at >= self.refresh_interval:
+            self._remote_checked_at = now
+            stamp = self.db_service.get_consultants_stamp()
+            # 조회 실패는 None이므로 이전 값 유지
+            if stamp is not None and stamp != self._remote_stamp:
+                self._remote_stamp = stamp
+                self.version += 1
+            metrics.increment('consultant_index.stamp_queries')
+        return True
+
+    def _ensure_fresh(self):
+        """처음이거나 무효화되었으면 전체 로드, 조회 간격이 지났으면 변경분 반영"""
+        if not self._loaded:
+            self._reload()
+        elif time.monotonic() - self._polled_at >= self.refresh_interval:
+            self._poll()
+
+    def _reload(self):
+        """활성 컨설턴트 전체 로드 (조회 실패 시 기존 색인 유지, 다음 조회 때 다시 시도)"""
+        consultants = self.db_service.load_active_consultants()
+        if consultants is None:
+            metrics.increment('consultant_index.reload_failures')
+            print(f"⚠️ 컨설턴트 색인 로드 실패, 기존 색인 유지: {len(self._consultants)}명")
+            return
+
+        self._consultants = {}
+        self._by_certification, self._by_industry, self._by_region = {}, {}, {}
+        for consultant in consultants:
+            self._add(consultant)
+        self._high_water = max((c.updated_at for c in consultants if c.updated_at), default=None)
+        self._loaded = True
+        self._polled_at = time.monotonic()
+        self._changed()
+
+        metrics.increment('consultant_index.reloads')
+        print(f"📇 컨설턴트 색인 로드: {len(self._consultants)}명")
+
+    def _poll(self):
+        """updated_at 기준 변경분 반영 (비활성화된 컨설턴트는 제거)"""
+        self._polled_at = time.monotonic()
+        since = (self._high_water - POLL_OVERLAP).isoformat() if self._high_water else datetime(1970, 1, 1).isoformat()
+
+        changed = False
+        for consultant in self.db_service.get_consultants_updated_since(since):
+            if consultant.updated_at and (self._high_water is None or consultant.updated_at > self._high_water):
+                self._high_water = consultant.updated_at
+
+            current = self._consultants.get(consultant.id)
+            if current == consultant:
+                continue
+            if current:
+                self._remove(current)
+                changed = True
+            if consultant.status == 'active':
+                self._add(consultant)
+                changed = True
+
+        metrics.increment('consultant_index.polls')
+        if changed:
+            self._changed()
+
+    def _add(self, consultant: Consultant):
+        """색인에 추가"""
+        self._consultants[consultant.id] = consultant
+        self._by_industry.setdefault(consultant.industry, set()).add(consultant.id)
+        self._by_region.setdefault(consultant.region, set()).add(consultant.id)
+        for certification_id in certification_catalog.intern_all(consultant.certifications):
+            self._by_certification.setdefault(certification_id, set()).add(consultant.id)
+
+    def _remove(self, consultant: Consultant):
+        """색인에서 제거"""
+        self._consultants.pop(consultant.id, None)
+        self._by_industry.get(consultant.industry, set()).discard(consultant.id)
+        self._by_region.get(consultant.region, set()).discard(consultant.id)
+        for certification_id in certification_catalog.intern_all(consultant.certifications):
+            self._by_certification.get(certification_id, set()).discard(consultant.id)
+
+    def _changed(self):
+        """정렬 목록 갱신 및 버전 증가"""
+        self._ordered = [self._consultants[consultant_id] for consultant_id in sorted(self._consultants)]
+        self.version += 1
+        metrics.set_gauge('consultant_index.size', len(self._ordered))
+
+    @staticmethod
+    def _intersect(ids: Optional[Set[int]], other: Set[int]) -> Set[int]:
+        """교집합 (ids가 None이면 조건 없음)"""
+        return set(other) if ids is None else ids & other
+
+# 전역 컨설턴트 색인
+consultant_index = ConsultantIndex()
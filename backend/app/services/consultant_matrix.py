@@ -0,0 +1,109 @@
+"""
+컨설턴트 열 지향 표현
+인증 ID 비트셋과 경력 수준·업종·지역 코드를 NumPy 배열로 보관해 전체 컨설턴트를 한 번에 점수 계산
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.models.consultant import Consultant
+from .certification_catalog import certification_catalog
+
+# 경력 수준 (코드 순서)
+EXPERIENCE_LEVELS = ('junior', 'mid', 'senior', 'expert')
+
+def experience_level_code(years: int) -> int:
+    """경력 연수를 경력 수준 코드로 변환 (0-3년 junior, 4-7년 mid, 8-12년 senior, 13년 이상 expert)"""
+    years = years or 0
+    if years <= 3:
+        return 0
+    if years <= 7:
+        return 1
+    if years <= 12:
+        return 2
+    return 3
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """행별 1비트 개수 (NumPy 2.0 미만은 unpackbits 사용)"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+class ConsultantMatrix:
+    """컨설턴트 열 지향 표현 클래스"""
+
+    def __init__(self, consultants: List[Consultant]):
+        self.consultants = consultants
+        # 인증 ID → 비트 위치
+        self.certification_positions: Dict[int, int] = {}
+
+        certification_codes = []
+        for consultant in consultants:
+            certification_codes.append([
+                self.certification_positions.setdefault(certification_id, len(self.certification_positions))
+                for certification_id in certification_catalog.intern_all(consultant.certifications)
+            ])
+
+        # 인증 64개당 uint64 한 칸
+        self.word_count = max(1, (len(self.certification_positions) + 63) // 64)
+        self.certification_bits = np.zeros((len(consultants), self.word_count), dtype=np.uint64)
+        for row, codes in enumerate(certification_codes):
+            for code in codes:
+                self.certification_bits[row, code // 64] |= np.uint64(1 << (code % 64))
+
+        self.experience_codes = np.fromiter(
+            (experience_level_code(consultant.years_experience) for consultant in consultants),
+            dtype=np.int8, count=len(consultants)
+        )
+        self.industry_codes, self.industry_ids = self._encode(consultant.industry for consultant in consultants)
+        self.region_codes, self.region_ids = self._encode(consultant.region for consultant in consultants)
+
+    def __len__(self) -> int:
+        return len(self.consultants)
+
+    @staticmethod
+    def _encode(values: Iterable[str]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """문자열 열을 정수 코드로 변환"""
+        ids: Dict[str, int] = {}
+        codes = [ids.setdefault(value or '', len(ids)) for value in values]
+        return np.array(codes, dtype=np.int32), ids
+
+    def certification_mask(self, certifications: Iterable) -> np.ndarray:
+        """인증 목록의 비트셋 (보유한 컨설턴트가 없는 인증은 제외)"""
+        mask = np.zeros(self.word_count, dtype=np.uint64)
+        for certification_id in certification_catalog.intern_all(certifications, assign=False):
+            code = self.certification_positions.get(certification_id)
+            if code is not None:
+                mask[code // 64] |= np.uint64(1 << (code % 64))
+        return mask
+
+    def certification_match_counts(self, mask: np.ndarray) -> np.ndarray:
+        """컨설턴트별 일치 인증 수"""
+        if not len(self.consultants):
+            return np.zeros(0, dtype=np.int64)
+        return _popcount(self.certification_bits & mask)
+
+    def code_matches(self, codes: np.ndarray, ids: Dict[str, int], value: Optional[str]) -> np.ndarray:
+        """업종·지역 코드 일치 여부 (대상 값이 없으면 모두 일치)"""
+        if not value:
+            return np.ones(len(self.consultants), dtype=bool)
+        code = ids.get(value)
+        if code is None:
+            return np.zeros(len(self.consultants), dtype=bool)
+        return codes == code
+
+    def top_k(self, scores: np.ndarray, k: int, min_score: float) -> np.ndarray:
+        """
+        점수 상위 k개 행 번호 (min_score 초과만, 동점은 원래 순서)
+
+        argpartition으로 후보를 고른 뒤 후보만 정렬하므로 전체 정렬이 필요 없음
+        """
+        candidates = np.flatnonzero(scores > min_score)
+        if k <= 0 or not len(candidates):
+            return np.zeros(0, dtype=np.int64)
+        if len(candidates) > k:
+            candidate_scores = scores[candidates]
+            kth = candidate_scores[np.argpartition(-candidate_scores, k - 1)[:k]].min()
+            # 경계 점수와 같은 동점도 모두 후보에 넣어야 원래 순서를 지킬 수 있음
+            candidates = candidates[candidate_scores >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order[:k]]
@@ -4,6 +4,8 @@
 
 from typing import Dict, List, Optional
 from .database_service import DatabaseService
+from .consultant_index import consultant_index
+from .certification_catalog import certification_catalog
 from app.models.consultant import Consultant
 
 class ConsultantService:
@@ -75,6 +77,7 @@ class ConsultantService:
             region=data.get('region', '서울'),
             years_experience=data.get('years', 0),
             certifications=data['certifications'],
+            certification_ids=certification_catalog.catalog_ids(data['certifications']),
             description=data.get('description', ''),
             status='pending'
         )
@@ -84,6 +87,7 @@ class ConsultantService:
             try:
                 saved_consultant = self.db_service.create_consultant(consultant)
                 if saved_consultant:
+                    consultant_index.invalidate()
                     return {
                         'id': saved_consultant.id,
                         'name': saved_consultant.name,
@@ -4,38 +4,127 @@
 """
 
 import os
-from typing import Dict, List, Optional
+import time
+import concurrent.futures
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from .dart_service import DartService
 from .news_service import NewsService
 from .web_scraper import WebScraper
 
+# 출처별 수집 스레드 풀
+_crawl_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix='crawl')
+
+class CrawlJob:
+    """진행 중인 공개정보 수집 작업 (출처별로 완료 시점이 다름)"""
+    
+    def __init__(self, crawler: 'CrawlerService', company_name: str, homepage: str,
+                 collectors: Dict[str, Callable[[], object]], website_note: Optional[str] = None):
+        self.crawler = crawler
+        self.company_name = company_name
+        self.homepage = homepage
+        self.website_note = website_note
+        self.started = time.monotonic()
+        self.completed_at: Dict[str, float] = {}
+        self.futures: Dict[str, concurrent.futures.Future] = {
+            name: _crawl_executor.submit(self._run, name, collector) for name, collector in collectors.items()
+        }
+    
+    def _run(self, name: str, collector: Callable[[], object]):
+        """출처 1개 수집 (완료 콜백은 대기가 풀린 뒤 실행될 수 있으므로 완료 시각은 수집 스레드에서 기록)"""
+        try:
+            return self.crawler._collect(name, collector)
+        finally:
+            self.completed_at[name] = time.monotonic()
+    
+    def done_sources(self) -> List[str]:
+        """수집이 끝난 출처 목록"""
+        return [name for name, future in self.futures.items() if future.done()]
+    
+    def pending_sources(self) -> List[str]:
+        """수집 중인 출처 목록"""
+        return [name for name, future in self.futures.items() if not future.done()]
+    
+    def wait_for(self, sources: Iterable[str], deadline: Optional[float] = None) -> bool:
+        """
+        지정한 출처의 수집 완료 대기
+        
+        Args:
+            sources: 기다릴 출처 (수집 대상이 아닌 출처는 무시)
+            deadline: 대기 마감 시각 (time.monotonic 기준, 선택사항)
+            
+        Returns:
+            bool: 마감 전에 모두 완료되었는지 여부
+        """
+        futures = [self.futures[name] for name in sources if name in self.futures]
+        timeout = max(0.0, deadline - time.monotonic()) if deadline else None
+        _, pending = concurrent.futures.wait(futures, timeout=timeout)
+        return not pending
+    
+    def snapshot(self) -> Dict:
+        """현재까지 수집된 공개정보 (수집 중인 출처는 빈 값)"""
+        results = {
+            'company': self.company_name,
+            'homepage': self.homepage,
+            'news': [],
+            'dart': [],
+            'social': [],
+            'website': {},
+            'crawl_date': self.crawler._get_current_date(),
+            'status': 'success'
+        }
+        for name in self.done_sources():
+            results[name] = self.futures[name].result()
+        if self.website_note:
+            results['website_note'] = self.website_note
+        
+        pending = self.pending_sources()
+        if pending:
+            results['pending_sources'] = pending
+        
+        # 출처 구분 (실데이터 / 샘플 / 캐시)
+        results['provenance'] = self.crawler._summarize_provenance(results)
+        return results
+    
+    def result(self) -> Dict:
+        """모든 출처 수집 완료 후 공개정보 (웹사이트 수집은 분석 마감 시각을 따름)"""
+        self.wait_for(self.futures)
+        results = self.snapshot()
+        print(f"🎉 {self.company_name} 공개정보 수집 완료! (실데이터 비율 {results['provenance']['real_share']:.0%})")
+        return results
+
 class CrawlerService:
     """크롤링 서비스 메인 클래스"""
     
+    # 출처별 표시 이름과 실패 시 기본값
+    SOURCES = {
+        'news': ('📰', '뉴스', list),
+        'dart': ('📋', 'DART 공시', list),
+        'website': ('🌐', '웹사이트 정보', dict),
+        'social': ('📱', '소셜 미디어', list)
+    }
+    
     def __init__(self):
         self.dart_service = DartService()
         self.news_service = NewsService()
         self.web_scraper = WebScraper()
     
-    def crawl_public_data(self, homepage: str, company_name: str = None) -> Dict:
+    def crawl_public_data(self, homepage: str, company_name: str = None, deadline: Optional[float] = None,
+                          skip_website: bool = False) -> Dict:
         """
         공개정보 수집 및 통합
         
         Args:
             homepage: 기업 홈페이지 URL
             company_name: 기업명 (선택사항)
+            deadline: 분석 마감 시각 (time.monotonic 기준, 선택사항)
+            skip_website: 웹사이트 수집 생략 여부 (사전 점검에서 접속 불가로 확인된 경우)
             
         Returns:
             Dict: 수집된 공개정보
         """
         try:
-            # 기업명 추출
-            if not company_name:
-                company_name = self._extract_company_name(homepage)
-            
-            print(f"🔍 {company_name} 공개정보 수집 시작...")
-            
-            # 병렬로 데이터 수집
+            # 추측 분석이 아닌 경우는 출처별 완료 시점이 필요 없으므로 공용 수집 스레드 풀을 거치지 않고 직접 수집
+            company_name, collectors, website_note = self._prepare_collectors(homepage, company_name, deadline, skip_website)
             results = {
                 'company': company_name,
                 'homepage': homepage,
@@ -46,45 +135,14 @@ class CrawlerService:
                 'crawl_date': self._get_current_date(),
                 'status': 'success'
             }
+            for name, collector in collectors.items():
+                results[name] = self._collect(name, collector)
+            if website_note:
+                results['website_note'] = website_note
             
-            # 뉴스 수집
-            try:
-                print("📰 뉴스 수집 중...")
-                results['news'] = self.news_service.fetch_news(company_name, homepage)
-                print(f"✅ 뉴스 {len(results['news'])}건 수집 완료")
-            except Exception as e:
-                print(f"❌ 뉴스 수집 실패: {str(e)}")
-                results['news'] = []
-            
-            # DART 공시 수집
-            try:
-                print("📋 DART 공시 수집 중...")
-                dart_key = os.getenv('DART_API_KEY')
-                results['dart'] = self.dart_service.fetch_filings(company_name, dart_key)
-                print(f"✅ DART 공시 {len(results['dart'])}건 수집 완료")
-            except Exception as e:
-                print(f"❌ DART 공시 수집 실패: {str(e)}")
-                results['dart'] = []
-            
-            # 웹사이트 정보 수집
-            try:
-                print("🌐 웹사이트 정보 수집 중...")
-                results['website'] = self.web_scraper.scrape_website(homepage)
-                print("✅ 웹사이트 정보 수집 완료")
-            except Exception as e:
-                print(f"❌ 웹사이트 정보 수집 실패: {str(e)}")
-                results['website'] = {}
-            
-            # 소셜 미디어 수집 (더미 데이터)
-            try:
-                print("📱 소셜 미디어 수집 중...")
-                results['social'] = self._get_sample_social(company_name)
-                print(f"✅ 소셜 미디어 {len(results['social'])}건 수집 완료")
-            except Exception as e:
-                print(f"❌ 소셜 미디어 수집 실패: {str(e)}")
-                results['social'] = []
-            
-            print(f"🎉 {company_name} 공개정보 수집 완료!")
+            # 출처 구분 (실데이터 / 샘플 / 캐시)
+            results['provenance'] = self._summarize_provenance(results)
+            print(f"🎉 {company_name} 공개정보 수집 완료! (실데이터 비율 {results['provenance']['real_share']:.0%})")
             return results
             
         except Exception as e:
@@ -98,9 +156,65 @@ class CrawlerService:
                 'website': {},
                 'crawl_date': self._get_current_date(),
                 'status': 'error',
-                'error': str(e)
+                'error': str(e),
+                'provenance': {'real': 0, 'sample': 0, 'cached': 0, 'real_share': 0.0}
             }
     
+    def start_crawl(self, homepage: str, company_name: str = None, deadline: Optional[float] = None,
+                    skip_website: bool = False) -> CrawlJob:
+        """
+        출처별 공개정보 수집을 병렬로 시작
+        
+        Args:
+            homepage: 기업 홈페이지 URL
+            company_name: 기업명 (선택사항)
+            deadline: 분석 마감 시각 (time.monotonic 기준, 선택사항)
+            skip_website: 웹사이트 수집 생략 여부
+            
+        Returns:
+            CrawlJob: 진행 중인 수집 작업
+        """
+        company_name, collectors, website_note = self._prepare_collectors(homepage, company_name, deadline, skip_website)
+        return CrawlJob(self, company_name, homepage, collectors, website_note)
+    
+    def _prepare_collectors(self, homepage: str, company_name: Optional[str], deadline: Optional[float],
+                            skip_website: bool) -> Tuple[str, Dict[str, Callable[[], object]], Optional[str]]:
+        """출처별 수집 함수 구성 (기업명, 수집 함수, 웹사이트 생략 안내문)"""
+        # 기업명 추출
+        if not company_name:
+            company_name = self._extract_company_name(homepage)
+        
+        print(f"🔍 {company_name} 공개정보 수집 시작...")
+        
+        collectors: Dict[str, Callable[[], object]] = {
+            'news': lambda: self.news_service.fetch_news(company_name, homepage),
+            'dart': lambda: self.dart_service.fetch_filings(company_name, os.getenv('DART_API_KEY'))
+        }
+        website_note = None
+        if skip_website:
+            print("⏭️ 홈페이지 접속 불가로 웹사이트 수집 생략")
+            website_note = '사전 점검에서 홈페이지에 접속할 수 없어 웹사이트 정보를 수집하지 않았습니다.'
+        else:
+            collectors['website'] = lambda: self.web_scraper.scrape_website(homepage, deadline)
+        # 소셜 미디어 수집 (더미 데이터)
+        collectors['social'] = lambda: self._get_sample_social(company_name)
+        return company_name, collectors, website_note
+    
+    def _collect(self, name: str, collector: Callable[[], object]):
+        """출처 1개 수집 (실패 시 빈 값)"""
+        icon, label, default = self.SOURCES[name]
+        try:
+            print(f"{icon} {label} 수집 중...")
+            data = collector()
+            if isinstance(data, list):
+                print(f"✅ {label} {len(data)}건 수집 완료")
+            else:
+                print(f"✅ {label} 수집 완료")
+            return data
+        except Exception as e:
+            print(f"❌ {label} 수집 실패: {str(e)}")
+            return default()
+    
     def _extract_company_name(self, homepage: str) -> str:
         """홈페이지 URL에서 기업명 추출"""
         import re
@@ -126,6 +240,29 @@ class CrawlerService:
         except Exception:
             return 'Unknown Company'
     
+    def _summarize_provenance(self, results: Dict) -> Dict:
+        """
+        수집 항목별 출처 집계
+        
+        소셜 미디어는 항상 샘플 데이터이고 프롬프트에 건수만 들어가므로 비율 계산에서 제외하며,
+        캐시된 웹사이트 정보는 실제 수집 결과이므로 실데이터로 계산
+        """
+        items = list(results.get('news', [])) + list(results.get('dart', []))
+        if results.get('website'):
+            items.append(results['website'])
+        
+        counts = {'real': 0, 'sample': 0, 'cached': 0}
+        for item in items:
+            provenance = item.setdefault('provenance', 'real')
+            counts[provenance] = counts.get(provenance, 0) + 1
+        for item in results.get('social', []):
+            item.setdefault('provenance', 'sample')
+        
+        # 수집된 항목이 없으면 샘플로 대체된 것도 없으므로 축소 분석 대상이 아님
+        total = sum(counts.values())
+        counts['real_share'] = round((counts['real'] + counts['cached']) / total, 3) if total else 1.0
+        return counts
+    
     def _get_sample_social(self, company_name: str) -> List[Dict]:
         """샘플 소셜 미디어 데이터 생성"""
         return [
@@ -134,6 +271,7 @@ class CrawlerService:
                 'url': f'https://social.example.com/{company_name}/1',
                 'snippet': '고객 만족/불만, 평판 이슈 요약.',
                 'source': 'social',
+                'provenance': 'sample',
                 'date': '2024-01-12'
             },
             {
@@ -141,6 +279,7 @@ class CrawlerService:
                 'url': f'https://social.example.com/{company_name}/2',
                 'snippet': '브랜드 인지도 및 고객 피드백.',
                 'source': 'social',
+                'provenance': 'sample',
                 'date': '2024-01-10'
             }
         ]
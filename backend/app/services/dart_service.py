@@ -185,7 +185,8 @@ class DartService:
                     'source': 'dart',
                     'date': item.get('rcept_dt', ''),
                     'type': item.get('report_nm', ''),
-                    'rcp_no': item.get('rcept_no', '')
+                    'rcp_no': item.get('rcept_no', ''),
+                    'provenance': 'real'
                 }
                 filings.append(filing)
             
@@ -205,6 +206,7 @@ class DartService:
                 'source': 'dart',
                 'date': '2024-01-15',
                 'type': '정기공시',
+                'provenance': 'sample',
                 'rcp_no': '20240115000001'
             },
             {
@@ -214,6 +216,7 @@ class DartService:
                 'source': 'dart',
                 'date': '2024-01-10',
                 'type': '수시공시',
+                'provenance': 'sample',
                 'rcp_no': '20240110000002'
             },
             {
@@ -223,6 +226,7 @@ class DartService:
                 'source': 'dart',
                 'date': '2024-01-05',
                 'type': '기타공시',
+                'provenance': 'sample',
                 'rcp_no': '20240105000003'
             }
         ][:limit]
@@ -9,6 +9,11 @@ from app.database.connection import db_connection
 from app.models.company import Company
 from app.models.consultant import Consultant
 from app.models.analysis import Analysis
+from .metrics import metrics
+
+# 추천 응답에 필요한 컨설턴트 열
+CONSULTANT_COLUMNS = ('id, name, email, phone, industry, region, years_experience, certifications, '
+                      'certification_ids, description, rating, status')
 
 class DatabaseService:
     """데이터베이스 서비스 클래스"""
@@ -116,6 +121,7 @@ class DatabaseService:
                 query = query.contains('certifications', [certification])
             
             result = query.execute()
+            metrics.observe('consultants.rows_transferred', len(result.data))
             
             return [Consultant.from_dict(item) for item in result.data]
             
@@ -123,6 +129,60 @@ class DatabaseService:
             print(f"❌ 컨설턴트 조회 실패: {str(e)}")
             return self._get_consultants_mock(industry, certification, region)
     
+    def load_active_consultants(self) -> Optional[List[Consultant]]:
+        """
+        활성 컨설턴트 전체 조회 (색인 적재용)
+        
+        로컬 모드는 예시 데이터를 돌려주지만, DB 조회가 실패하면 예시 데이터로 대체하지 않고 None 반환
+        """
+        if not self.is_available():
+            return self._get_consultants_mock()
+        
+        try:
+            result = self.client.table('consultants').select('*').eq('status', 'active').execute()
+            metrics.observe('consultants.rows_transferred', len(result.data))
+            
+            return [Consultant.from_dict(item) for item in result.data]
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 전체 조회 실패: {str(e)}")
+            return None
+    
+    def search_consultants(self, industry: str = '', certification_ids: Optional[List[int]] = None, region: str = '',
+                           min_experience: int = 0, limit: int = 100) -> Optional[List[Consultant]]:
+        """
+        DB 함수 search_consultants로 기준별 추천 후보 조회 (요청 인증과 겹치는 수 내림차순·id 순, 최대 limit명)
+        
+        Args:
+            industry: 업종 (일치)
+            certification_ids: 인증 카탈로그 ID (하나 이상 보유)
+            region: 지역 (일치)
+            min_experience: 최소 경력
+            limit: 최대 조회 수
+            
+        Returns:
+            Optional[List[Consultant]]: 컨설턴트 목록 (사용 불가·실패 시 None)
+        """
+        if not self.is_available():
+            return None
+        
+        try:
+            result = self.client.rpc('search_consultants', {
+                'p_certification_ids': certification_ids or [],
+                'p_industry': industry or None,
+                'p_region': region or None,
+                'p_min_experience': min_experience,
+                'p_limit': limit
+            }).execute()
+            rows = result.data or []
+            metrics.observe('consultants.rows_transferred', len(rows))
+            
+            return [Consultant.from_dict(item) for item in rows]
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 검색 실패: {str(e)}")
+            return None
+    
     def get_consultant_by_id(self, consultant_id: int) -> Optional[Consultant]:
         """ID로 컨설턴트 조회"""
         if not self.is_available():
@@ -139,6 +199,77 @@ class DatabaseService:
             print(f"❌ 컨설턴트 조회 실패: {str(e)}")
             return None
     
+    def get_consultants_by_ids(self, consultant_ids: List[int]) -> Optional[List[Consultant]]:
+        """ID 목록으로 컨설턴트 조회 (한 번의 쿼리, 사용 불가·실패 시 None)"""
+        if not self.is_available():
+            return None
+        if not consultant_ids:
+            return []
+        
+        try:
+            result = self.client.table('consultants').select(CONSULTANT_COLUMNS).in_('id', consultant_ids).execute()
+            metrics.observe('consultants.rows_transferred', len(result.data))
+            
+            return [Consultant.from_dict(item) for item in result.data]
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 목록 조회 실패: {str(e)}")
+            return None
+    
+    def get_consultants_stamp(self) -> Optional[datetime]:
+        """컨설턴트 updated_at 최댓값 (한 행만 조회, 사용 불가·실패·빈 테이블이면 None)"""
+        if not self.is_available():
+            return None
+        
+        try:
+            result = self.client.table('consultants').select('updated_at') \
+                .order('updated_at', desc=True).limit(1).execute()
+            
+            if result.data and result.data[0].get('updated_at'):
+                return datetime.fromisoformat(result.data[0]['updated_at'])
+            return None
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 변경 시각 조회 실패: {str(e)}")
+            return None
+    
+    def get_consultants_updated_since(self, since: str) -> List[Consultant]:
+        """updated_at이 since 이후인 컨설턴트 조회 (상태 무관, updated_at 순)"""
+        if not self.is_available():
+            return []
+        
+        try:
+            result = self.client.table('consultants').select('*').gt('updated_at', since).order('updated_at').execute()
+            metrics.observe('consultants.rows_transferred', len(result.data))
+            
+            return [Consultant.from_dict(item) for item in result.data]
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 변경분 조회 실패: {str(e)}")
+            return []
+    
+    def match_consultants(self, certification_ids: List[int], certification_count: int, industry: Optional[str] = None,
+                          region: Optional[str] = None, limit: int = 5, min_score: float = 0.3) -> Optional[List[Dict]]:
+        """DB 함수 match_consultants로 상위 매칭 조회 (사용 불가·실패 시 None)"""
+        if not self.is_available():
+            return None
+        
+        try:
+            result = self.client.rpc('match_consultants', {
+                'p_certification_ids': certification_ids,
+                'p_certification_count': certification_count,
+                'p_industry': industry,
+                'p_region': region,
+                'p_limit': limit,
+                'p_min_score': min_score
+            }).execute()
+            
+            return result.data or []
+            
+        except Exception as e:
+            print(f"❌ 컨설턴트 매칭 함수 호출 실패: {str(e)}")
+            return None
+    
     # Analysis CRUD
     def create_analysis(self, analysis: Analysis) -> Optional[Analysis]:
         """분석 결과 생성"""
@@ -191,6 +322,99 @@ class DatabaseService:
             print(f"❌ 최신 분석 결과 조회 실패: {str(e)}")
             return None
     
+    def list_analyses(self, after_id: int = 0, limit: int = 100) -> List[Analysis]:
+        """분석 결과 목록 조회 (id 순, after_id 이후부터)"""
+        if not self.is_available():
+            return []
+        
+        try:
+            result = self.client.table('analyses').select('*').gt('id', after_id).order('id').limit(limit).execute()
+            
+            return [Analysis.from_dict(item) for item in result.data]
+            
+        except Exception as e:
+            print(f"❌ 분석 결과 목록 조회 실패: {str(e)}")
+            return []
+    
+    def get_analyses_by_ids(self, analysis_ids: List[int]) -> List[Analysis]:
+        """id 목록으로 분석 결과 조회 (id 순)"""
+        if not self.is_available() or not analysis_ids:
+            return []
+        
+        try:
+            result = self.client.table('analyses').select('*').in_('id', analysis_ids).order('id').execute()
+            
+            return [Analysis.from_dict(item) for item in result.data]
+            
+        except Exception as e:
+            print(f"❌ 분석 결과 조회 실패: {str(e)}")
+            return []
+    
+    def update_analysis_result(self, analysis_id: int, fields: Dict[str, Any]) -> bool:
+        """분석 결과 필드 갱신 (같은 값으로 다시 갱신해도 결과가 같음)"""
+        if not self.is_available():
+            return False
+        
+        try:
+            data = dict(fields, updated_at=datetime.now().isoformat())
+            result = self.client.table('analyses').update(data).eq('id', analysis_id).execute()
+            
+            return bool(result.data)
+            
+        except Exception as e:
+            print(f"❌ 분석 결과 갱신 실패: {str(e)}")
+            return False
+    
+    # Match CRUD
+    def replace_matches(self, analysis_id: int, company_id: Optional[int], matches: List[Dict[str, Any]],
+                        directory_stamp: Optional[str] = None) -> bool:
+        """
+        분석 결과의 매칭 기록 교체 (matches 항목: consultant_id, match_score)
+        
+        (analysis_id, match_rank) 고유 색인 기준으로 순위별 행을 덮어쓴 뒤 새 기록보다 낮은 순위만 삭제하므로
+        동시에 교체해도 순위가 중복되지 않고, 입력이 실패하면 기존 기록이 남음
+        """
+        if not self.is_available():
+            return False
+        
+        try:
+            if matches:
+                now = datetime.now().isoformat()
+                rows = [{
+                    'analysis_id': analysis_id,
+                    'company_id': company_id,
+                    'consultant_id': match['consultant_id'],
+                    'match_score': match['match_score'],
+                    'match_rank': rank,
+                    'directory_stamp': directory_stamp,
+                    'updated_at': now
+                } for rank, match in enumerate(matches, 1)]
+                result = self.client.table('matches').upsert(rows, on_conflict='analysis_id,match_rank').execute()
+                if not result.data:
+                    return False
+            
+            self.client.table('matches').delete().eq('analysis_id', analysis_id).gt('match_rank', len(matches)).execute()
+            return True
+            
+        except Exception as e:
+            print(f"❌ 매칭 기록 저장 실패: {str(e)}")
+            return False
+    
+    def get_matches(self, analysis_id: int) -> Optional[List[Dict]]:
+        """분석 결과의 매칭 기록 (순위 순, 사용 불가·실패 시 None)"""
+        if not self.is_available():
+            return None
+        
+        try:
+            result = self.client.table('matches').select('consultant_id, match_score, match_rank, directory_stamp') \
+                .eq('analysis_id', analysis_id).order('match_rank').execute()
+            
+            return result.data or []
+            
+        except Exception as e:
+            print(f"❌ 매칭 기록 조회 실패: {str(e)}")
+            return None
+    
     # Mock methods for when database is not available
     def _create_company_mock(self, company: Company) -> Company:
         """기업 생성 모의 구현"""
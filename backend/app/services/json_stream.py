@@ -0,0 +1,99 @@
+"""
+스트리밍 JSON 점진 파싱
+토큰 단위로 들어오는 JSON 객체에서 완성된 최상위 필드를 바로 꺼냄
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체 점진 파서 클래스
+
+    예) '{"summary": "..."' 까지 들어오면 summary는 아직 미완성,
+        '{"summary": "...", "ri' 까지 들어오면 ('summary', '...') 반환
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.position = 0
+        self.started = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.key: Optional[str] = None
+        self.key_start: Optional[int] = None
+        self.value_start: Optional[int] = None
+        self.fields: dict = {}
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        청크 추가 후 새로 완성된 최상위 필드 반환
+
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+
+        Returns:
+            List[Tuple[str, Any]]: (필드명, 값) 목록
+        """
+        self.buffer += chunk
+        completed = []
+
+        while self.position < len(self.buffer) and not self.finished:
+            char = self.buffer[self.position]
+            index = self.position
+            self.position += 1
+
+            if not self.started:
+                # 여는 중괄호 이전의 텍스트(코드 블록 표시 등)는 무시
+                if char == '{':
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.key is None and self.key_start is not None:
+                        self.key = json.loads(self.buffer[self.key_start:index + 1])
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1 and self.key is None and self.value_start is None:
+                    self.key_start = index
+                continue
+
+            if self.depth == 1 and char == ':' and self.key is not None and self.value_start is None:
+                self.value_start = index + 1
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    self._complete_field(index, completed)
+                    self.finished = True
+            elif char == ',' and self.depth == 1:
+                self._complete_field(index, completed)
+
+        return completed
+
+    def _complete_field(self, end: int, completed: List[Tuple[str, Any]]):
+        """값 구간 파싱 후 필드 확정"""
+        if self.key is not None and self.value_start is not None:
+            raw = self.buffer[self.value_start:end].strip()
+            try:
+                value = json.loads(raw)
+            except ValueError:
+                value = None
+            if value is not None or raw == 'null':
+                self.fields[self.key] = value
+                completed.append((self.key, value))
+
+        self.key = None
+        self.key_start = None
+        self.value_start = None
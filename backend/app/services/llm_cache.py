@@ -0,0 +1,152 @@
+"""
+LLM 응답 캐시
+모델·파라미터·프롬프트 지문을 키로 SQLite에 응답을 저장 (TTL, 최대 건수 초과 시 LRU 제거)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from app.config import Config
+from .metrics import metrics
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시 클래스"""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.db_path = Config.LLM_CACHE_PATH if db_path is None else db_path
+        self.ttl_seconds = Config.LLM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_entries = Config.LLM_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.enabled = bool(self.db_path)
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            try:
+                self._init_db()
+            except Exception as e:
+                print(f"⚠️ LLM 응답 캐시 초기화 실패: {str(e)}")
+                self.enabled = False
+
+    @staticmethod
+    def fingerprint(model: str, messages: List[Dict], params: Dict) -> str:
+        """
+        요청 지문 계산
+
+        Args:
+            model: 모델명
+            messages: 채팅 메시지 목록
+            params: temperature, max_tokens 등 생성 파라미터
+
+        Returns:
+            str: SHA-256 지문
+        """
+        payload = json.dumps({'model': model, 'messages': messages, 'params': params},
+                             ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시된 응답 조회 (만료된 항목은 삭제)
+
+        Returns:
+            Optional[Dict]: {'content': 응답 본문, 'total_tokens': 사용 토큰 수}
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            now = time.time()
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    'SELECT content, total_tokens, created_at FROM llm_responses WHERE key = ?', (key,)
+                ).fetchone()
+
+                if row and now - row[2] > self.ttl_seconds:
+                    conn.execute('DELETE FROM llm_responses WHERE key = ?', (key,))
+                    row = None
+
+                if row:
+                    conn.execute('UPDATE llm_responses SET accessed_at = ? WHERE key = ?', (now, key))
+
+            if not row:
+                metrics.increment('llm_cache.misses')
+                return None
+
+            metrics.increment('llm_cache.hits')
+            metrics.increment('llm_cache.tokens_saved', row[1])
+            return {'content': row[0], 'total_tokens': row[1]}
+
+        except Exception as e:
+            print(f"⚠️ LLM 응답 캐시 조회 실패: {str(e)}")
+            return None
+
+    def set(self, key: str, model: str, content: str, total_tokens: int = 0):
+        """응답 저장 후 최대 건수를 넘으면 오래 사용되지 않은 항목부터 제거"""
+        if not self.enabled:
+            return
+
+        try:
+            now = time.time()
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO llm_responses (key, model, content, total_tokens, created_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, model, content, total_tokens or 0, now, now)
+                )
+                conn.execute('DELETE FROM llm_responses WHERE created_at < ?', (now - self.ttl_seconds,))
+                conn.execute(
+                    'DELETE FROM llm_responses WHERE key IN ('
+                    'SELECT key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+        except Exception as e:
+            print(f"⚠️ LLM 응답 캐시 저장 실패: {str(e)}")
+
+    def delete(self, key: str):
+        """항목 삭제 (사용할 수 없는 응답이 캐시된 경우)"""
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute('DELETE FROM llm_responses WHERE key = ?', (key,))
+        except Exception as e:
+            print(f"⚠️ LLM 응답 캐시 삭제 실패: {str(e)}")
+
+    def count(self) -> int:
+        """저장된 항목 수"""
+        if not self.enabled:
+            return 0
+
+        with self._lock, self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM llm_responses').fetchone()[0]
+
+    @contextmanager
+    def _connect(self):
+        """요청마다 새 연결 사용 (정상 종료 시 커밋)"""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """테이블 생성"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS llm_responses ('
+                'key TEXT PRIMARY KEY, model TEXT, content TEXT NOT NULL, '
+                'total_tokens INTEGER DEFAULT 0, created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses (accessed_at)')
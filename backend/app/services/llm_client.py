@@ -0,0 +1,292 @@
+"""
+LLM 호출 클라이언트
+프로세스 단위 동시 호출 제한과 429/5xx 재시도(retry-after, rate-limit 헤더 반영)를 담당
+"""
+
+import re
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterator, Optional
+from openai import OpenAI, AsyncOpenAI, APIStatusError, APIConnectionError, APITimeoutError
+from app.config import Config
+from .metrics import metrics
+
+# 동기·비동기 호출이 함께 사용하는 프로세스 단위 동시 호출 제한
+llm_semaphore = threading.BoundedSemaphore(Config.LLM_MAX_CONCURRENCY)
+
+RATE_LIMIT_RESET_HEADERS = ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+DURATION_PART_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+class LLMDeadlineExceeded(Exception):
+    """마감 시각 안에 재시도할 수 없는 경우"""
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """
+    응답 사용량 중 제공자 프롬프트 캐시에서 처리된 입력 토큰 수
+
+    구버전 SDK는 prompt_tokens_details를 정의하지 않아 dict로 남으므로 두 형태 모두 처리
+    """
+    details = getattr(usage, 'prompt_tokens_details', None)
+    if details is None and isinstance(usage, dict):
+        details = usage.get('prompt_tokens_details')
+    if isinstance(details, dict):
+        return int(details.get('cached_tokens') or 0)
+    return int(getattr(details, 'cached_tokens', 0) or 0)
+
+def parse_retry_delay(headers) -> Optional[float]:
+    """
+    응답 헤더에서 재시도 대기 시간 추출
+
+    Args:
+        headers: 응답 헤더 (retry-after-ms, retry-after, x-ratelimit-reset-*)
+
+    Returns:
+        Optional[float]: 대기 시간(초), 헤더가 없으면 None
+    """
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # "6m0s", "1.5s", "20ms" 형식
+    resets = []
+    for name in RATE_LIMIT_RESET_HEADERS:
+        value = headers.get(name)
+        if value:
+            parts = DURATION_PART_PATTERN.findall(value)
+            if parts:
+                resets.append(sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts))
+    return max(resets) if resets else None
+
+class LLMClient:
+    """OpenAI 호환 LLM 클라이언트 클래스"""
+
+    RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_attempts: Optional[int] = None, timeout: Optional[float] = None,
+                 semaphore: Optional[threading.BoundedSemaphore] = None):
+        self.api_key = api_key or Config.OPENAI_API_KEY
+        self.base_url = base_url or Config.OPENAI_BASE_URL or None
+        self.max_attempts = max_attempts or Config.LLM_MAX_ATTEMPTS
+        self.timeout = timeout or Config.LLM_REQUEST_TIMEOUT
+        self.max_backoff = Config.LLM_RETRY_MAX_BACKOFF
+        self.semaphore = semaphore or llm_semaphore
+
+        # SDK 자체 재시도는 끄고 여기서 마감 시각 기준으로 재시도
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url,
+                             max_retries=0, timeout=self.timeout)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """비동기 클라이언트 (처음 사용할 때 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url,
+                                             max_retries=0, timeout=self.timeout)
+        return self._async_client
+
+    def complete(self, deadline: Optional[float] = None, **kwargs) -> Any:
+        """
+        채팅 완성 요청 (동기)
+
+        Args:
+            deadline: 마감 시각 (time.monotonic 기준, 선택사항)
+            **kwargs: chat.completions.create 인자
+
+        Returns:
+            ChatCompletion: 응답 객체
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.monotonic()
+            acquired = self.semaphore.acquire(timeout=self._remaining(deadline))
+            self._record_queue_wait(started, acquired)
+            if not acquired:
+                raise LLMDeadlineExceeded('LLM 동시 호출 대기 중 마감 시각 초과')
+
+            try:
+                request_started = time.monotonic()
+                response = self.client.chat.completions.create(
+                    timeout=self._request_timeout(deadline), **kwargs
+                )
+                self._record_success(request_started, response.usage)
+                return response
+            except Exception as e:
+                metrics.increment('llm.errors')
+                delay = self._retry_delay(e, attempt, deadline)
+            finally:
+                self.semaphore.release()
+
+            time.sleep(delay)
+
+    def stream(self, deadline: Optional[float] = None, **kwargs) -> Iterator[str]:
+        """
+        채팅 완성 스트리밍 요청 (첫 응답 전 오류만 재시도)
+
+        Args:
+            deadline: 마감 시각 (time.monotonic 기준, 선택사항)
+            **kwargs: chat.completions.create 인자
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        # 마지막 조각으로 사용량(캐시된 토큰 수 포함)을 받음
+        extra_body = dict(kwargs.pop('extra_body', None) or {}, stream_options={'include_usage': True})
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.monotonic()
+            acquired = self.semaphore.acquire(timeout=self._remaining(deadline))
+            self._record_queue_wait(started, acquired)
+            if not acquired:
+                raise LLMDeadlineExceeded('LLM 동시 호출 대기 중 마감 시각 초과')
+
+            request_started = time.monotonic()
+            try:
+                response_stream = self.client.chat.completions.create(
+                    stream=True, timeout=self._request_timeout(deadline), extra_body=extra_body, **kwargs
+                )
+            except Exception as e:
+                self.semaphore.release()
+                metrics.increment('llm.errors')
+                time.sleep(self._retry_delay(e, attempt, deadline))
+                continue
+
+            # 스트림을 다 읽을 때까지 동시 호출 슬롯 유지
+            try:
+                usage = None
+                first_token = True
+                for chunk in response_stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        if first_token:
+                            metrics.observe('llm.time_to_first_token_ms', (time.monotonic() - request_started) * 1000)
+                            first_token = False
+                        yield chunk.choices[0].delta.content
+                    usage = getattr(chunk, 'usage', None) or usage
+                self._record_success(request_started, usage)
+                return
+            except Exception:
+                metrics.increment('llm.errors')
+                raise
+            finally:
+                self.semaphore.release()
+
+    async def acomplete(self, deadline: Optional[float] = None, **kwargs) -> Any:
+        """채팅 완성 요청 (비동기, 동시 호출 제한은 동기 호출과 공유)"""
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.monotonic()
+            acquired = await self._acquire_async(deadline)
+            self._record_queue_wait(started, acquired)
+            if not acquired:
+                raise LLMDeadlineExceeded('LLM 동시 호출 대기 중 마감 시각 초과')
+
+            try:
+                request_started = time.monotonic()
+                response = await self.async_client.chat.completions.create(
+                    timeout=self._request_timeout(deadline), **kwargs
+                )
+                self._record_success(request_started, response.usage)
+                return response
+            except Exception as e:
+                metrics.increment('llm.errors')
+                delay = self._retry_delay(e, attempt, deadline)
+            finally:
+                self.semaphore.release()
+
+            await asyncio.sleep(delay)
+
+    async def _acquire_async(self, deadline: Optional[float]) -> bool:
+        """이벤트 루프를 막지 않고 세마포어 획득"""
+        while not self.semaphore.acquire(blocking=False):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: Optional[float]) -> float:
+        """재시도 대기 시간 계산 (재시도 불가 시 예외 재발생)"""
+        status_code = getattr(error, 'status_code', None)
+        retryable = isinstance(error, (APIConnectionError, APITimeoutError)) or status_code in self.RETRYABLE_STATUS
+        if not retryable or attempt >= self.max_attempts:
+            metrics.increment('llm.failures')
+            raise error
+
+        hinted = None
+        if isinstance(error, APIStatusError):
+            hinted = parse_retry_delay(error.response.headers)
+
+        if hinted is not None:
+            # 서버가 알려준 시각에 여러 요청이 몰리지 않도록 약간의 지연 추가
+            delay = min(hinted, self.max_backoff) + random.uniform(0, 0.1 * max(hinted, 0.1))
+        else:
+            delay = random.uniform(0, min(self.max_backoff, 0.5 * 2 ** (attempt - 1)))
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            metrics.increment('llm.failures')
+            raise LLMDeadlineExceeded(f'재시도 대기({delay:.2f}초)가 마감 시각을 초과합니다: {error}') from error
+
+        metrics.increment('llm.retries')
+        metrics.increment(f'llm.retries.{status_code or type(error).__name__}')
+        print(f"🔁 LLM 호출 재시도 {attempt}/{self.max_attempts - 1} ({status_code or type(error).__name__}, {delay:.2f}초 후)")
+        return delay
+
+    def _request_timeout(self, deadline: Optional[float]) -> float:
+        """요청 타임아웃 (마감 시각까지 남은 시간 이내)"""
+        remaining = self._remaining(deadline)
+        return self.timeout if remaining is None else max(0.1, min(self.timeout, remaining))
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """마감 시각까지 남은 시간"""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    @staticmethod
+    def _record_queue_wait(started: float, acquired: bool):
+        """동시 호출 대기 시간 기록"""
+        metrics.observe('llm.queue_wait_ms', (time.monotonic() - started) * 1000)
+        if not acquired:
+            metrics.increment('llm.queue_timeouts')
+
+    @staticmethod
+    def _record_success(request_started: float, usage: Any = None):
+        """성공 요청 지표 기록 (프롬프트 캐시 적중 여부별 지연 시간 포함)"""
+        latency_ms = (time.monotonic() - request_started) * 1000
+        metrics.increment('llm.requests')
+        metrics.observe('llm.latency_ms', latency_ms)
+        if usage is None:
+            return
+
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        cached_tokens = cached_prompt_tokens(usage)
+        metrics.increment('llm.prompt_tokens', prompt_tokens)
+        metrics.increment('llm.cached_tokens', cached_tokens)
+        metrics.observe('llm.latency_ms.prefix_cached' if cached_tokens else 'llm.latency_ms.prefix_uncached', latency_ms)
+        total_prompt_tokens = metrics.get_counter('llm.prompt_tokens')
+        if total_prompt_tokens:
+            metrics.set_gauge('llm.prompt_cache_hit_ratio',
+                              round(metrics.get_counter('llm.cached_tokens') / total_prompt_tokens, 3))
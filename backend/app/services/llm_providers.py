@@ -0,0 +1,112 @@
+"""
+LLM 공급자 및 모델 라우팅
+OpenAI 호환 공급자별 접속 정보·타임아웃과 작업·프롬프트 크기별 모델 선택 규칙
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from .llm_client import LLMClient
+from app.config import Config
+
+@dataclass
+class LLMProvider:
+    """LLM 공급자 모델 (OpenAI 호환 엔드포인트)"""
+    name: str
+    base_url: Optional[str] = None
+    api_key: Optional[str] = None
+    timeout: float = 30
+    max_attempts: Optional[int] = None
+
+@dataclass
+class RouteRule:
+    """모델 선택 규칙 모델 (조건을 생략하면 모든 요청에 해당)"""
+    provider: str
+    model: str
+    task: Optional[str] = None
+    max_prompt_tokens: Optional[int] = None
+
+    def matches(self, task: str, prompt_tokens: int) -> bool:
+        """규칙 해당 여부"""
+        if self.task and self.task != task:
+            return False
+        if self.max_prompt_tokens is not None and prompt_tokens > self.max_prompt_tokens:
+            return False
+        return True
+
+@dataclass
+class Route:
+    """선택된 공급자와 모델"""
+    provider: LLMProvider
+    model: str
+
+class LLMRouter:
+    """LLM 공급자·모델 라우팅 클래스"""
+
+    def __init__(self, providers: Dict[str, LLMProvider], rules: Optional[List[RouteRule]] = None,
+                 default_provider: str = 'openai', default_model: str = 'gpt-4o-mini'):
+        if default_provider not in providers:
+            raise ValueError(f'알 수 없는 기본 LLM 공급자: {default_provider}')
+        for rule in rules or []:
+            if rule.provider not in providers:
+                raise ValueError(f'알 수 없는 LLM 공급자: {rule.provider}')
+
+        self.providers = providers
+        self.rules = rules or []
+        self.default = Route(providers[default_provider], default_model)
+        self._clients: Dict[str, LLMClient] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'LLMRouter':
+        """
+        설정에서 라우터 생성
+
+        LLM_PROVIDERS(JSON 객체)로 공급자를 추가·변경하고 LLM_ROUTES(JSON 배열)로 규칙을 지정.
+        openai 공급자는 OPENAI_API_KEY·OPENAI_BASE_URL·LLM_REQUEST_TIMEOUT으로 항상 등록됨
+        """
+        providers = {
+            'openai': LLMProvider('openai', Config.OPENAI_BASE_URL or None, Config.OPENAI_API_KEY,
+                                  Config.LLM_REQUEST_TIMEOUT)
+        }
+        for name, options in json.loads(Config.LLM_PROVIDERS or '{}').items():
+            providers[name] = LLMProvider(
+                name,
+                options.get('base_url'),
+                options.get('api_key', Config.OPENAI_API_KEY if name == 'openai' else None),
+                float(options.get('timeout', Config.LLM_REQUEST_TIMEOUT)),
+                options.get('max_attempts')
+            )
+        rules = [RouteRule(**rule) for rule in json.loads(Config.LLM_ROUTES or '[]')]
+        return cls(providers, rules, Config.LLM_DEFAULT_PROVIDER, Config.LLM_DEFAULT_MODEL)
+
+    def route(self, task: str, prompt_tokens: int = 0) -> Route:
+        """
+        요청에 사용할 공급자와 모델 선택 (처음 해당하는 규칙, 없으면 기본값)
+
+        Args:
+            task: 작업 종류 (analysis, digest, batch)
+            prompt_tokens: 입력 토큰 수
+
+        Returns:
+            Route: 공급자와 모델
+        """
+        for rule in self.rules:
+            if rule.matches(task, prompt_tokens):
+                return Route(self.providers[rule.provider], rule.model)
+        return self.default
+
+    def client(self, provider: LLMProvider) -> Optional[LLMClient]:
+        """공급자별 클라이언트 (처음 사용할 때 생성, API 키가 없으면 None)"""
+        if not provider.api_key:
+            return None
+        with self._lock:
+            if provider.name not in self._clients:
+                self._clients[provider.name] = LLMClient(
+                    api_key=provider.api_key,
+                    base_url=provider.base_url,
+                    max_attempts=provider.max_attempts,
+                    timeout=provider.timeout
+                )
+            return self._clients[provider.name]
@@ -4,9 +4,14 @@
 
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
+import numpy as np
 from app.models.consultant import Consultant
 from app.models.analysis import Analysis
+from app.config import Config
 from .database_service import DatabaseService
+from .certification_catalog import certification_catalog
+from .consultant_matrix import ConsultantMatrix, EXPERIENCE_LEVELS
+from .consultant_index import consultant_index
 
 @dataclass
 class MatchResult:
@@ -24,6 +29,7 @@ class MatchingService:
     
     def __init__(self):
         self.db_service = DatabaseService()
+        self.backend = Config.MATCHING_BACKEND
         
         # 매칭 가중치 설정
         self.weights = {
@@ -41,7 +47,7 @@ class MatchingService:
             'expert': 1.2     # 13년 이상
         }
     
-    def find_matches(self, analysis: Analysis, limit: int = 5) -> List[MatchResult]:
+    def find_matches(self, analysis: Analysis, limit: int = 5) -> Optional[List[MatchResult]]:
         """
         분석 결과를 바탕으로 컨설턴트 매칭
         
@@ -50,34 +56,122 @@ class MatchingService:
             limit: 반환할 매칭 수
             
         Returns:
-            List[MatchResult]: 매칭된 컨설턴트 목록
+            Optional[List[MatchResult]]: 매칭된 컨설턴트 목록 (매칭할 컨설턴트가 없거나 오류가 나면 None)
         """
         try:
-            # 모든 활성 컨설턴트 조회
-            consultants = self.db_service.get_consultants()
+            # DB 함수로 상위 결과만 조회 (실패하면 메모리 색인 사용)
+            if self.backend == 'database':
+                matches = self.find_matches_in_database(analysis, limit)
+                if matches is not None:
+                    return matches
             
-            if not consultants:
-                print("⚠️ 매칭할 컨설턴트가 없습니다.")
-                return []
-            
-            # 매칭 점수 계산
-            matches = []
-            for consultant in consultants:
-                match_result = self._calculate_match_score(analysis, consultant)
-                if match_result.match_score > 0.3:  # 최소 30% 이상 매칭
-                    matches.append(match_result)
+            # 모든 활성 컨설턴트 (메모리 색인)
+            matrix = consultant_index.matrix()
             
-            # 점수순으로 정렬
-            matches.sort(key=lambda x: x.match_score, reverse=True)
+            if not len(matrix):
+                print("⚠️ 매칭할 컨설턴트가 없습니다.")
+                return None
             
-            return matches[:limit]
+            return self.find_matches_in(matrix, analysis, limit)
             
         except Exception as e:
             print(f"❌ 매칭 중 오류 발생: {str(e)}")
-            return []
+            return None
+    
+    def find_matches_in(self, matrix: ConsultantMatrix, analysis: Analysis, limit: int = 5) -> List[MatchResult]:
+        """
+        열 지향 컨설턴트 표현에서 매칭 (전체 점수를 한 번에 계산하고 상위 limit개만 결과 생성)
+        
+        Args:
+            matrix: 컨설턴트 열 지향 표현
+            analysis: 분석 결과
+            limit: 반환할 매칭 수
+            
+        Returns:
+            List[MatchResult]: 점수순 매칭 결과 (최소 30% 초과, 동점은 원래 순서)
+        """
+        scores, industry_matches, region_matches = self.score_matrix(matrix, analysis)
+        rows = matrix.top_k(scores, limit, 0.3)
+        
+        return [
+            self._build_match_result(analysis, matrix.consultants[row], float(scores[row]),
+                                     bool(industry_matches[row]), bool(region_matches[row]))
+            for row in rows
+        ]
+    
+    def find_matches_in_database(self, analysis: Analysis, limit: int = 5) -> Optional[List[MatchResult]]:
+        """
+        DB 함수 match_consultants로 매칭 (점수 계산과 상위 limit개 선택을 DB에서 수행)
+        
+        카탈로그에 없는 인증은 DB에 ID가 없으므로 점수에 반영되지 않음
+        
+        Returns:
+            Optional[List[MatchResult]]: 매칭 결과 (DB 사용 불가·실패 시 None)
+        """
+        certifications = analysis.certifications or []
+        rows = self.db_service.match_consultants(
+            certification_catalog.catalog_ids(certifications),
+            len(certifications),
+            self._target_industry(analysis),
+            self._target_region(analysis),
+            limit
+        )
+        if rows is None:
+            return None
+        
+        return [
+            self._build_match_result(analysis, Consultant.from_dict(row), float(row['match_score']),
+                                     bool(row['industry_match']), bool(row['region_match']))
+            for row in rows
+        ]
+    
+    def score_matrix(self, matrix: ConsultantMatrix, analysis: Analysis) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        전체 컨설턴트 매칭 점수 (_calculate_match_score와 같은 계산을 배열 연산으로 수행)
+        
+        Returns:
+            Tuple: (점수, 업종 일치 여부, 지역 일치 여부)
+        """
+        certifications = analysis.certifications or []
+        match_counts = matrix.certification_match_counts(matrix.certification_mask(certifications))
+        certification_scores = match_counts / max(len(certifications), 1)
+        
+        industry_matches = matrix.code_matches(matrix.industry_codes, matrix.industry_ids, self._target_industry(analysis))
+        region_matches = matrix.code_matches(matrix.region_codes, matrix.region_ids, self._target_region(analysis))
+        experience_scores = np.array([self.experience_scores[level] for level in EXPERIENCE_LEVELS])
+        
+        total_scores = (
+            np.where(industry_matches, 1.0, 0.0) * self.weights['industry'] +
+            certification_scores * self.weights['certification'] +
+            np.where(region_matches, 1.0, 0.5) * self.weights['region'] +
+            experience_scores[matrix.experience_codes] * self.weights['experience']
+        )
+        return np.minimum(total_scores, 1.0), industry_matches, region_matches
+    
+    def restore_match(self, analysis: Analysis, consultant: Consultant, score: float) -> MatchResult:
+        """기록된 점수로 매칭 결과 복원 (일치 항목·이유는 다시 생성)"""
+        return self._build_match_result(analysis, consultant, score,
+                                        self._check_industry_match(analysis, consultant),
+                                        self._check_region_match(analysis, consultant))
+    
+    def _build_match_result(self, analysis: Analysis, consultant: Consultant, score: float,
+                            industry_match: bool, region_match: bool) -> MatchResult:
+        """상위 매칭 결과 생성"""
+        certification_matches = self._check_certification_match(analysis, consultant)
+        experience_level = self._get_experience_level(consultant.years_experience)
+        
+        return MatchResult(
+            consultant=consultant,
+            match_score=score,
+            reasons=self._generate_match_reasons(industry_match, certification_matches, region_match, experience_level),
+            industry_match=industry_match,
+            certification_matches=certification_matches,
+            region_match=region_match,
+            experience_level=experience_level
+        )
     
     def _calculate_match_score(self, analysis: Analysis, consultant: Consultant) -> MatchResult:
-        """개별 컨설턴트와의 매칭 점수 계산"""
+        """개별 컨설턴트와의 매칭 점수 계산 (score_matrix의 기준 구현)"""
         
         # 업종 매칭 (분석에서 추론하거나 기본값 사용)
         industry_match = self._check_industry_match(analysis, consultant)
@@ -118,28 +212,34 @@ class MatchingService:
             experience_level=experience_level
         )
     
+    def _target_industry(self, analysis: Analysis) -> Optional[str]:
+        """매칭 대상 업종 (None이면 모든 업종 일치)"""
+        # 실제로는 AI 분석 결과에서 업종을 추출해야 함
+        return None  # 일단 모든 업종 매칭
+    
+    def _target_region(self, analysis: Analysis) -> Optional[str]:
+        """매칭 대상 지역 (None이면 모든 지역 일치)"""
+        return None  # 일단 모든 지역 매칭
+    
     def _check_industry_match(self, analysis: Analysis, consultant: Consultant) -> bool:
         """업종 매칭 확인"""
-        # 분석 결과에서 업종을 추론하거나 기본 매칭
-        # 실제로는 AI 분석 결과에서 업종을 추출해야 함
-        return True  # 일단 모든 업종 매칭
+        industry = self._target_industry(analysis)
+        return not industry or consultant.industry == industry
     
     def _check_certification_match(self, analysis: Analysis, consultant: Consultant) -> List[str]:
-        """인증 매칭 확인"""
-        matches = []
-        analysis_certs = set(analysis.certifications)
-        consultant_certs = set(consultant.certifications)
-        
-        for cert in analysis_certs:
-            if cert in consultant_certs:
-                matches.append(cert)
+        """인증 매칭 확인 (인증 카탈로그 ID 기준, 분석 결과 순서의 정식 명칭)"""
+        consultant_certs = set(certification_catalog.intern_all(consultant.certifications))
         
-        return matches
+        return [
+            certification_catalog.name(certification_id)
+            for certification_id in certification_catalog.intern_all(analysis.certifications, assign=False)
+            if certification_id in consultant_certs
+        ]
     
     def _check_region_match(self, analysis: Analysis, consultant: Consultant) -> bool:
         """지역 매칭 확인"""
-        # 분석 결과에서 지역을 추론하거나 기본 매칭
-        return True  # 일단 모든 지역 매칭
+        region = self._target_region(analysis)
+        return not region or consultant.region == region
     
     def _get_experience_level(self, years: int) -> str:
         """경력 수준 분류"""
@@ -0,0 +1,83 @@
+"""
+서비스 지표 수집
+카운터, 게이지, 소요 시간 통계를 프로세스 단위로 집계
+"""
+
+import threading
+from typing import Callable, Dict
+
+class MetricsRegistry:
+    """지표 저장소 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._observations: Dict[str, Dict] = {}
+        self._collectors: Dict[str, Callable[[], Dict]] = {}
+
+    def increment(self, name: str, value: float = 1):
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float):
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float):
+        """관측값 기록 (건수, 합계, 최댓값)"""
+        with self._lock:
+            stats = self._observations.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            stats['count'] += 1
+            stats['total'] += value
+            stats['max'] = max(stats['max'], value)
+
+    def register_collector(self, name: str, collector: Callable[[], Dict]):
+        """조회 시점에 상태를 제공하는 수집기 등록"""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def get_counter(self, name: str) -> float:
+        """카운터 값 조회"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict:
+        """전체 지표 조회"""
+        with self._lock:
+            observations = {
+                name: {
+                    'count': stats['count'],
+                    'total': round(stats['total'], 3),
+                    'avg': round(stats['total'] / stats['count'], 3) if stats['count'] else 0.0,
+                    'max': round(stats['max'], 3)
+                }
+                for name, stats in self._observations.items()
+            }
+            snapshot = {
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'observations': observations
+            }
+            collectors = list(self._collectors.items())
+
+        # 수집기는 자체 잠금을 사용하므로 지표 잠금 밖에서 호출
+        for name, collector in collectors:
+            try:
+                snapshot[name] = collector()
+            except Exception as e:
+                snapshot[name] = {'error': str(e)}
+
+        return snapshot
+
+    def reset(self):
+        """누적 지표 초기화 (수집기는 유지)"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._observations.clear()
+
+# 전역 지표 저장소 인스턴스
+metrics = MetricsRegistry()
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 from urllib.parse import quote_plus
 import requests
 from bs4 import BeautifulSoup
+from .async_fetcher import AsyncFetchEngine
 
 class NewsService:
     """뉴스 크롤링 서비스"""
@@ -101,49 +102,106 @@ class NewsService:
         
         return unique_queries
     
+    def fetch_news_batch(self, companies: List[Dict], limit: int = 10,
+                         engine: Optional[AsyncFetchEngine] = None) -> Dict[str, List[Dict]]:
+        """
+        여러 기업의 뉴스 일괄 수집 (배치 크롤링용)
+        
+        Args:
+            companies: {'company_name', 'homepage'} 목록
+            limit: 기업별 수집할 뉴스 수 제한
+            engine: 비동기 수집 엔진 (선택사항)
+            
+        Returns:
+            Dict[str, List[Dict]]: 기업명별 뉴스 데이터 목록
+        """
+        engine = engine or AsyncFetchEngine(timeout=self.timeout)
+        print(f"📰 기업 {len(companies)}곳 뉴스 일괄 수집 시작...")
+        
+        # 모든 기업의 검색 쿼리를 한 번에 요청
+        query_map = []
+        for company in companies:
+            company_name = company.get('company_name', '')
+            for query in self._build_search_queries(company_name, company.get('homepage')):
+                query_map.append((company_name, query))
+        
+        fetched = engine.fetch_all([self._build_google_news_url(query) for _, query in query_map])
+        
+        results = {company.get('company_name', ''): [] for company in companies}
+        seen_urls = {name: set() for name in results}
+        for (company_name, query), response in zip(query_map, fetched):
+            if response.error or response.status_code != 200:
+                print(f"⚠️ 쿼리 '{query}' 뉴스 수집 실패: {response.error or response.status_code}")
+                continue
+            
+            try:
+                news_items = self._parse_google_news(response.content, query, limit)
+            except Exception as e:
+                print(f"⚠️ 쿼리 '{query}' 뉴스 파싱 실패: {str(e)}")
+                continue
+            
+            for item in news_items:
+                if len(results[company_name]) >= limit:
+                    break
+                if item['url'] not in seen_urls[company_name]:
+                    seen_urls[company_name].add(item['url'])
+                    results[company_name].append(item)
+        
+        print(f"✅ 뉴스 {sum(len(items) for items in results.values())}건 일괄 수집 완료")
+        return results
+    
+    def _build_google_news_url(self, query: str) -> str:
+        """Google News RSS URL 생성"""
+        return f"{self.google_news_base}?q={quote_plus(query)}&hl=ko&gl=KR&ceid=KR:ko"
+    
     def _fetch_google_news(self, query: str, limit: int) -> List[Dict]:
         """Google News RSS에서 뉴스 수집"""
         try:
             # Google News RSS URL 생성
-            url = f"{self.google_news_base}?q={quote_plus(query)}&hl=ko&gl=KR&ceid=KR:ko"
+            url = self._build_google_news_url(query)
             
             response = requests.get(url, timeout=self.timeout)
             if response.status_code != 200:
                 print(f"⚠️ Google News RSS 응답 오류: {response.status_code}")
                 return []
             
-            # XML 파싱
-            soup = BeautifulSoup(response.content, 'xml')
-            news_items = []
-            
-            for item in soup.find_all('item')[:limit]:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                desc_elem = item.find('description')
-                pub_date_elem = item.find('pubDate')
-                
-                title = title_elem.text.strip() if title_elem else ""
-                link = link_elem.text.strip() if link_elem else ""
-                description = desc_elem.text.strip() if desc_elem else ""
-                pub_date = pub_date_elem.text.strip() if pub_date_elem else ""
-                
-                if title and link:
-                    news_item = {
-                        'title': title,
-                        'url': link,
-                        'snippet': description,
-                        'source': 'news',
-                        'date': pub_date,
-                        'query': query
-                    }
-                    news_items.append(news_item)
-            
-            return news_items
+            return self._parse_google_news(response.content, query, limit)
             
         except Exception as e:
             print(f"❌ Google News 수집 실패: {str(e)}")
             return []
     
+    def _parse_google_news(self, content: bytes, query: str, limit: int) -> List[Dict]:
+        """Google News RSS 파싱"""
+        # XML 파싱
+        soup = BeautifulSoup(content, 'xml')
+        news_items = []
+        
+        for item in soup.find_all('item')[:limit]:
+            title_elem = item.find('title')
+            link_elem = item.find('link')
+            desc_elem = item.find('description')
+            pub_date_elem = item.find('pubDate')
+            
+            title = title_elem.text.strip() if title_elem else ""
+            link = link_elem.text.strip() if link_elem else ""
+            description = desc_elem.text.strip() if desc_elem else ""
+            pub_date = pub_date_elem.text.strip() if pub_date_elem else ""
+            
+            if title and link:
+                news_item = {
+                    'title': title,
+                    'url': link,
+                    'snippet': description,
+                    'source': 'news',
+                    'date': pub_date,
+                    'query': query,
+                    'provenance': 'real'
+                }
+                news_items.append(news_item)
+        
+        return news_items
+    
     def _get_sample_news(self, company_name: str, limit: int) -> List[Dict]:
         """샘플 뉴스 데이터 생성"""
         return [
@@ -153,7 +211,8 @@ class NewsService:
                 'snippet': f'{company_name}의 최근 동향과 리스크 요인 분석 요약.',
                 'source': 'news',
                 'date': '2024-01-15',
-                'query': company_name
+                'query': company_name,
+                'provenance': 'sample'
             },
             {
                 'title': f'{company_name} 관련 보도 2',
@@ -161,7 +220,8 @@ class NewsService:
                 'snippet': f'{company_name}의 경영 현황과 향후 전망.',
                 'source': 'news',
                 'date': '2024-01-10',
-                'query': company_name
+                'query': company_name,
+                'provenance': 'sample'
             },
             {
                 'title': f'{company_name} 관련 보도 3',
@@ -169,6 +229,7 @@ class NewsService:
                 'snippet': f'{company_name}의 시장 동향과 경쟁사 분석.',
                 'source': 'news',
                 'date': '2024-01-05',
-                'query': company_name
+                'query': company_name,
+                'provenance': 'sample'
             }
         ][:limit]
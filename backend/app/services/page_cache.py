@@ -0,0 +1,142 @@
+"""
+웹페이지 디스크 캐시
+원본 HTML(압축)과 추출 결과를 콘텐츠 해시 기준으로 저장
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+from datetime import datetime
+from typing import Dict, Optional
+from app.config import Config
+
+class PageCache:
+    """콘텐츠 주소 기반 웹페이지 캐시
+
+    디렉터리 구성:
+        index/<url 해시>.json        URL별 검증 정보 (ETag, Last-Modified, 콘텐츠 해시)
+        pages/<해시[:2]>/<해시>.html.gz  압축된 원본 HTML
+        extracts/<해시[:2]>/<해시>.json  추출된 웹사이트 정보
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Config.SCRAPER_CACHE_DIR if cache_dir is None else cache_dir
+        self.enabled = bool(self.cache_dir)
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """콘텐츠 해시 계산"""
+        return hashlib.sha256(content).hexdigest()
+
+    def get_entry(self, url: str) -> Optional[Dict]:
+        """URL의 캐시 항목 조회"""
+        if not self.enabled:
+            return None
+        return self._read_json(self._index_path(url))
+
+    def get_extraction(self, content_hash: str) -> Optional[Dict]:
+        """콘텐츠 해시로 추출 결과 조회"""
+        if not self.enabled:
+            return None
+        return self._read_json(self._blob_path('extracts', content_hash, '.json'))
+
+    def get_html(self, content_hash: str) -> Optional[bytes]:
+        """콘텐츠 해시로 원본 HTML 조회"""
+        if not self.enabled:
+            return None
+
+        try:
+            with gzip.open(self._blob_path('pages', content_hash, '.html.gz'), 'rb') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+
+    def store(self, url: str, content: bytes, headers: Dict, website_info: Dict) -> Optional[str]:
+        """
+        원본 HTML과 추출 결과 저장
+
+        Args:
+            url: 웹페이지 URL
+            content: 원본 HTML 바이트
+            headers: 응답 헤더 (ETag, Last-Modified)
+            website_info: 추출된 웹사이트 정보
+
+        Returns:
+            Optional[str]: 콘텐츠 해시 (저장 실패 시 None)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            content_hash = self.content_hash(content)
+
+            page_path = self._blob_path('pages', content_hash, '.html.gz')
+            if not os.path.exists(page_path):
+                self._write_atomic(page_path, gzip.compress(content))
+
+            extract_path = self._blob_path('extracts', content_hash, '.json')
+            self._write_atomic(extract_path, json.dumps(website_info, ensure_ascii=False).encode('utf-8'))
+
+            self._write_index(url, content_hash, headers)
+            return content_hash
+
+        except Exception as e:
+            print(f"⚠️ 웹페이지 캐시 저장 실패: {str(e)}")
+            return None
+
+    def touch(self, url: str, entry: Dict, headers: Dict):
+        """재검증 성공 시 검증 정보 갱신"""
+        if not self.enabled:
+            return
+
+        try:
+            self._write_index(url, entry['content_hash'], headers, entry)
+        except Exception as e:
+            print(f"⚠️ 웹페이지 캐시 갱신 실패: {str(e)}")
+
+    def _write_index(self, url: str, content_hash: str, headers: Dict, previous: Optional[Dict] = None):
+        """URL 인덱스 기록"""
+        previous = previous or {}
+        entry = {
+            'url': url,
+            'content_hash': content_hash,
+            # 304 응답은 검증 헤더를 생략할 수 있으므로 기존 값 유지
+            'etag': headers.get('ETag') or previous.get('etag'),
+            'last_modified': headers.get('Last-Modified') or previous.get('last_modified'),
+            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def _index_path(self, url: str) -> str:
+        """URL 인덱스 파일 경로"""
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, 'index', f'{url_hash}.json')
+
+    def _blob_path(self, kind: str, content_hash: str, suffix: str) -> str:
+        """콘텐츠 파일 경로"""
+        return os.path.join(self.cache_dir, kind, content_hash[:2], f'{content_hash}{suffix}')
+
+    def _read_json(self, path: str) -> Optional[Dict]:
+        """JSON 파일 읽기"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_atomic(self, path: str, data: bytes):
+        """임시 파일에 기록 후 교체"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
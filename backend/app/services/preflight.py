@@ -0,0 +1,128 @@
+"""
+홈페이지 사전 점검 서비스
+분석 전에 DNS 조회와 짧은 HTTP 요청으로 접속 가능 여부 확인
+"""
+
+import time
+import socket
+import concurrent.futures
+from dataclasses import dataclass, asdict
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+import requests
+from app.config import Config
+from .metrics import metrics
+
+# getaddrinfo는 시간 제한이 없으므로 별도 스레드에서 실행
+_dns_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='preflight-dns')
+
+# 호스트가 없다는 확정 응답 (시간 초과·일시 오류는 재시도하면 성공할 수 있으므로 제외)
+NXDOMAIN_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+@dataclass
+class PreflightResult:
+    """사전 점검 결과 모델"""
+    url: str
+    canonical_url: str
+    resolvable: bool = False  # 호스트 없음이 확정되지 않음 (DNS 시간 초과는 True, 웹사이트 수집만 생략)
+    reachable: bool = False
+    status_code: int = 0
+    reason: str = ''
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+class PreflightChecker:
+    """홈페이지 사전 점검 클래스"""
+
+    def __init__(self):
+        self.dns_timeout = Config.PREFLIGHT_DNS_TIMEOUT
+        self.http_timeout = Config.PREFLIGHT_HTTP_TIMEOUT
+        self.user_agent = 'Mozilla/5.0 (compatible; InsightMatch2-Preflight/1.0)'
+
+    def check(self, url: str) -> PreflightResult:
+        """
+        홈페이지 접속 가능 여부 점검
+
+        Args:
+            url: 홈페이지 URL
+
+        Returns:
+            PreflightResult: 점검 결과 (리다이렉트를 따라간 최종 URL 포함)
+        """
+        started = time.perf_counter()
+        result = PreflightResult(url=url, canonical_url=url)
+
+        try:
+            host = urlparse(url).hostname
+            if not host:
+                result.reason = 'URL에 호스트가 없습니다.'
+                return result
+
+            # 1. DNS 조회
+            not_found, dns_error = self._resolve(host)
+            if dns_error:
+                result.reason = dns_error
+                result.resolvable = not not_found
+                return result
+            result.resolvable = True
+
+            # 2. HEAD (필요 시 1바이트 GET) 요청
+            status_code, final_url, http_error = self._probe(url)
+            result.status_code = status_code
+            if http_error:
+                result.reason = http_error
+                return result
+
+            result.reachable = True
+            result.canonical_url = final_url
+            return result
+
+        finally:
+            result.elapsed = round(time.perf_counter() - started, 3)
+            metrics.observe('preflight.elapsed_ms', result.elapsed * 1000)
+            if not result.resolvable:
+                metrics.increment('preflight.unresolvable')
+            elif not result.reachable:
+                metrics.increment('preflight.unreachable')
+            else:
+                metrics.increment('preflight.passed')
+
+    def _resolve(self, host: str) -> Tuple[bool, str]:
+        """DNS 조회 (호스트 없음 확정 여부, 실패 시 오류 메시지)"""
+        future = _dns_executor.submit(socket.getaddrinfo, host, None)
+        try:
+            future.result(timeout=self.dns_timeout)
+            return False, ''
+        except concurrent.futures.TimeoutError:
+            return False, f'DNS 조회 시간 초과: {host}'
+        except socket.gaierror as e:
+            return e.errno in NXDOMAIN_ERRORS, f'DNS 조회 실패: {host} ({e.strerror or e})'
+        except Exception as e:
+            return False, f'DNS 조회 실패: {host} ({str(e)})'
+
+    def _probe(self, url: str) -> Tuple[int, str, str]:
+        """HTTP 응답 확인 (상태 코드, 최종 URL, 오류 메시지)"""
+        headers = {'User-Agent': self.user_agent}
+        try:
+            response = requests.head(url, headers=headers, timeout=self.http_timeout, allow_redirects=True)
+
+            # HEAD를 지원하지 않는 서버는 본문 1바이트만 요청
+            if response.status_code in (403, 405, 501):
+                headers['Range'] = 'bytes=0-0'
+                response = requests.get(url, headers=headers, timeout=self.http_timeout,
+                                        allow_redirects=True, stream=True)
+                response.close()
+
+            # 서버 오류 응답은 수집해도 재시도만 반복하므로 접속 불가로 처리
+            if response.status_code >= 500:
+                return response.status_code, url, f'서버 오류 응답 ({response.status_code})'
+
+            return response.status_code, response.url or url, ''
+
+        except requests.Timeout:
+            return 0, url, f'응답 시간 초과 ({self.http_timeout}초)'
+        except requests.RequestException as e:
+            return 0, url, f'접속 실패: {str(e)}'
@@ -0,0 +1,196 @@
+"""
+토큰 예산 기반 프롬프트 조립
+로컬 토크나이저로 토큰을 세어 우선순위가 높은 자료부터 고정 입력 예산 안에서 채움
+"""
+
+import re
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from app.config import Config
+from .metrics import metrics
+
+try:
+    import tiktoken
+except ImportError:  # 설치되지 않은 환경에서는 근사치 사용
+    tiktoken = None
+
+# gpt-4o 계열 토크나이저
+DEFAULT_ENCODING = 'o200k_base'
+
+# 인코딩 파일은 최초 1회 내려받으므로 프로세스 단위로 한 번만 시도 (실패·시간 초과도 기록해 재시도하지 않음)
+_encoding_lock = threading.Lock()
+_encodings: Dict[str, Optional[object]] = {}
+
+ASCII_RUN_PATTERN = re.compile(r'[\x00-\x7f]+')
+
+def _load_encoding(name: str, timeout: Optional[float] = None):
+    """tiktoken 인코딩 로드 (실패하거나 제한 시간을 넘기면 None)"""
+    timeout = Config.TOKENIZER_LOAD_TIMEOUT if timeout is None else timeout
+    with _encoding_lock:
+        if name not in _encodings:
+            encoding = None
+            if tiktoken is not None and timeout > 0:
+                # 오프라인에서는 내려받기가 연결 오류까지 멈추므로 별도 스레드에서 제한 시간만 대기
+                loaded: Dict[str, object] = {}
+
+                def load():
+                    try:
+                        loaded['encoding'] = tiktoken.get_encoding(name)
+                    except Exception as e:
+                        loaded['error'] = e
+
+                loader = threading.Thread(target=load, daemon=True, name='tokenizer-load')
+                loader.start()
+                loader.join(timeout)
+                encoding = loaded.get('encoding')
+                if loader.is_alive():
+                    print(f"⚠️ 토크나이저 로드 시간 초과({timeout}초), 근사치 사용")
+                elif encoding is None:
+                    print(f"⚠️ 토크나이저 로드 실패, 근사치 사용: {type(loaded.get('error')).__name__}")
+            _encodings[name] = encoding
+        return _encodings[name]
+
+class TokenCounter:
+    """토큰 수 계산 클래스 (tiktoken 사용 불가 시 문자 기반 근사)"""
+
+    def __init__(self, encoding_name: str = DEFAULT_ENCODING):
+        self.encoding = _load_encoding(encoding_name)
+        self.method = 'tiktoken' if self.encoding else 'heuristic'
+
+    def count(self, text: str) -> int:
+        """텍스트 토큰 수"""
+        if not text:
+            return 0
+        if self.encoding:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return self._estimate(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """최대 토큰 수에 맞게 텍스트 자르기"""
+        if max_tokens <= 0:
+            return ''
+        if self.encoding:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            return self.encoding.decode(tokens[:max_tokens]).rstrip() + '…'
+
+        if self._estimate(text) <= max_tokens:
+            return text
+
+        # 근사치는 글자 수에 비례하므로 비율로 자른 뒤 초과분만 줄임
+        end = max(1, int(len(text) * max_tokens / self._estimate(text)))
+        while end > 1 and self._estimate(text[:end]) > max_tokens:
+            end = int(end * 0.9)
+        return text[:end].rstrip() + '…'
+
+    @staticmethod
+    def _estimate(text: str) -> int:
+        """근사 토큰 수 (영문 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)"""
+        ascii_chars = sum(len(run) for run in ASCII_RUN_PATTERN.findall(text))
+        return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+@dataclass
+class PromptSection:
+    """프롬프트 구성 요소 모델"""
+    name: str
+    title: str
+    items: List[str] = field(default_factory=list)
+    priority: int = 100
+    max_item_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None
+    empty_text: str = '정보 없음'
+
+class PromptAssembler:
+    """토큰 예산 기반 프롬프트 조립 클래스"""
+
+    # 잘린 항목이라도 넣을 가치가 있는 최소 토큰 수
+    MIN_PARTIAL_TOKENS = 24
+
+    def __init__(self, budget: int, counter: Optional[TokenCounter] = None):
+        self.budget = budget
+        self._counter = counter
+
+    @property
+    def counter(self) -> TokenCounter:
+        """토큰 계산기 (토크나이저는 처음 사용할 때 로드)"""
+        if self._counter is None:
+            self._counter = TokenCounter()
+        return self._counter
+
+    def assemble(self, header: str, sections: List[PromptSection], footer: str,
+                 prefix: str = '') -> Tuple[str, Dict]:
+        """
+        프롬프트 조립
+
+        Args:
+            header: 고정 머리말 (항상 포함)
+            sections: 자료 구역 목록 (priority가 낮을수록 먼저 채움)
+            footer: 고정 분석 요청문 (항상 포함)
+            prefix: 예산에서 제외하는 고정 앞부분 (제공자 프롬프트 캐시로 재사용되는 지시문, 항상 포함)
+
+        Returns:
+            Tuple[str, Dict]: (프롬프트, 구역별 토큰 사용 보고서)
+        """
+        fixed_tokens = self.counter.count(header) + self.counter.count(footer)
+        # 구역 제목과 빈 구역 안내문도 예산에 포함
+        frame_tokens = sum(self.counter.count(self._frame(section, [section.empty_text])) for section in sections)
+        remaining = self.budget - fixed_tokens - frame_tokens
+
+        selected: Dict[str, List[str]] = {section.name: [] for section in sections}
+        report = {
+            'budget': self.budget,
+            'method': self.counter.method,
+            'fixed': fixed_tokens + frame_tokens,
+            'sections': {},
+            'dropped': {}
+        }
+
+        for section in sorted(sections, key=lambda s: s.priority):
+            used = 0
+            for index, item in enumerate(section.items):
+                if section.max_item_tokens:
+                    item = self.counter.truncate(item, section.max_item_tokens)
+                tokens = self.counter.count(item) + 1  # 줄바꿈
+                # 구역 상한이 있으면 한 구역이 예산을 독차지하지 않도록 제한
+                available = remaining if section.max_tokens is None else min(remaining, section.max_tokens - used)
+
+                if tokens > available:
+                    if available - 1 >= self.MIN_PARTIAL_TOKENS:
+                        item = self.counter.truncate(item, available - 1)
+                        tokens = self.counter.count(item) + 1
+                        selected[section.name].append(item)
+                        used += tokens
+                        remaining -= tokens
+                        index += 1
+                    if len(section.items) > index:
+                        report['dropped'][section.name] = len(section.items) - index
+                    break
+
+                selected[section.name].append(item)
+                used += tokens
+                remaining -= tokens
+
+            report['sections'][section.name] = used
+
+        # 원래 구역 순서대로 배치
+        body = '\n'.join(
+            self._frame(section, selected[section.name] or [section.empty_text])
+            for section in sections
+        )
+        prompt = f"{prefix}{header}\n{body}\n{footer}"
+
+        report['prefix'] = self.counter.count(prefix)
+        report['total'] = self.counter.count(prompt)
+        for name, tokens in report['sections'].items():
+            metrics.observe(f'prompt.section_tokens.{name}', tokens)
+        metrics.observe('prompt.total_tokens', report['total'])
+
+        return prompt, report
+
+    @staticmethod
+    def _frame(section: PromptSection, lines: List[str]) -> str:
+        """구역 제목과 항목 결합"""
+        return f"=== {section.title} ===\n" + '\n'.join(lines) + '\n'
@@ -6,6 +6,49 @@ AI 분석 프롬프트 템플릿
 class PromptTemplates:
     """프롬프트 템플릿 클래스"""
     
+    # 제공자 프롬프트 캐시가 적용되는 최소 입력 토큰 수 (이보다 짧은 앞부분은 캐시되지 않음)
+    PROMPT_CACHE_MIN_TOKENS = 1024
+    
+    # 기업 리스크 분석 지시문 (기업별 자료 앞에 두는 고정 앞부분, 제공자 프롬프트 캐시 대상)
+    # 현재 약 300토큰으로 PROMPT_CACHE_MIN_TOKENS보다 짧아 단독으로는 캐시되지 않음 (보고서의 prefix_cacheable)
+    ANALYSIS_INSTRUCTIONS = """
+=== 분석 요청 ===
+아래 기업 공개정보를 바탕으로 다음을 분석해주세요:
+
+1. **핵심 요약** (3문장 이내)
+   - 기업의 현재 상황과 주요 특징
+
+2. **리스크 분석** (5개 항목)
+   - 정보보안 관련 리스크
+   - 품질관리 관련 리스크
+   - 환경경영 관련 리스크
+   - 규제준수 관련 리스크
+   - 기타 경영 리스크
+
+3. **권장 인증** (5개 항목)
+   - ISO 27001 (정보보안)
+   - ISO 9001 (품질관리)
+   - ISO 14001 (환경경영)
+   - ISO 27701 (개인정보보호)
+   - 기타 관련 인증
+
+4. **우선순위** (각 항목별)
+   - 리스크 우선순위 (High/Medium/Low)
+   - 인증 우선순위 (High/Medium/Low)
+
+응답은 다음 JSON 형식으로 해주세요:
+{
+    "summary": "핵심 요약",
+    "risks": [
+        {"item": "리스크 항목", "priority": "High/Medium/Low", "description": "상세 설명"}
+    ],
+    "certifications": [
+        {"item": "인증 항목", "priority": "High/Medium/Low", "description": "상세 설명"}
+    ],
+    "confidence_score": 0.85
+}
+"""
+    
     @staticmethod
     def get_risk_analysis_prompt(company_data: dict) -> str:
         """리스크 분석 프롬프트"""
@@ -146,4 +189,66 @@ IT 기업의 특성을 고려한 리스크 분석:
 4. 예상 효과 (개선 후 기대 효과)
 
 간결하고 명확하게 작성해주세요.
+"""
+    
+    @staticmethod
+    def get_news_digest_prompt(company: str, news_text: str) -> str:
+        """뉴스 리스크 요약 프롬프트 (맵 단계, 고정 지시문 → 기업별 자료 순)"""
+        return f"""
+기업 관련 최근 뉴스에서 드러나는 정보보안·개인정보·품질·환경·안전보건·규제준수 리스크만 추려주세요.
+근거가 없는 리스크는 만들지 마세요.
+
+응답은 다음 JSON 형식으로 해주세요:
+{{"risks": [{{"item": "리스크 항목", "priority": "High/Medium/Low", "evidence": "근거 기사 요지"}}], "notes": "한 문장 요약"}}
+
+=== {company} 뉴스 ===
+{news_text}
+"""
+    
+    @staticmethod
+    def get_filing_digest_prompt(company: str, filing_text: str) -> str:
+        """공시 리스크 요약 프롬프트 (맵 단계, 고정 지시문 → 기업별 자료 순)"""
+        return f"""
+DART 전자공시 목록의 제목과 유형에서 드러나는 경영·재무·규제준수 리스크와 지배구조 변화를 추려주세요.
+정기공시만 있는 경우 특이사항 없음으로 답해주세요.
+
+응답은 다음 JSON 형식으로 해주세요:
+{{"risks": [{{"item": "리스크 항목", "priority": "High/Medium/Low", "evidence": "근거 공시"}}], "notes": "한 문장 요약"}}
+
+=== {company} 공시 ===
+{filing_text}
+"""
+    
+    @staticmethod
+    def get_website_digest_prompt(company: str, website_text: str) -> str:
+        """웹사이트 컴플라이언스 요약 프롬프트 (맵 단계, 고정 지시문 → 기업별 자료 순)"""
+        return f"""
+홈페이지에서 추출한 정보로 사업 분야, 취급하는 데이터(개인정보 등), 보유 인증, 제조·설비 여부를 파악하고
+관련 인증 필요성과 컴플라이언스 리스크를 추려주세요.
+
+응답은 다음 JSON 형식으로 해주세요:
+{{"risks": [{{"item": "리스크 항목", "priority": "High/Medium/Low", "evidence": "근거"}}], "business": "사업 분야 요약", "existing_certifications": ["보유 인증"], "notes": "한 문장 요약"}}
+
+=== {company} 홈페이지 ===
+{website_text}
+"""
+    
+    @staticmethod
+    def get_reduce_prompt(company: str, digests: dict) -> str:
+        """출처별 요약 통합 프롬프트 (리듀스 단계, 고정 지시문 → 기업별 자료 순)"""
+        sections = '\n\n'.join(
+            f"=== {name} ===\n{digest}" for name, digest in digests.items()
+        )
+        return f"""
+기업 공개정보를 출처별로 요약한 결과를 통합하여 다음을 작성해주세요:
+1. 핵심 요약 (3문장 이내)
+2. 리스크 분석 (중복을 합쳐 최대 5개, 우선순위 High/Medium/Low)
+3. 권장 인증 (ISO 27001, ISO 9001, ISO 14001, ISO 27701, ISO 45001 등 최대 5개, 이미 보유한 인증은 제외)
+
+응답은 summary, risks, certifications, confidence_score 필드를 가진 JSON으로 해주세요.
+
+=== 기업명 ===
+{company}
+
+{sections}
 """
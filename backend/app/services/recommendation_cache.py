@@ -0,0 +1,91 @@
+"""
+추천 결과 캐시
+분석 ID 또는 기준 지문과 추천 수를 키로 메모리에 보관 (TTL, 최대 건수 초과 시 LRU 제거)
+컨설턴트 디렉터리 버전이 바뀌면 이전 버전 항목은 조회되지 않으므로 전체 무효화가 O(1)
+"""
+
+import copy
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from app.config import Config
+from app.models.analysis import Analysis
+from .metrics import metrics
+
+class RecommendationCache:
+    """추천 결과 메모리 캐시 클래스"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.max_entries = Config.RECOMMENDATION_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.ttl_seconds = Config.RECOMMENDATION_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._entries: 'OrderedDict[Tuple, Tuple[int, float, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def analysis_key(analysis: Analysis, limit: int) -> Tuple:
+        """분석 결과 기준 키 (재분석으로 내용이 바뀌면 updated_at이 달라짐)"""
+        updated_at = analysis.updated_at.isoformat() if analysis.updated_at else None
+        return ('analysis', analysis.id, updated_at, limit)
+
+    @staticmethod
+    def criteria_key(industry: str, certifications: Optional[List[str]], region: str,
+                     min_experience: int, limit: int) -> Tuple:
+        """추천 기준 지문 키"""
+        payload = json.dumps([industry, certifications or [], region, min_experience],
+                             ensure_ascii=False, sort_keys=True, default=str)
+        return ('criteria', hashlib.sha256(payload.encode('utf-8')).hexdigest(), limit)
+
+    def get(self, key: Tuple, version: int) -> Optional[Dict]:
+        """
+        캐시된 추천 결과 조회 (다른 디렉터리 버전이거나 만료된 항목은 삭제)
+
+        Args:
+            key: 캐시 키
+            version: 현재 컨설턴트 디렉터리 버전
+
+        Returns:
+            Optional[Dict]: 추천 결과 사본
+        """
+        if self.max_entries <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and (entry[0] != version or time.monotonic() - entry[1] > self.ttl_seconds):
+                del self._entries[key]
+                metrics.increment('recommendation_cache.expired')
+                entry = None
+            if entry:
+                self._entries.move_to_end(key)
+
+        if not entry:
+            metrics.increment('recommendation_cache.misses')
+            return None
+
+        metrics.increment('recommendation_cache.hits')
+        return copy.deepcopy(entry[2])
+
+    def put(self, key: Tuple, version: int, value: Dict):
+        """추천 결과 저장 (최대 건수 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# 전역 추천 결과 캐시
+recommendation_cache = RecommendationCache()
@@ -2,11 +2,17 @@
 추천 서비스
 """
 
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Callable, List, Dict, Optional, Tuple
+from app.config import Config
 from app.models.consultant import Consultant
 from app.models.analysis import Analysis
 from .matching_service import MatchingService, MatchResult
 from .database_service import DatabaseService
+from .consultant_index import consultant_index
+from .certification_catalog import certification_catalog
+from .recommendation_cache import RecommendationCache, recommendation_cache
+from .metrics import metrics
 
 class RecommendationService:
     """추천 서비스 클래스"""
@@ -26,42 +32,111 @@ class RecommendationService:
         Returns:
             Dict: 추천 결과
         """
+        if not analysis.id:
+            return self._recommend(analysis, limit)
+        return self._cached(RecommendationCache.analysis_key(analysis, limit), lambda: self._recommend(analysis, limit))
+    
+    def _cached(self, key: Tuple, compute: Callable[[], Dict]) -> Dict:
+        """추천 결과 캐시 조회 (없으면 계산해 실제 매칭 결과만 현재 디렉터리 버전으로 저장)"""
+        version = consultant_index.directory_version()
+        cached = recommendation_cache.get(key, version)
+        if cached is not None:
+            return cached
+        
+        result = compute()
+        # 폴백 추천은 일시적인 매칭 실패일 수 있으므로 저장하지 않고 다음 요청에서 다시 계산
+        if result.get('success') and not result.get('fallback'):
+            recommendation_cache.put(key, version, result)
+        return result
+    
+    def _recommend(self, analysis: Analysis, limit: int) -> Dict:
+        """분석 결과 기반 추천 계산"""
         try:
-            # 매칭 실행
-            matches = self.matching_service.find_matches(analysis, limit)
+            # 매칭 실행 (저장된 분석이면 상위 MATCH_STORE_LIMIT개를 matches 테이블에 기록)
+            if analysis.id:
+                stamp = consultant_index.stamp()
+                matches = self.matching_service.find_matches(analysis, max(limit, Config.MATCH_STORE_LIMIT))
+                # 매칭이 실패하면 기존 기록을 빈 결과로 덮어쓰지 않음
+                if matches is not None:
+                    self._store_matches(analysis, matches, stamp)
+                    matches = matches[:limit]
+            else:
+                matches = self.matching_service.find_matches(analysis, limit)
             
             if not matches:
                 return self._get_fallback_recommendations(analysis, limit)
             
-            # 매칭 결과를 딕셔너리로 변환
-            recommendations = []
-            for match in matches:
-                recommendation = {
-                    'consultant': match.consultant.to_dict(),
-                    'match_score': match.match_score,
-                    'reasons': match.reasons,
-                    'industry_match': match.industry_match,
-                    'certification_matches': match.certification_matches,
-                    'region_match': match.region_match,
-                    'experience_level': match.experience_level
-                }
-                recommendations.append(recommendation)
-            
-            # 매칭 요약 생성
-            summary = self.matching_service.get_match_summary(matches)
-            
-            return {
-                'success': True,
-                'recommendations': recommendations,
-                'summary': summary,
-                'analysis_id': analysis.id,
-                'company_name': analysis.company_name
-            }
+            return self._format_recommendations(analysis, matches)
             
         except Exception as e:
             print(f"❌ 추천 생성 중 오류: {str(e)}")
             return self._get_fallback_recommendations(analysis, limit)
     
+    def _format_recommendations(self, analysis: Analysis, matches: List[MatchResult]) -> Dict:
+        """매칭 결과를 추천 응답으로 변환"""
+        # 매칭 결과를 딕셔너리로 변환
+        recommendations = []
+        for match in matches:
+            recommendation = {
+                'consultant': match.consultant.to_dict(),
+                'match_score': match.match_score,
+                'reasons': match.reasons,
+                'industry_match': match.industry_match,
+                'certification_matches': match.certification_matches,
+                'region_match': match.region_match,
+                'experience_level': match.experience_level
+            }
+            recommendations.append(recommendation)
+        
+        # 매칭 요약 생성
+        summary = self.matching_service.get_match_summary(matches)
+        
+        return {
+            'success': True,
+            'recommendations': recommendations,
+            'summary': summary,
+            'analysis_id': analysis.id,
+            'company_name': analysis.company_name
+        }
+    
+    def _store_matches(self, analysis: Analysis, matches: List[MatchResult], stamp: Optional[datetime]):
+        """상위 매칭을 matches 테이블에 기록 (계산 당시 디렉터리 기준 시각 포함)"""
+        self.db_service.replace_matches(
+            analysis.id,
+            analysis.company_id,
+            [{'consultant_id': match.consultant.id, 'match_score': match.match_score}
+             for match in matches[:Config.MATCH_STORE_LIMIT]],
+            stamp.isoformat() if stamp else None
+        )
+    
+    def _load_stored_matches(self, analysis: Analysis, limit: int) -> Optional[List[MatchResult]]:
+        """
+        matches 테이블의 기록으로 매칭 결과 복원
+        
+        기록이 없거나, 기록 이후 컨설턴트가 변경되었거나, 기록보다 많이 요청하면 None (다시 계산)
+        """
+        if limit > Config.MATCH_STORE_LIMIT:
+            return None
+        rows = self.db_service.get_matches(analysis.id)
+        if not rows:
+            return None
+        
+        stamp = consultant_index.stamp()
+        stored_stamp = datetime.fromisoformat(rows[0]['directory_stamp']) if rows[0].get('directory_stamp') else None
+        if stored_stamp != stamp:
+            metrics.increment('recommendations.stale')
+            return None
+        
+        rows = rows[:limit]
+        consultants = consultant_index.get_many([row['consultant_id'] for row in rows])
+        if consultants is None or None in consultants:
+            metrics.increment('recommendations.stale')
+            return None
+        return [
+            self.matching_service.restore_match(analysis, consultant, float(row['match_score']))
+            for row, consultant in zip(rows, consultants)
+        ]
+    
     def get_recommendations_by_company(self, company_name: str, limit: int = 5) -> Dict:
         """
         기업명으로 최신 분석 결과를 바탕으로 추천
@@ -84,7 +159,8 @@ class RecommendationService:
                     'recommendations': []
                 }
             
-            return self.get_recommendations(analysis, limit)
+            return self._cached(RecommendationCache.analysis_key(analysis, limit),
+                                lambda: self._recommend_from_stored(analysis, limit))
             
         except Exception as e:
             print(f"❌ 기업별 추천 중 오류: {str(e)}")
@@ -94,6 +170,16 @@ class RecommendationService:
                 'recommendations': []
             }
     
+    def _recommend_from_stored(self, analysis: Analysis, limit: int) -> Dict:
+        """분석 저장 시 기록한 매칭 사용 (컨설턴트 변경이 있으면 다시 계산해 기록 교체)"""
+        matches = self._load_stored_matches(analysis, limit)
+        if matches:
+            metrics.increment('recommendations.stored_hits')
+            return self._format_recommendations(analysis, matches)
+        
+        metrics.increment('recommendations.recomputed')
+        return self._recommend(analysis, limit)
+    
     def get_recommendations_by_criteria(self, industry: str = '', 
                                       certifications: List[str] = None, 
                                       region: str = '', 
@@ -112,9 +198,16 @@ class RecommendationService:
         Returns:
             Dict: 추천 결과
         """
+        key = RecommendationCache.criteria_key(industry, certifications, region, min_experience, limit)
+        return self._cached(key, lambda: self._recommend_by_criteria(industry, certifications, region,
+                                                                     min_experience, limit))
+    
+    def _recommend_by_criteria(self, industry: str, certifications: Optional[List[str]], region: str,
+                               min_experience: int, limit: int) -> Dict:
+        """기준별 추천 계산"""
         try:
-            # 컨설턴트 조회
-            consultants = self.db_service.get_consultants(industry, '', region)
+            # 후보 컨설턴트 조회 (업종·지역 일치, 최소 경력 이상, 인증은 하나 이상 보유)
+            consultants = self._find_criteria_candidates(industry, certifications, region, min_experience, limit)
             
             if not consultants:
                 return {
@@ -123,18 +216,6 @@ class RecommendationService:
                     'recommendations': []
                 }
             
-            # 경력 필터링
-            if min_experience > 0:
-                consultants = [c for c in consultants if c.years_experience >= min_experience]
-            
-            # 인증 필터링
-            if certifications:
-                filtered_consultants = []
-                for consultant in consultants:
-                    if any(cert in consultant.certifications for cert in certifications):
-                        filtered_consultants.append(consultant)
-                consultants = filtered_consultants
-            
             # 점수 계산 및 정렬
             scored_consultants = []
             for consultant in consultants:
@@ -152,7 +233,7 @@ class RecommendationService:
                     'match_score': score,
                     'reasons': self._generate_criteria_reasons(consultant, industry, certifications, region),
                     'industry_match': consultant.industry == industry if industry else True,
-                    'certification_matches': [cert for cert in (certifications or []) if cert in consultant.certifications],
+                    'certification_matches': self._matched_certifications(consultant, certifications),
                     'region_match': consultant.region == region if region else True,
                     'experience_level': self.matching_service._get_experience_level(consultant.years_experience)
                 }
@@ -181,6 +262,28 @@ class RecommendationService:
                 'recommendations': []
             }
     
+    def _find_criteria_candidates(self, industry: str, certifications: Optional[List[str]], region: str,
+                                  min_experience: int, limit: int) -> List[Consultant]:
+        """
+        기준별 추천 후보 조회
+        
+        database 매칭이면 모든 조건을 DB 함수로 넘겨 겹치는 인증 수 순 상위 limit명만 조회하고,
+        그 외에는 메모리 색인에서 조회 (조건이 같으면 두 경로의 상위 limit명은 같음)
+        """
+        certification_ids = certification_catalog.catalog_ids(certifications or [])
+        # 카탈로그에 없는 인증만 요청하면 DB에서 걸러낼 수 없으므로 메모리 색인 사용
+        if self.matching_service.backend == 'database' and (certification_ids or not certifications):
+            consultants = self.db_service.search_consultants(
+                industry, certification_ids, region, min_experience, limit
+            )
+            if consultants is not None:
+                return consultants
+        
+        consultants = consultant_index.lookup(industry, certifications, region)
+        if min_experience > 0:
+            consultants = [c for c in consultants if c.years_experience >= min_experience]
+        return consultants
+    
     def _calculate_criteria_score(self, consultant: Consultant, industry: str, 
                                 certifications: List[str], region: str, min_experience: int) -> float:
         """기준별 점수 계산"""
@@ -192,7 +295,7 @@ class RecommendationService:
         
         # 인증 매칭
         if certifications:
-            matches = sum(1 for cert in certifications if cert in consultant.certifications)
+            matches = len(self._matched_certifications(consultant, certifications))
             score += (matches / len(certifications)) * 0.4
         
         # 지역 매칭
@@ -214,7 +317,7 @@ class RecommendationService:
             reasons.append(f"업종 일치: {industry}")
         
         if certifications:
-            matches = [cert for cert in certifications if cert in consultant.certifications]
+            matches = self._matched_certifications(consultant, certifications)
             if matches:
                 reasons.append(f"인증 일치: {', '.join(matches)}")
         
@@ -223,11 +326,20 @@ class RecommendationService:
         
         return reasons
     
+    def _matched_certifications(self, consultant: Consultant, certifications: Optional[List[str]]) -> List[str]:
+        """컨설턴트가 보유한 요청 인증 (인증 카탈로그 ID 기준, 정식 명칭)"""
+        held = set(certification_catalog.intern_all(consultant.certifications))
+        return [
+            certification_catalog.name(certification_id)
+            for certification_id in certification_catalog.intern_all(certifications, assign=False)
+            if certification_id in held
+        ]
+    
     def _get_fallback_recommendations(self, analysis: Analysis, limit: int) -> Dict:
         """폴백 추천 (매칭 실패 시)"""
         try:
             # 기본 컨설턴트 조회
-            consultants = self.db_service.get_consultants()
+            consultants = consultant_index.consultants()
             
             if not consultants:
                 return {
@@ -258,6 +370,7 @@ class RecommendationService:
                     'average_score': 0.5,
                     'note': '기본 추천입니다.'
                 },
+                'fallback': True,
                 'analysis_id': analysis.id,
                 'company_name': analysis.company_name
             }
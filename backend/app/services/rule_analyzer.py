@@ -0,0 +1,267 @@
+"""
+규칙 기반 리스크 분석 (Tier 0)
+뉴스·공시·웹사이트 텍스트의 키워드 신호를 ISO 리스크와 인증으로 매핑해 LLM 호출 없이 분석
+"""
+
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from .metrics import metrics
+
+# 단어 단위 검색에서 키워드 뒤에 붙어도 같은 단어로 보는 조사·복수형 어미
+TOKEN_SUFFIXES = (
+    '으로는', '으로', '에서', '에게', '까지', '부터', '보다', '처럼', '이나', '이다', '이며', '이고',
+    '에는', '로는', '과의', '와의', '이', '가', '은', '는', '을', '를', '의', '에', '와', '과', '도',
+    '로', '만', '나', 'es', 's'
+)
+
+class KeywordAutomaton:
+    """Aho-Corasick 키워드 자동자 클래스 (모든 키워드를 텍스트 1회 순회로 검색)"""
+
+    def __init__(self, keywords: Iterable[str], whole_tokens: bool = False):
+        # whole_tokens: 단어 중간에 걸친 일치('보안관'의 '보안', '산재한'의 '산재')는 세지 않음
+        self.whole_tokens = whole_tokens
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[str]] = [[]]
+
+        for keyword in keywords:
+            self._add(keyword.lower())
+        self._build_failure_links()
+
+    def _add(self, keyword: str):
+        """트라이에 키워드 추가"""
+        state = 0
+        for char in keyword:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        if keyword not in self.output[state]:
+            self.output[state].append(keyword)
+
+    def _build_failure_links(self):
+        """실패 링크 계산 (너비 우선)"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                # 루트 바로 아래 상태는 자기 자신이 아닌 루트로 연결
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        텍스트의 키워드 등장 횟수
+
+        Args:
+            text: 검색할 텍스트 (대소문자 구분 없음)
+
+        Returns:
+            Dict[str, int]: 키워드별 등장 횟수
+        """
+        counts: Dict[str, int] = {}
+        text = text.lower()
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for keyword in self.output[state]:
+                if self.whole_tokens and not self._is_token(text, end + 1 - len(keyword), end + 1):
+                    continue
+                counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+    @staticmethod
+    def _is_token(text: str, start: int, stop: int) -> bool:
+        """일치 구간이 한 단어인지 (앞은 단어 경계, 뒤는 단어 경계 또는 조사)"""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if stop == len(text) or not text[stop].isalnum():
+            return True
+        for suffix in TOKEN_SUFFIXES:
+            end = stop + len(suffix)
+            if text.startswith(suffix, stop) and (end == len(text) or not text[end].isalnum()):
+                return True
+        return False
+
+class RuleBasedAnalyzer:
+    """규칙 기반 리스크 분석 클래스"""
+
+    # 인증별 리스크 항목과 키워드 가중치
+    RULES = {
+        'ISO 27001': {
+            'risk': '정보보안 관리체계 미흡',
+            'description': '해킹·랜섬웨어 등 보안 위협에 대응할 관리체계가 필요합니다.',
+            'cert_description': '정보보안 관리시스템 인증',
+            'keywords': {
+                '해킹': 3, '랜섬웨어': 3, '사이버': 2, '보안사고': 3, '보안 사고': 3, '침해': 2, '악성코드': 2,
+                '디도스': 2, '정보보안': 1, '보안': 1, '클라우드': 0.5, '서버': 0.5, '데이터센터': 1,
+                'ransomware': 3, 'hacking': 3, 'breach': 2, 'security': 1, 'cyber': 2
+            }
+        },
+        'ISO 27701': {
+            'risk': '개인정보 보호 체계 보완 필요',
+            'description': '개인정보 처리방침과 유출 대응 절차의 최신화가 필요합니다.',
+            'cert_description': '개인정보보호 관리시스템 인증',
+            'keywords': {
+                '개인정보': 2, '정보유출': 3, '정보 유출': 3, '유출': 1, '고객정보': 2, '개인정보보호법': 2,
+                '과징금': 1, '동의': 0.5, 'privacy': 2, 'gdpr': 2, 'personal data': 2
+            }
+        },
+        'ISO 9001': {
+            'risk': '품질관리 체계 부족',
+            'description': '제품·서비스 품질 편차와 고객 불만에 대한 관리 표준이 필요합니다.',
+            'cert_description': '품질경영시스템 인증',
+            'keywords': {
+                '리콜': 3, '불량': 2, '결함': 2, '품질': 1, '클레임': 2, '고객 불만': 2, '하자': 2,
+                '제조': 0.5, '생산': 0.5, '공정': 0.5, 'recall': 3, 'defect': 2, 'quality': 1
+            }
+        },
+        'ISO 14001': {
+            'risk': '환경 규제 대응 체계 보완 필요',
+            'description': '배출·폐기물 등 환경 법규 준수를 위한 관리체계가 필요합니다.',
+            'cert_description': '환경경영시스템 인증',
+            'keywords': {
+                '환경오염': 3, '오염': 2, '배출': 1, '탄소': 1, '온실가스': 2, '폐기물': 2, '유해물질': 2,
+                '환경부': 1, 'esg': 1, '친환경': 0.5, '환경': 0.5, 'emission': 1, 'pollution': 3, 'carbon': 1
+            }
+        },
+        'ISO 45001': {
+            'risk': '산업안전보건 관리 미흡',
+            'description': '산업재해 예방과 중대재해처벌법 대응을 위한 안전보건 체계가 필요합니다.',
+            'cert_description': '안전보건경영시스템 인증',
+            'keywords': {
+                '중대재해': 3, '중대재해처벌법': 3, '산업재해': 3, '산재': 3, '사망사고': 3, '안전사고': 3, '부상': 2, '화재': 2,
+                '폭발': 2, '안전보건': 1, '근로자': 0.5, '공장': 0.5, '건설': 0.5, 'safety': 1, 'accident': 2
+            }
+        }
+    }
+
+    # 분석 결과의 analysis_method 값
+    ANALYSIS_METHOD = 'Rule-based (Tier 0)'
+
+    # 출처별 신뢰 가중치 (공시 > 뉴스 > 웹사이트)
+    SOURCE_WEIGHTS = {'dart': 1.5, 'news': 1.0, 'website': 0.7}
+
+    # 같은 키워드가 한 항목에 반복될 때 인정하는 최대 횟수
+    MAX_REPEATS = 2
+
+    def __init__(self):
+        self.keyword_rules: Dict[str, List[Tuple[str, float]]] = {}
+        for cert, rule in self.RULES.items():
+            for keyword, weight in rule['keywords'].items():
+                self.keyword_rules.setdefault(keyword.lower(), []).append((cert, weight))
+        self.automaton = KeywordAutomaton(self.keyword_rules.keys(), whole_tokens=True)
+
+    def analyze(self, public_data: Dict) -> Dict:
+        """
+        규칙 기반 리스크 분석
+
+        Args:
+            public_data: 수집된 공개정보
+
+        Returns:
+            Dict: 분석 결과 (AIAnalyzer 결과와 같은 형식, confidence_score 포함)
+        """
+        started = time.perf_counter()
+        company = public_data.get('company', 'Unknown')
+
+        scores = {cert: 0.0 for cert in self.RULES}
+        items = self._collect_texts(public_data)
+        unmatched_items = 0
+
+        for source, text in items:
+            counts = self.automaton.count(text)
+            if not counts:
+                unmatched_items += 1
+            for keyword, count in counts.items():
+                for cert, weight in self.keyword_rules[keyword]:
+                    scores[cert] += weight * min(count, self.MAX_REPEATS) * self.SOURCE_WEIGHTS[source]
+
+        ranked = sorted(self.RULES, key=lambda cert: scores[cert], reverse=True)
+        confidence = self._confidence(scores, len(items), unmatched_items)
+
+        result = {
+            'summary': self._build_summary(company, ranked, scores),
+            'risks': [
+                {'item': self.RULES[cert]['risk'], 'priority': self._priority(scores[cert]),
+                 'description': self.RULES[cert]['description']}
+                for cert in ranked
+            ],
+            'certifications': [
+                {'item': cert, 'priority': self._priority(scores[cert]),
+                 'description': self.RULES[cert]['cert_description']}
+                for cert in ranked
+            ],
+            'confidence_score': confidence,
+            'analysis_method': self.ANALYSIS_METHOD,
+            'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'rule_signals': {cert: round(score, 2) for cert, score in scores.items()}
+        }
+
+        metrics.observe('rule_analyzer.latency_ms', (time.perf_counter() - started) * 1000)
+        return result
+
+    def _collect_texts(self, public_data: Dict) -> List[Tuple[str, str]]:
+        """출처별 분석 대상 텍스트 목록"""
+        items = []
+        for news in public_data.get('news', []):
+            items.append(('news', f"{news.get('title', '')} {news.get('snippet', '')}"))
+        for dart in public_data.get('dart', []):
+            items.append(('dart', f"{dart.get('title', '')} {dart.get('snippet', '')}"))
+
+        website = public_data.get('website') or {}
+        website_text = ' '.join(filter(None, [
+            website.get('title', ''),
+            website.get('description', ''),
+            ' '.join(website.get('keywords', [])),
+            website.get('content_excerpt', '')
+        ]))
+        if website_text.strip():
+            items.append(('website', website_text))
+        return items
+
+    def _confidence(self, scores: Dict[str, float], item_count: int, unmatched_items: int) -> float:
+        """
+        신뢰도 계산
+
+        키워드 근거가 강할수록 높이고, 키워드로 설명되지 않는 항목(해석이 필요한 기사·공시)이
+        많을수록 낮춤. 자료가 적다고 올려주지 않으므로 기사 한두 건으로는 LLM 생략 기준에 닿지 않음.
+        """
+        total = sum(scores.values())
+        confidence = 0.5 + 0.35 * (1 - math.exp(-total / 6))
+        if item_count:
+            confidence -= 0.3 * (unmatched_items / item_count) * min(1.0, item_count / 5)
+        return round(max(0.3, min(0.95, confidence)), 2)
+
+    @staticmethod
+    def _priority(score: float) -> str:
+        """점수별 우선순위"""
+        if score >= 3:
+            return 'High'
+        if score >= 1:
+            return 'Medium'
+        return 'Low'
+
+    def _build_summary(self, company: str, ranked: List[str], scores: Dict[str, float]) -> str:
+        """요약 문장 생성"""
+        signaled = [cert for cert in ranked if scores[cert] >= 1]
+        if not signaled:
+            return f'{company}의 공개자료에서 뚜렷한 리스크 신호는 확인되지 않았으나, 기본적인 보안·품질·환경 관리체계 점검이 권장됩니다.'
+
+        risks = ', '.join(self.RULES[cert]['risk'] for cert in signaled[:3])
+        certs = ', '.join(signaled[:3])
+        return f'{company}의 공개자료에서 {risks} 관련 신호가 확인되었습니다. {certs} 인증 검토가 권장됩니다.'
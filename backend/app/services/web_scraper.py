@@ -4,26 +4,70 @@
 """
 
 import re
+import json
 import time
+import random
 from typing import Dict, List, Optional
 from urllib.parse import urlparse, urljoin
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
+from app.config import Config
+from .page_cache import PageCache
+from .circuit_breaker import CircuitBreaker
+from .charset_detector import detect_encoding
+from .async_fetcher import AsyncFetchEngine
+from .metrics import metrics
+
+# 도메인별 서킷 브레이커 (프로세스 전역)
+domain_breaker = CircuitBreaker(
+    'web_scraper',
+    failure_threshold=Config.SCRAPER_BREAKER_THRESHOLD,
+    reset_timeout=Config.SCRAPER_BREAKER_RESET_SECONDS
+)
 
 class WebScraper:
     """웹사이트 크롤링 서비스"""
     
+    # 구조화 데이터에서 기업 정보로 인정하는 schema.org 타입
+    ORGANIZATION_TYPES = {'Organization', 'Corporation', 'LocalBusiness', 'Store', 'NGO',
+                          'EducationalOrganization', 'MedicalOrganization', 'GovernmentOrganization'}
+    
+    # 본문 텍스트 검색을 생략하기 위해 필요한 구조화 데이터 필드 (본문 정규식 추출이 채우는 필드 전체)
+    STRUCTURED_REQUIRED_FIELDS = ['legal_name', 'business_number', 'ceo', 'telephone', 'email', 'address']
+    
+    # 대표자로 보는 직함 (JSON-LD employee·member의 jobTitle)
+    CEO_TITLE_PATTERN = re.compile(r'CEO|대표', re.IGNORECASE)
+    
+    # 본문 추출 시 제외하는 태그와 id/class/role 패턴
+    BOILERPLATE_TAGS = {'script', 'style', 'noscript', 'template', 'nav', 'header', 'footer', 'aside',
+                        'form', 'button', 'select', 'iframe', 'svg'}
+    BOILERPLATE_PATTERN = re.compile(
+        r'nav|menu|gnb|lnb|snb|header|footer|cookie|consent|banner|popup|modal|breadcrumb|'
+        r'sidebar|sitemap|copyright|login|share|quick|skip',
+        re.IGNORECASE
+    )
+    
+    # 본문 후보가 되는 블록 태그
+    CONTENT_BLOCK_TAGS = {'body', 'main', 'article', 'section', 'div', 'td', 'ul', 'ol', 'dl', 'table'}
+    
     def __init__(self):
         self.timeout = 15
         self.max_retries = 3
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        self.page_cache = PageCache()
+        self.breaker = domain_breaker
+        self.budget = Config.SCRAPER_BUDGET_SECONDS
+        self.backoff_base = 0.5
+        self.backoff_cap = 4.0
+        self.min_attempt_timeout = 1.0
     
-    def scrape_website(self, url: str) -> Dict:
+    def scrape_website(self, url: str, deadline: Optional[float] = None) -> Dict:
         """
         웹사이트 정보 수집
         
         Args:
             url: 웹사이트 URL
+            deadline: 분석 마감 시각 (time.monotonic 기준, 선택사항)
             
         Returns:
             Dict: 수집된 웹사이트 정보
@@ -31,62 +75,417 @@ class WebScraper:
         try:
             print(f"🌐 {url} 웹사이트 정보 수집 시작...")
             
-            # 웹페이지 내용 수집
-            content = self._fetch_webpage(url)
-            if not content:
-                return self._get_sample_website_data(url)
+            # 수집 예산과 분석 마감 중 이른 시각까지만 시도
+            scrape_deadline = time.monotonic() + self.budget
+            if deadline is not None:
+                scrape_deadline = min(scrape_deadline, deadline)
             
-            # 정보 추출
-            website_info = {
-                'url': url,
-                'title': self._extract_title(content),
-                'description': self._extract_description(content),
-                'keywords': self._extract_keywords(content),
-                'company_info': self._extract_company_info(content),
-                'contact_info': self._extract_contact_info(content),
-                'social_links': self._extract_social_links(content),
-                'last_updated': self._get_current_date(),
-                'status': 'success'
-            }
+            # 캐시 항목이 있으면 조건부 요청으로 재검증
+            cached = self.page_cache.get_entry(url)
+            response = self._fetch_webpage(url, cached, scrape_deadline)
+            if response is None:
+                return self._get_sample_website_data(url)
             
-            print("✅ 웹사이트 정보 수집 완료")
-            return website_info
+            return self._process_response(url, response, cached, scrape_deadline)
             
         except Exception as e:
             print(f"❌ 웹사이트 수집 중 오류: {str(e)}")
             return self._get_sample_website_data(url)
     
-    def _fetch_webpage(self, url: str) -> Optional[BeautifulSoup]:
-        """웹페이지 내용 수집"""
-        for attempt in range(self.max_retries):
+    def scrape_websites(self, urls: List[str], engine: Optional[AsyncFetchEngine] = None) -> Dict[str, Dict]:
+        """
+        여러 웹사이트 정보 일괄 수집 (배치 크롤링용)
+        
+        Args:
+            urls: 웹사이트 URL 목록
+            engine: 비동기 수집 엔진 (선택사항)
+            
+        Returns:
+            Dict[str, Dict]: URL별 웹사이트 정보
+        """
+        engine = engine or AsyncFetchEngine(timeout=self.timeout, user_agent=self.user_agent)
+        print(f"🌐 웹사이트 {len(urls)}건 일괄 수집 시작...")
+        
+        results = {}
+        requests_to_send = []
+        cached_entries = {}
+        for url in dict.fromkeys(urls):
+            # 최근 실패한 도메인은 요청하지 않음
+            if not self.breaker.allow(urlparse(url).hostname or url):
+                metrics.increment('scraper.fetch.short_circuited')
+                results[url] = self._get_sample_website_data(url)
+                continue
+            cached_entries[url] = self.page_cache.get_entry(url)
+            requests_to_send.append((url, self._build_request_headers(cached_entries[url])))
+        
+        for fetched in engine.fetch_all(requests_to_send):
+            url = fetched.url
+            domain = urlparse(url).hostname or url
+            
+            if fetched.error or fetched.status_code >= 500:
+                self.breaker.record_failure(domain)
+                metrics.increment('scraper.fetch.failures')
+                results[url] = self._get_sample_website_data(url)
+                continue
+            
+            self.breaker.record_success(domain)
+            if fetched.status_code >= 400:
+                metrics.increment('scraper.fetch.client_errors')
+                results[url] = self._get_sample_website_data(url)
+                continue
+            
+            try:
+                results[url] = self._process_response(url, fetched, cached_entries.get(url))
+            except Exception as e:
+                print(f"❌ {url} 웹사이트 처리 중 오류: {str(e)}")
+                results[url] = self._get_sample_website_data(url)
+        
+        print(f"✅ 웹사이트 {len(results)}건 일괄 수집 완료")
+        return results
+    
+    def _process_response(self, url: str, response, cached: Optional[Dict] = None,
+                          deadline: Optional[float] = None) -> Dict:
+        """
+        수집된 응답을 웹사이트 정보로 변환
+        
+        Args:
+            url: 웹사이트 URL
+            response: requests.Response 또는 FetchResult (status_code, headers, content)
+            cached: 페이지 캐시 항목
+            deadline: 재요청 시 마감 시각
+        """
+        # 변경 없음 (304) → 파싱 없이 캐시된 추출 결과 사용
+        if response.status_code == 304:
+            website_info = self._get_cached_website_info(url, cached, response.headers, 'revalidated')
+            if website_info:
+                print("♻️ 웹페이지 변경 없음 (304), 캐시된 정보 사용")
+                return website_info
+            
+            # 추출 결과가 유실된 경우 전체 재요청
+            response = self._fetch_webpage(url, deadline=deadline)
+            if response is None or response.status_code == 304:
+                return self._get_sample_website_data(url)
+        
+        # 콘텐츠 해시가 같으면 파싱 생략
+        content_hash = PageCache.content_hash(response.content)
+        if cached and cached.get('content_hash') == content_hash:
+            website_info = self._get_cached_website_info(url, cached, response.headers, 'unchanged')
+            if website_info:
+                print("♻️ 웹페이지 내용 동일, 캐시된 정보 사용")
+                return website_info
+        
+        # 정보 추출
+        content = self._parse_html(response)
+        website_info = self._build_website_info(url, content)
+        self.page_cache.store(url, response.content, response.headers, website_info)
+        
+        print("✅ 웹사이트 정보 수집 완료")
+        return website_info
+    
+    def _build_website_info(self, url: str, content: BeautifulSoup) -> Dict:
+        """파싱된 페이지에서 웹사이트 정보 추출"""
+        company_info, contact_info, structured = self._extract_organization_info(content)
+        
+        return {
+            'url': url,
+            'title': self._extract_title(content),
+            'description': self._extract_description(content),
+            'keywords': self._extract_keywords(content),
+            'company_info': company_info,
+            'contact_info': contact_info,
+            'social_links': self._extract_social_links(content),
+            'logo': structured.get('logo'),
+            'content_excerpt': self._extract_main_content(content),
+            'structured_data': structured.get('sources', []),
+            'last_updated': self._get_current_date(),
+            'status': 'success',
+            'cache_status': 'miss',
+            'provenance': 'real'
+        }
+    
+    def _extract_organization_info(self, soup: BeautifulSoup):
+        """
+        회사·연락처 정보 추출
+        
+        구조화 데이터(JSON-LD, OpenGraph, 마이크로데이터)를 먼저 읽고, 본문 정규식 추출이 채우는
+        필드(회사명·사업자등록번호·대표자·전화번호·이메일·주소)가 모두 있으면 본문 텍스트 검색을 생략한다.
+        하나라도 없으면 본문 추출 결과에 구조화 데이터를 병합하되, og:site_name은 본문에서 찾은 회사명을 바꾸지 않는다.
+        
+        Returns:
+            Tuple[Dict, Dict, Dict]: 회사 정보, 연락처 정보, 구조화 데이터
+        """
+        structured = self._extract_structured_data(soup)
+        
+        if all(structured.get(field) for field in self.STRUCTURED_REQUIRED_FIELDS):
+            self._record_structured_data_result('hit')
+            company_info = {field: structured[field] for field in ['legal_name', 'business_number', 'ceo']}
+            contact_info = {
+                'phones': [structured['telephone']],
+                'emails': [structured['email']],
+                'addresses': [structured['address']]
+            }
+            return company_info, contact_info, structured
+        
+        # 정규식 기반 추출 후 구조화 데이터로 보완
+        self._record_structured_data_result('partial' if structured.get('sources') else 'miss')
+        company_info = self._extract_company_info(soup)
+        contact_info = self._extract_contact_info(soup)
+        
+        # og:site_name은 브랜드명인 경우가 많으므로 본문에서 찾은 법인명이 없을 때만 사용
+        from_site_name = structured['field_sources'].get('legal_name') == 'opengraph'
+        if structured.get('legal_name') and not (from_site_name and company_info.get('legal_name')):
+            company_info['legal_name'] = structured['legal_name']
+        for field in ['business_number', 'ceo']:
+            if structured.get(field):
+                company_info[field] = structured[field]
+        for field, key in [('telephone', 'phones'), ('email', 'emails'), ('address', 'addresses')]:
+            value = structured.get(field)
+            if value and value not in contact_info.get(key, []):
+                contact_info[key] = [value] + contact_info.get(key, [])
+        
+        return company_info, contact_info, structured
+    
+    def _record_structured_data_result(self, result: str):
+        """구조화 데이터 빠른 경로 적중률 기록"""
+        metrics.increment(f'scraper.structured_data.{result}')
+        hits = metrics.get_counter('scraper.structured_data.hit')
+        total = hits + sum(metrics.get_counter(f'scraper.structured_data.{name}') for name in ['partial', 'miss'])
+        metrics.set_gauge('scraper.structured_data.hit_rate', round(hits / total, 3) if total else 0.0)
+    
+    def _extract_structured_data(self, soup: BeautifulSoup) -> Dict:
+        """구조화 데이터에서 기업 정보 추출 (JSON-LD → 마이크로데이터 → OpenGraph 순)"""
+        structured = {'sources': [], 'field_sources': {}}
+        
+        for source, extractor in [('json-ld', self._extract_json_ld),
+                                  ('microdata', self._extract_microdata),
+                                  ('opengraph', self._extract_opengraph)]:
+            try:
+                fields = extractor(soup)
+            except Exception:
+                continue
+            
+            found = False
+            for field, value in fields.items():
+                if value and not structured.get(field):
+                    structured[field] = value
+                    structured['field_sources'][field] = source
+                    found = True
+            if found:
+                structured['sources'].append(source)
+        
+        return structured
+    
+    def _extract_json_ld(self, soup: BeautifulSoup) -> Dict:
+        """JSON-LD Organization 블록 추출"""
+        for script in soup.find_all('script', attrs={'type': 'application/ld+json'}):
             try:
-                headers = {
-                    'User-Agent': self.user_agent,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
+                data = json.loads(script.string or '', strict=False)
+            except ValueError:
+                continue
+            
+            for node in self._iter_json_ld_nodes(data):
+                node_types = node.get('@type', [])
+                if isinstance(node_types, str):
+                    node_types = [node_types]
+                if not any(t in self.ORGANIZATION_TYPES for t in node_types):
+                    continue
+                
+                logo = node.get('logo')
+                if isinstance(logo, dict):
+                    logo = logo.get('url') or logo.get('contentUrl')
+                
+                return {
+                    'legal_name': self._clean_text(node.get('legalName') or node.get('name')),
+                    'business_number': self._format_business_number(node.get('taxID') or node.get('vatID')),
+                    'ceo': self._extract_json_ld_ceo(node),
+                    'telephone': self._clean_text(node.get('telephone')),
+                    'email': self._clean_text(node.get('email', '')).replace('mailto:', ''),
+                    'address': self._format_postal_address(node.get('address')),
+                    'logo': logo if isinstance(logo, str) else None
                 }
+        
+        return {}
+    
+    def _extract_json_ld_ceo(self, node: Dict) -> str:
+        """JSON-LD employee·member 중 대표 직함을 가진 사람 이름"""
+        for key in ['employee', 'member']:
+            people = node.get(key) or []
+            for person in people if isinstance(people, list) else [people]:
+                if isinstance(person, dict) and self.CEO_TITLE_PATTERN.search(self._clean_text(person.get('jobTitle'))):
+                    return self._clean_text(person.get('name'))
+        return ''
+    
+    def _format_business_number(self, value) -> str:
+        """사업자등록번호를 000-00-00000 형식으로 (10자리가 아니면 빈 문자열)"""
+        digits = re.sub(r'\D', '', str(value) if isinstance(value, (str, int)) else '')
+        if len(digits) != 10:
+            return ''
+        return f'{digits[:3]}-{digits[3:5]}-{digits[5:]}'
+    
+    def _iter_json_ld_nodes(self, data):
+        """JSON-LD 노드 순회 (목록, @graph 포함)"""
+        if isinstance(data, list):
+            for item in data:
+                yield from self._iter_json_ld_nodes(item)
+        elif isinstance(data, dict):
+            yield data
+            if '@graph' in data:
+                yield from self._iter_json_ld_nodes(data['@graph'])
+    
+    def _extract_microdata(self, soup: BeautifulSoup) -> Dict:
+        """schema.org 마이크로데이터 추출"""
+        for scope in soup.find_all(attrs={'itemscope': True, 'itemtype': True}):
+            item_type = scope['itemtype'].rstrip('/').rsplit('/', 1)[-1]
+            if item_type not in self.ORGANIZATION_TYPES:
+                continue
+            
+            def prop(name):
+                elem = scope.find(attrs={'itemprop': name})
+                if not elem:
+                    return ''
+                return elem.get('content') or elem.get('href') or elem.get('src') or elem.get_text(' ', strip=True)
+            
+            return {
+                'legal_name': self._clean_text(prop('legalName') or prop('name')),
+                'business_number': self._format_business_number(prop('taxID') or prop('vatID')),
+                'telephone': self._clean_text(prop('telephone')),
+                'email': self._clean_text(prop('email')).replace('mailto:', ''),
+                'address': self._clean_text(prop('address')),
+                'logo': prop('logo') or None
+            }
+        
+        return {}
+    
+    def _extract_opengraph(self, soup: BeautifulSoup) -> Dict:
+        """OpenGraph 및 business:contact_data 메타 태그 추출"""
+        og = {}
+        for meta in soup.find_all('meta', attrs={'property': True}):
+            og[meta['property']] = (meta.get('content') or '').strip()
+        
+        address_parts = [og.get(f'business:contact_data:{part}', '') for part in
+                         ['region', 'locality', 'street_address']]
+        
+        return {
+            'legal_name': og.get('og:site_name', ''),
+            'telephone': og.get('business:contact_data:phone_number', ''),
+            'email': og.get('business:contact_data:email', ''),
+            'address': ' '.join(part for part in address_parts if part),
+            'logo': og.get('og:image') or None
+        }
+    
+    def _format_postal_address(self, address) -> str:
+        """PostalAddress 값을 주소 문자열로 변환"""
+        if isinstance(address, list):
+            address = address[0] if address else ''
+        if isinstance(address, dict):
+            parts = [address.get(key, '') for key in
+                     ['addressRegion', 'addressLocality', 'streetAddress']]
+            return ' '.join(self._clean_text(part) for part in parts if part)
+        return self._clean_text(address)
+    
+    def _clean_text(self, value) -> str:
+        """공백 정리"""
+        if not isinstance(value, str):
+            return ''
+        return re.sub(r'\s+', ' ', value).strip()
+    
+    def _get_cached_website_info(self, url: str, cached: Optional[Dict], headers: Dict, cache_status: str) -> Optional[Dict]:
+        """캐시된 추출 결과 반환 및 검증 정보 갱신"""
+        if not cached:
+            return None
+        
+        website_info = self.page_cache.get_extraction(cached['content_hash'])
+        if not website_info:
+            return None
+        
+        self.page_cache.touch(url, cached, headers)
+        website_info['cache_status'] = cache_status
+        website_info['provenance'] = 'cached'
+        return website_info
+    
+    def _build_request_headers(self, cached: Optional[Dict] = None) -> Dict:
+        """요청 헤더 생성 (캐시 항목이 있으면 조건부 요청 헤더 포함)"""
+        headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        }
+        
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        return headers
+    
+    def _fetch_webpage(self, url: str, cached: Optional[Dict] = None,
+                       deadline: Optional[float] = None) -> Optional[requests.Response]:
+        """웹페이지 응답 수집 (도메인 서킷 브레이커 및 마감 시각 적용)"""
+        domain = urlparse(url).hostname or url
+        if deadline is None:
+            deadline = time.monotonic() + self.budget
+        
+        for attempt in range(self.max_retries):
+            # 최근 실패한 도메인은 즉시 포기
+            if not self.breaker.allow(domain):
+                print(f"⛔ {domain} 서킷 브레이커 열림, 웹페이지 수집 생략")
+                metrics.increment('scraper.fetch.short_circuited')
+                return None
+            
+            remaining = deadline - time.monotonic()
+            if remaining < self.min_attempt_timeout:
+                print(f"⏱️ {domain} 수집 마감 시각 초과")
+                metrics.increment('scraper.fetch.deadline_exceeded')
+                return None
+            
+            try:
+                headers = self._build_request_headers(cached)
                 
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                metrics.increment('scraper.fetch.attempts')
+                response = requests.get(url, headers=headers, timeout=min(self.timeout, remaining))
                 response.raise_for_status()
+                self.breaker.record_success(domain)
+                return response
                 
-                # 인코딩 감지
-                if response.encoding.lower() in ['iso-8859-1', 'windows-1252']:
-                    response.encoding = response.apparent_encoding
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
+            except requests.HTTPError as e:
+                # 4xx는 도메인이 응답하고 있으므로 브레이커에 반영하지 않음
+                status_code = e.response.status_code if e.response is not None else 0
+                if status_code < 500:
+                    print(f"⚠️ 웹페이지 응답 오류: {status_code}")
+                    metrics.increment('scraper.fetch.client_errors')
+                    return None
+                self._record_fetch_failure(domain, attempt, e)
                 
             except Exception as e:
-                print(f"⚠️ 웹페이지 수집 시도 {attempt + 1} 실패: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # 지수 백오프
-                else:
+                self._record_fetch_failure(domain, attempt, e)
+            
+            if attempt < self.max_retries - 1:
+                # 지터를 적용한 지수 백오프 (마감 시각을 넘기면 재시도하지 않음)
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+                if time.monotonic() + delay + self.min_attempt_timeout > deadline:
+                    metrics.increment('scraper.fetch.deadline_exceeded')
                     return None
+                time.sleep(delay)
         
         return None
     
+    def _record_fetch_failure(self, domain: str, attempt: int, error: Exception):
+        """수집 실패 기록"""
+        print(f"⚠️ 웹페이지 수집 시도 {attempt + 1} 실패: {str(error)}")
+        metrics.increment('scraper.fetch.failures')
+        self.breaker.record_failure(domain)
+    
+    def _parse_html(self, response: requests.Response) -> BeautifulSoup:
+        """응답 본문 파싱"""
+        # 인코딩 감지 (본문 전체를 통계 분석하는 apparent_encoding 대신 단계별 감지)
+        encoding, method = detect_encoding(response.content, response.headers.get('Content-Type', ''))
+        metrics.increment(f'scraper.charset.{method}')
+        
+        return BeautifulSoup(response.content.decode(encoding, errors='replace'), 'html.parser')
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """페이지 제목 추출"""
         try:
@@ -244,6 +643,117 @@ class WebScraper:
         except Exception:
             return {}
     
+    def _extract_main_content(self, soup: BeautifulSoup, budget: Optional[int] = None) -> str:
+        """
+        본문 발췌 추출 (메뉴, 쿠키 배너, 푸터 제외)
+        
+        트리를 한 번 순회하며(상용구 하위 트리는 건너뜀) 가장 가까운 블록별로 텍스트 길이와
+        링크 텍스트 길이를 집계하고, (텍스트 길이 - 링크 텍스트 길이) 점수를 상위 블록에
+        절반씩 전파해 본문 블록을 고른다.
+        
+        Args:
+            soup: 파싱된 페이지
+            budget: 최대 글자 수 (기본값: SCRAPER_CONTENT_BUDGET)
+            
+        Returns:
+            str: 본문 발췌
+        """
+        started = time.perf_counter()
+        budget = budget or Config.SCRAPER_CONTENT_BUDGET
+        
+        try:
+            root_key = id(soup)
+            block_parents = {root_key: None}
+            block_stats = {}
+            fragments = []
+            
+            # (노드, 링크 내부 여부, 가장 가까운 블록) 스택으로 문서 순서 순회
+            stack = [(soup, False, root_key)]
+            while stack:
+                node, in_link, block_key = stack.pop()
+                if type(node) is NavigableString:
+                    stripped = node.strip()
+                    if stripped:
+                        fragments.append((block_key, stripped, in_link))
+                        stats = block_stats.setdefault(block_key, [0, 0])
+                        stats[0] += len(stripped)
+                        if in_link:
+                            stats[1] += len(stripped)
+                    continue
+                
+                if node is not soup:
+                    if node.name in self.CONTENT_BLOCK_TAGS:
+                        block_parents[id(node)] = block_key
+                        block_key = id(node)
+                    in_link = in_link or node.name == 'a'
+                
+                for child in reversed(node.contents):
+                    if type(child) is NavigableString or (isinstance(child, Tag) and not self._is_boilerplate(child)):
+                        stack.append((child, in_link, block_key))
+            
+            if not fragments:
+                return ''
+            
+            # 링크 비중을 뺀 점수를 상위 블록에 절반씩 전파
+            scores = {}
+            for block_key, (text_length, link_length) in block_stats.items():
+                score = text_length - link_length
+                current = block_key
+                while current is not None and score >= 1:
+                    scores[current] = scores.get(current, 0) + score
+                    current = block_parents.get(current)
+                    score /= 2
+            
+            best_key = max(scores, key=scores.get)
+            
+            # 본문 블록 하위의 링크 밖 텍스트만 예산 내에서 연결
+            parts = []
+            length = 0
+            for block_key, text, in_link in fragments:
+                if in_link or not self._is_descendant_block(block_key, best_key, block_parents):
+                    continue
+                parts.append(text)
+                length += len(text) + 1
+                if length > budget:
+                    break
+            
+            excerpt = re.sub(r'\s+', ' ', ' '.join(parts)).strip()
+            if len(excerpt) > budget:
+                cut = excerpt.rfind(' ', 0, budget)
+                excerpt = excerpt[:cut if cut > budget // 2 else budget].rstrip() + '…'
+            return excerpt
+            
+        except Exception:
+            return ''
+        finally:
+            metrics.observe('scraper.main_content_ms', (time.perf_counter() - started) * 1000)
+    
+    def _is_boilerplate(self, element) -> bool:
+        """메뉴·배너·푸터 등 상용구 요소 여부"""
+        if element.name in self.BOILERPLATE_TAGS:
+            return True
+        
+        attrs = element.attrs
+        if not attrs:
+            return False
+        if attrs.get('aria-hidden') == 'true' or attrs.get('role') in ('navigation', 'banner', 'contentinfo', 'dialog'):
+            return True
+        
+        identifier = attrs.get('id', '')
+        classes = attrs.get('class')
+        if classes:
+            identifier = f"{identifier} {' '.join(classes)}"
+        return bool(identifier) and bool(self.BOILERPLATE_PATTERN.search(identifier))
+    
+    def _is_descendant_block(self, block_key: int, ancestor_key: int, block_parents: Dict) -> bool:
+        """블록이 기준 블록 하위(자신 포함)인지 확인"""
+        current = block_key
+        while current is not None:
+            if current == ancestor_key:
+                return True
+            current = block_parents.get(current)
+        return False
+    
     def _extract_social_links(self, soup: BeautifulSoup) -> List[str]:
         """소셜 미디어 링크 추출"""
         try:
@@ -288,7 +798,8 @@ class WebScraper:
             },
             'social_links': [],
             'last_updated': self._get_current_date(),
-            'status': 'error'
+            'status': 'error',
+            'provenance': 'sample'
         }
     
     def _get_current_date(self) -> str:
@@ -0,0 +1,3 @@
+"""
+InsightMatch2 Benchmarks
+"""
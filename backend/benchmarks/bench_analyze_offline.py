@@ -0,0 +1,99 @@
+"""
+/api/analyze 처리량 벤치마크 (오프라인)
+로컬 LLM 대역 서버를 띄우고 수집 단계는 고정 자료로 바꿔 실제 호출 없이 측정
+
+실행: cd backend && python -m benchmarks.bench_analyze_offline --requests 200 --concurrency 16
+"""
+
+import os
+import time
+import argparse
+import statistics
+import concurrent.futures
+from llm_standin import StandInServer
+
+FIXTURE = {
+    'news': [
+        {'title': f'테스트사 신규 물류센터 개설 {i}', 'snippet': '수도권 배송 역량 강화', 'provenance': 'real'}
+        for i in range(5)
+    ],
+    'dart': [{'title': '사업보고서 (2024.12)', 'type': '정기공시', 'snippet': '테스트사 · 2025-03-20', 'provenance': 'real'}],
+    'social': [],
+    'website': {'title': '테스트사', 'description': '물류 플랫폼', 'keywords': ['물류', '배송'], 'provenance': 'real'}
+}
+
+def configure(base_url: str):
+    """앱 모듈을 불러오기 전에 대역 서버와 오프라인 설정 지정"""
+    os.environ.update({
+        'OPENAI_API_KEY': 'standin',
+        'OPENAI_BASE_URL': base_url,
+        'LLM_CACHE_PATH': '',
+        'RULE_ANALYZER_ENABLED': 'False',
+        'PREFLIGHT_ENABLED': 'False',
+        'SUPABASE_URL': '',
+        'SUPABASE_KEY': ''
+    })
+
+def fixture_crawl(homepage, company_name=None, deadline=None, skip_website=False):
+    """고정 수집 결과 (네트워크 사용 안 함)"""
+    results = {'company': company_name, 'homepage': homepage, 'crawl_date': '', 'status': 'success'}
+    results.update({key: (list(value) if isinstance(value, list) else dict(value)) for key, value in FIXTURE.items()})
+    results['provenance'] = {'real': 7, 'sample': 0, 'cached': 0, 'real_share': 1.0}
+    return results
+
+def percentile(values, ratio):
+    """백분위수"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+def main():
+    parser = argparse.ArgumentParser(description='/api/analyze 오프라인 처리량 벤치마크')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.8, help='LLM 대역 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.2)
+    args = parser.parse_args()
+
+    standin = StandInServer(latency=args.latency, jitter=args.jitter)
+    configure(standin.start())
+
+    from main import create_app
+    from app import routes
+    from app.config import Config
+    from app.services.metrics import metrics
+
+    routes.analyzer.crawler.crawl_public_data = fixture_crawl
+    app = create_app()
+
+    def call(index):
+        started = time.perf_counter()
+        with app.test_client() as client:
+            response = client.post('/api/analyze', json={
+                'homepage': f'https://company{index}.example.com', 'email': 'bench@example.com'
+            })
+        return response.status_code, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(call, range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for status, latency in results if status == 200]
+    failed = len(results) - len(latencies)
+    queue_wait = metrics.snapshot()['observations'].get('llm.queue_wait_ms', {})
+
+    print(f"요청 {args.requests}건 · 동시 {args.concurrency} · LLM 지연 {args.latency * 1000:.0f}ms"
+          f"(+{args.jitter * 1000:.0f}) · LLM 동시 호출 상한 {Config.LLM_MAX_CONCURRENCY}")
+    print(f"{'처리량(req/s)':<16}{len(results) / elapsed:>10.1f}")
+    if latencies:
+        print(f"{'p50(ms)':<16}{statistics.median(latencies):>10.0f}")
+        print(f"{'p95(ms)':<16}{percentile(latencies, 0.95):>10.0f}")
+    print(f"{'LLM 대기 최대(ms)':<16}{queue_wait.get('max', 0):>10.0f}")
+    print(f"{'대역 최대 동시':<16}{standin.peak:>10}")
+    if failed:
+        print(f"⚠️ 실패 {failed}건")
+
+    standin.stop()
+
+if __name__ == '__main__':
+    main()
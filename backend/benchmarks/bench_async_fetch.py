@@ -0,0 +1,132 @@
+"""
+비동기 수집 엔진 처리량 벤치마크
+로컬 대역 HTTP 서버(호스트별 포트)를 띄워 스레드 풀 requests 방식과 비교
+
+실행: cd backend && python -m benchmarks.bench_async_fetch
+"""
+
+import time
+import multiprocessing
+import concurrent.futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from app.services.async_fetcher import AsyncFetchEngine
+
+LATENCY = 0.5
+HOSTS = 25
+URLS_PER_HOST = 16
+BODY = ('<html><head><title>테스트</title></head><body>' + '<p>본문</p>' * 200 + '</body></html>').encode('utf-8')
+
+class InFlightCounter:
+    """서버 측 동시 처리 건수 측정 (프로세스 간 공유)"""
+
+    def __init__(self):
+        self.lock = multiprocessing.Lock()
+        self.current = multiprocessing.Value('i', 0, lock=False)
+        self.peak = multiprocessing.Value('i', 0, lock=False)
+
+    def enter(self):
+        with self.lock:
+            self.current.value += 1
+            self.peak.value = max(self.peak.value, self.current.value)
+
+    def leave(self):
+        with self.lock:
+            self.current.value -= 1
+
+    def reset(self):
+        with self.lock:
+            self.current.value = 0
+            self.peak.value = 0
+
+counter = None
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """지연 후 고정 HTML을 반환하는 대역 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        counter.enter()
+        try:
+            time.sleep(LATENCY)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+        finally:
+            counter.leave()
+
+    def log_message(self, format, *args):
+        pass
+
+class StandInServer(ThreadingHTTPServer):
+    """대기열을 늘린 대역 서버"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+def serve(shared_counter, port_queue):
+    """대역 서버 프로세스 (클라이언트와 GIL을 나누지 않도록 별도 프로세스에서 실행)"""
+    global counter
+    counter = shared_counter
+    server = StandInServer(('127.0.0.1', 0), StandInHandler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+def start_servers(count: int):
+    """호스트 역할을 하는 서버 프로세스 여러 개 시작"""
+    port_queue = multiprocessing.Queue()
+    processes = []
+    for _ in range(count):
+        process = multiprocessing.Process(target=serve, args=(counter, port_queue), daemon=True)
+        process.start()
+        processes.append(process)
+    ports = [port_queue.get(timeout=10) for _ in processes]
+    return processes, ports
+
+def run_thread_pool(urls, workers: int) -> float:
+    """스레드 풀 + requests (기존 방식)"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=HOSTS, pool_maxsize=workers)
+    session.mount('http://', adapter)
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda url: session.get(url, timeout=15).content, urls))
+    return time.perf_counter() - started
+
+def run_async_engine(urls, per_host: int) -> float:
+    """비동기 수집 엔진"""
+    engine = AsyncFetchEngine(max_in_flight=500, per_host_limit=per_host, politeness_delay=0)
+    started = time.perf_counter()
+    results = engine.fetch_all(urls)
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for r in results if not r.ok)
+    if failed:
+        print(f"  ⚠️ 실패 {failed}건")
+    return elapsed
+
+def main():
+    global counter
+    counter = InFlightCounter()
+    processes, ports = start_servers(HOSTS)
+    urls = [f'http://127.0.0.1:{port}/page/{i}' for i in range(URLS_PER_HOST) for port in ports]
+    print(f"요청 {len(urls)}건 · 호스트 {HOSTS}개 · 응답 지연 {LATENCY * 1000:.0f}ms")
+    print(f"{'방식':<28}{'소요(s)':>9}{'req/s':>9}{'최대 동시':>10}")
+
+    cases = [
+        ('thread pool (32 workers)', lambda: run_thread_pool(urls, 32)),
+        ('async engine (host cap 4)', lambda: run_async_engine(urls, 4)),
+        ('async engine (host cap 16)', lambda: run_async_engine(urls, 16)),
+    ]
+    for name, run in cases:
+        counter.reset()
+        elapsed = run()
+        print(f"{name:<28}{elapsed:>9.2f}{len(urls) / elapsed:>9.0f}{counter.peak.value:>10}")
+
+    for process in processes:
+        process.terminate()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+인코딩 감지 벤치마크
+requests의 apparent_encoding(본문 전체 통계 분석)과 단계별 감지를 비교
+
+실행: cd backend && python -m benchmarks.bench_charset
+"""
+
+import time
+import requests
+from app.services.charset_detector import detect_encoding
+
+PARAGRAPH = (
+    '<p>주식회사 테스트는 정보보안 관리체계(ISMS)와 품질경영시스템을 운영하며, '
+    '고객의 개인정보를 안전하게 보호하기 위해 지속적으로 노력하고 있습니다. '
+    '본사: 서울특별시 강남구 테헤란로 123, 대표전화 02-1234-5678</p>\n'
+)
+
+def build_fixture(encoding: str, meta: bool, repeat: int = 600) -> bytes:
+    """한국어 HTML 픽스처 생성 (약 100~150KB)"""
+    head = f'<meta charset="{encoding}">' if meta else ''
+    html = f'<html><head>{head}<title>테스트</title></head><body>{PARAGRAPH * repeat}</body></html>'
+    return html.encode(encoding)
+
+def make_response(content: bytes, content_type: str) -> requests.Response:
+    """requests 응답 객체 생성"""
+    response = requests.Response()
+    response._content = content
+    response.headers['Content-Type'] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+def baseline(response: requests.Response) -> str:
+    """기존 방식: ISO-8859-1이면 apparent_encoding 사용"""
+    if response.encoding and response.encoding.lower() in ['iso-8859-1', 'windows-1252']:
+        return response.apparent_encoding
+    return response.encoding
+
+def detector(response: requests.Response) -> str:
+    """단계별 감지"""
+    return detect_encoding(response.content, response.headers.get('Content-Type', ''))[0]
+
+def measure(func, response, rounds: int) -> float:
+    """평균 소요 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(response)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+def main(rounds: int = 20):
+    cases = [
+        ('EUC-KR, 헤더/메타 없음', build_fixture('euc-kr', meta=False), 'text/html'),
+        ('EUC-KR, <meta charset>', build_fixture('euc-kr', meta=True), 'text/html'),
+        ('UTF-8, 헤더/메타 없음', build_fixture('utf-8', meta=False), 'text/html'),
+        ('UTF-8, 헤더 charset', build_fixture('utf-8', meta=False), 'text/html; charset=utf-8'),
+    ]
+
+    print(f"{'fixture':<26}{'size':>9}{'apparent(ms)':>14}{'detector(ms)':>14}{'speedup':>9}  result")
+    for name, content, content_type in cases:
+        response = make_response(content, content_type)
+        base_ms = measure(baseline, response, rounds)
+        fast_ms = measure(detector, response, rounds)
+        encoding, method = detect_encoding(content, content_type)
+        speedup = base_ms / fast_ms if fast_ms else float('inf')
+        print(f"{name:<26}{len(content) // 1024:>7}KB{base_ms:>14.2f}{fast_ms:>14.3f}{speedup:>8.1f}x  "
+              f"{baseline(response)} → {encoding} ({method})")
+
+if __name__ == '__main__':
+    main()
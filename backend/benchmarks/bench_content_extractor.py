@@ -0,0 +1,53 @@
+"""
+본문 발췌 추출 벤치마크
+메뉴·쿠키 배너·푸터가 포함된 기업 홈페이지 형태의 페이지에서 추출 시간과 발췌 길이 측정
+
+실행: cd backend && python -m benchmarks.bench_content_extractor
+"""
+
+import time
+from bs4 import BeautifulSoup
+from app.config import Config
+from app.services.web_scraper import WebScraper
+
+def build_page(menu_items: int = 400, paragraphs: int = 80) -> str:
+    """기업 홈페이지 형태의 HTML 생성"""
+    menu = ''.join(f'<li><a href="/menu/{i}">메뉴 항목 {i}</a><ul><li><a href="/menu/{i}/sub">하위 메뉴</a></li></ul></li>'
+                   for i in range(menu_items))
+    body = ''.join(f'<p>당사는 {i}번째 사업 영역에서 정보보안 관리체계와 품질경영시스템을 기반으로 '
+                   f'고객에게 안정적인 서비스를 제공하고 있으며, 지속적인 개선 활동을 수행하고 있습니다.</p>'
+                   for i in range(paragraphs))
+    return f"""
+    <html><head><title>테스트 주식회사</title>
+    <script>var tracking = {{"id": "UA-000"}}; function init() {{ return 1; }}</script>
+    <style>.gnb {{ display: flex; }}</style></head>
+    <body>
+      <div id="header"><div class="gnb"><ul>{menu}</ul></div></div>
+      <div class="cookie-banner">이 웹사이트는 쿠키를 사용합니다. <button>동의</button></div>
+      <div id="container">
+        <div class="lnb"><ul>{menu[:4000]}</ul></div>
+        <div class="contents"><h2>회사 소개</h2>{body}</div>
+      </div>
+      <div id="footer"><p>서울특별시 강남구 테헤란로 123 | 대표전화 02-1234-5678 | Copyright 2024</p>
+        <ul>{''.join(f'<li><a href="/f/{i}">패밀리 사이트 {i}</a></li>' for i in range(30))}</ul></div>
+    </body></html>
+    """
+
+def main(rounds: int = 200):
+    scraper = WebScraper()
+    html = build_page()
+    soup = BeautifulSoup(html, 'html.parser')
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        excerpt = scraper._extract_main_content(soup)
+    extract_ms = (time.perf_counter() - started) * 1000 / rounds
+
+    full_text = ' '.join(soup.get_text(' ').split())
+    print(f"페이지 크기: {len(html) // 1024}KB, 전체 텍스트: {len(full_text)}자")
+    print(f"본문 발췌: {len(excerpt)}자 (예산 {Config.SCRAPER_CONTENT_BUDGET}자)")
+    print(f"평균 추출 시간: {extract_ms:.2f}ms ({rounds}회)")
+    print(f"발췌 시작: {excerpt[:80]}…")
+
+if __name__ == '__main__':
+    main()
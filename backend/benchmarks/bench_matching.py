@@ -0,0 +1,82 @@
+"""
+컨설턴트 매칭 점수 계산 벤치마크
+컨설턴트별 반복(_calculate_match_score + 전체 정렬)과 NumPy 배열 연산(score_matrix + top_k) 비교
+
+실행: cd backend && python -m benchmarks.bench_matching --consultants 100000
+"""
+
+import time
+import random
+import argparse
+from app.models.analysis import Analysis
+from app.models.consultant import Consultant
+from app.services.consultant_matrix import ConsultantMatrix
+from app.services.matching_service import MatchingService
+
+CERTIFICATIONS = [
+    'ISO 9001', 'ISO 14001', 'ISO 27001', 'ISO 45001', 'ISO 22301', 'ISO 27701', 'ISO 37001', 'ISO 50001',
+    'ISMS-P', 'ISMS', 'HACCP', 'GMP', 'CMMI', 'ESG 인증', 'K-ESG', '녹색인증', '벤처기업 인증', '이노비즈',
+    '메인비즈', '가족친화인증', 'SOC 2', 'PCI DSS', 'KC 인증', 'GS 인증', 'CSAP'
+]
+INDUSTRIES = ['IT', '제조', '물류', '금융', '유통', '바이오', '건설']
+REGIONS = ['서울', '경기', '부산', '대구', '대전', '광주']
+
+def build_consultants(count: int, seed: int = 42):
+    """무작위 컨설턴트 생성 (고정 시드)"""
+    rng = random.Random(seed)
+    return [
+        Consultant(
+            id=index + 1,
+            name=f'컨설턴트{index + 1}',
+            industry=rng.choice(INDUSTRIES),
+            region=rng.choice(REGIONS),
+            years_experience=rng.randint(0, 25),
+            certifications=rng.sample(CERTIFICATIONS, rng.randint(0, 6)),
+            status='active'
+        )
+        for index in range(count)
+    ]
+
+def legacy_matches(service, analysis, consultants, limit):
+    """기존 방식: 컨설턴트마다 MatchResult 생성 후 전체 정렬"""
+    matches = []
+    for consultant in consultants:
+        match_result = service._calculate_match_score(analysis, consultant)
+        if match_result.match_score > 0.3:
+            matches.append(match_result)
+    matches.sort(key=lambda x: x.match_score, reverse=True)
+    return matches[:limit]
+
+def timed(func, rounds: int):
+    """평균 소요 시간 (ms)와 마지막 결과"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = func()
+    return (time.perf_counter() - started) * 1000 / rounds, result
+
+def main():
+    parser = argparse.ArgumentParser(description='컨설턴트 매칭 점수 계산 벤치마크')
+    parser.add_argument('--consultants', type=int, default=100000)
+    parser.add_argument('--limit', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    consultants = build_consultants(args.consultants)
+    analysis = Analysis(company_name='벤치마크', certifications=[
+        {'item': 'ISO 27001', 'priority': 'High'}, {'item': 'ISMS-P', 'priority': 'High'}, 'ISO 9001'
+    ])
+    service = MatchingService()
+
+    legacy_ms, legacy = timed(lambda: legacy_matches(service, analysis, consultants, args.limit), args.rounds)
+    build_ms, matrix = timed(lambda: ConsultantMatrix(consultants), args.rounds)
+    vector_ms, vectorized = timed(lambda: service.find_matches_in(matrix, analysis, args.limit), args.rounds)
+
+    same = [match.consultant.id for match in legacy] == [match.consultant.id for match in vectorized]
+    print(f"컨설턴트 {args.consultants:,}명 · 상위 {args.limit}명 · {args.rounds}회 평균")
+    print(f"{'기존 반복(ms)':<18}{legacy_ms:>10.1f}")
+    print(f"{'배열 생성(ms)':<18}{build_ms:>10.1f}")
+    print(f"{'배열 점수(ms)':<18}{vector_ms:>10.1f}{legacy_ms / max(vector_ms, 1e-6):>9.0f}x")
+    print(f"{'결과 일치':<18}{'✅' if same else '❌':>10}")
+
+if __name__ == '__main__':
+    main()
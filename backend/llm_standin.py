@@ -0,0 +1,182 @@
+"""
+OpenAI 호환 로컬 대역 서버
+지연 시간을 설정할 수 있고 고정 JSON을 반환하므로 실제 호출 없이 분석 파이프라인 부하 테스트 가능
+
+실행: cd backend && python llm_standin.py --port 8765 --latency 0.8
+사용: OPENAI_API_KEY=standin OPENAI_BASE_URL=http://127.0.0.1:8765/v1 python main.py
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+# 분석 응답 (company_risk_analysis 스키마)
+CANNED_ANALYSIS = {
+    'summary': '대역 서버 분석 결과입니다. 정보보안과 품질관리 체계 점검이 필요합니다.',
+    'risks': [
+        {'item': '정보보안 관리체계 미흡', 'priority': 'High', 'description': '보안 정책과 접근 통제 점검 필요'},
+        {'item': '품질관리 체계 부족', 'priority': 'Medium', 'description': '품질 표준 문서화 필요'}
+    ],
+    'certifications': [
+        {'item': 'ISO 27001', 'priority': 'High', 'description': '정보보안 관리시스템 인증'},
+        {'item': 'ISO 9001', 'priority': 'Medium', 'description': '품질경영시스템 인증'}
+    ],
+    'confidence_score': 0.8
+}
+
+# 출처별 요약 응답 (json_object 형식 요청)
+CANNED_DIGEST = {
+    'risks': [{'item': '정보보안 관리체계 미흡', 'priority': 'High', 'evidence': '대역 서버 요약'}],
+    'notes': '대역 서버 요약입니다.'
+}
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """chat.completions 대역 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/models'):
+            self.send_json({'object': 'list', 'data': [{'id': 'standin', 'object': 'model', 'owned_by': 'local'}]})
+        else:
+            self.send_json({'error': {'message': 'Not found'}}, 404)
+
+    def do_POST(self):
+        standin = self.server.standin
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_json({'error': {'message': 'Not found'}}, 404)
+            return
+
+        standin.enter()
+        try:
+            time.sleep(standin.latency + random.uniform(0, standin.jitter))
+            content = standin.content_for(request)
+            usage = standin.usage_for(request, content)
+            if request.get('stream'):
+                include_usage = (request.get('stream_options') or {}).get('include_usage')
+                self.send_stream(request, content, usage if include_usage else None)
+            else:
+                self.send_json({
+                    'id': 'chatcmpl-standin', 'object': 'chat.completion', 'created': int(time.time()),
+                    'model': request.get('model', 'standin'),
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content},
+                                 'finish_reason': 'stop'}],
+                    'usage': usage
+                })
+        finally:
+            standin.leave()
+
+    def send_stream(self, request, content, usage):
+        """SSE 형식으로 몇 글자씩 나눠 전송"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        base = {'id': 'chatcmpl-standin', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                'model': request.get('model', 'standin')}
+        for start in range(0, len(content), 16):
+            chunk = dict(base, choices=[{'index': 0, 'delta': {'content': content[start:start + 16]},
+                                         'finish_reason': None}])
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+        if usage:
+            self.wfile.write(f"data: {json.dumps(dict(base, choices=[], usage=usage))}\n\n".encode('utf-8'))
+        self.wfile.write(b'data: [DONE]\n\n')
+        self.close_connection = True
+
+    def send_json(self, data, status=200):
+        """JSON 응답 전송"""
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StandInServer:
+    """OpenAI 호환 대역 서버 클래스"""
+
+    def __init__(self, port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 analysis: Optional[dict] = None, digest: Optional[dict] = None, host: str = '127.0.0.1'):
+        self.latency = latency
+        self.jitter = jitter
+        self.analysis = json.dumps(analysis or CANNED_ANALYSIS, ensure_ascii=False)
+        self.digest = json.dumps(digest or CANNED_DIGEST, ensure_ascii=False)
+        self.requests = 0
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self
+        self.base_url = f'http://{host}:{self.httpd.server_address[1]}/v1'
+
+    def start(self) -> str:
+        """백그라운드 스레드에서 서버 시작"""
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def enter(self):
+        """요청 처리 시작 (동시 처리 건수 기록)"""
+        with self._lock:
+            self.requests += 1
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def leave(self):
+        """요청 처리 종료"""
+        with self._lock:
+            self.current -= 1
+
+    def content_for(self, request: dict) -> str:
+        """요청 형식에 맞는 고정 응답 (json_object 요청은 출처별 요약)"""
+        response_format = request.get('response_format') or {}
+        if response_format.get('type') == 'json_object':
+            return self.digest
+        return self.analysis
+
+    @staticmethod
+    def usage_for(request: dict, content: str) -> dict:
+        """근사 사용량 (4글자당 1토큰)"""
+        prompt_tokens = sum(len(message.get('content') or '') for message in request.get('messages', [])) // 4
+        completion_tokens = len(content) // 4
+        return {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'prompt_tokens_details': {'cached_tokens': 0}}
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI 호환 로컬 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.8, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='추가 무작위 지연 상한 (초)')
+    parser.add_argument('--analysis-file', help='분석 응답으로 사용할 JSON 파일')
+    args = parser.parse_args()
+
+    analysis = None
+    if args.analysis_file:
+        with open(args.analysis_file, encoding='utf-8') as f:
+            analysis = json.load(f)
+
+    server = StandInServer(args.port, args.latency, args.jitter, analysis, host=args.host)
+    print(f"🧪 LLM 대역 서버 실행: {server.base_url} (지연 {args.latency}s + 최대 {args.jitter}s)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
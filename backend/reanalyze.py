@@ -0,0 +1,39 @@
+"""
+InsightMatch2 일괄 재분석 스크립트
+프롬프트 변경 후 저장된 분석 결과의 AI 단계를 다시 실행
+
+실행: cd backend && python reanalyze.py --backend openai
+"""
+
+import argparse
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from app.config import Config
+from app.services.bulk_reanalysis import BulkReanalysisRunner, LocalBatchBackend, OpenAIBatchBackend
+from app.services.llm_client import LLMClient
+
+def main():
+    parser = argparse.ArgumentParser(description='저장된 분석 결과 일괄 재분석')
+    parser.add_argument('--backend', choices=['openai', 'local'], default='openai',
+                        help='openai: Batch API (24시간 이내 완료, 비용 절감), local: 요청을 바로 순차 실행')
+    parser.add_argument('--batch-size', type=int, default=Config.BULK_REANALYSIS_BATCH_SIZE)
+    parser.add_argument('--checkpoint', default=Config.BULK_REANALYSIS_CHECKPOINT)
+    parser.add_argument('--poll-interval', type=float, default=Config.BULK_REANALYSIS_POLL_INTERVAL)
+    parser.add_argument('--limit', type=int, default=None, help='이번 실행에서 새로 제출할 최대 건수')
+    args = parser.parse_args()
+
+    if args.backend == 'openai':
+        backend = OpenAIBatchBackend()
+    else:
+        client = LLMClient()
+        backend = LocalBatchBackend(lambda body: client.complete(**body).choices[0].message.content)
+
+    runner = BulkReanalysisRunner(backend, checkpoint_path=args.checkpoint, batch_size=args.batch_size,
+                                  poll_interval=args.poll_interval)
+    runner.run(limit=args.limit)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+"""
+AI 분석 서비스 테스트
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services.ai_analyzer import AIAnalyzer
+from app.services.llm_cache import LLMResponseCache
+from app.services import prompt_assembler
+from app.services.prompt_assembler import PromptAssembler, PromptSection, TokenCounter
+from app.services.json_stream import IncrementalJSONParser
+from app.services.prompt_templates import PromptTemplates
+from app.services.metrics import metrics
+
+AI_RESPONSE = '{"summary": "테스트 요약", "risks": [], "certifications": [{"item": "ISO 27001", "priority": "High", "description": "정보보안"}], "confidence_score": 0.9}'
+
+PUBLIC_DATA = {
+    'company': '테스트',
+    'news': [{'title': '보안 사고', 'snippet': '개인정보 유출'}],
+    'dart': [],
+    'social': [],
+    'website': {}
+}
+
+def make_completion(content=AI_RESPONSE, total_tokens=1500):
+    """LLMClient.complete 응답 객체 생성"""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.usage.total_tokens = total_tokens
+    return response
+
+class TestLLMResponseCache(unittest.TestCase):
+    """LLM 응답 캐시 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.cache_dir, 'llm.sqlite3')
+        metrics.reset()
+
+    def tearDown(self):
+        """임시 캐시 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_fingerprint_changes_with_params(self):
+        """파라미터별 지문 구분 테스트"""
+        messages = [{'role': 'user', 'content': '분석'}]
+        key = LLMResponseCache.fingerprint('gpt-4o-mini', messages, {'temperature': 0.3})
+
+        self.assertEqual(key, LLMResponseCache.fingerprint('gpt-4o-mini', messages, {'temperature': 0.3}))
+        self.assertNotEqual(key, LLMResponseCache.fingerprint('gpt-4o-mini', messages, {'temperature': 0.7}))
+        self.assertNotEqual(key, LLMResponseCache.fingerprint('gpt-4o', messages, {'temperature': 0.3}))
+
+    def test_ttl_expiry(self):
+        """TTL 만료 테스트"""
+        cache = LLMResponseCache(self.db_path, ttl_seconds=0.05, max_entries=10)
+        cache.set('key', 'gpt-4o-mini', AI_RESPONSE, 100)
+        self.assertIsNotNone(cache.get('key'))
+
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.count(), 0)
+
+    def test_lru_eviction(self):
+        """최대 건수 초과 시 LRU 제거 테스트"""
+        cache = LLMResponseCache(self.db_path, ttl_seconds=3600, max_entries=2)
+        cache.set('a', 'gpt-4o-mini', 'A')
+        cache.set('b', 'gpt-4o-mini', 'B')
+        time.sleep(0.01)
+        cache.get('a')
+        cache.set('c', 'gpt-4o-mini', 'C')
+
+        self.assertEqual(cache.count(), 2)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_analyzer_skips_api_on_identical_input(self):
+        """동일 입력 재분석 시 API 호출 생략 테스트"""
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(self.db_path, ttl_seconds=3600, max_entries=10)
+        analyzer.client = MagicMock()
+        analyzer.client.complete.return_value = make_completion()
+
+        first = analyzer.analyze_company_risks(PUBLIC_DATA)
+        second = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        self.assertEqual(analyzer.client.complete.call_count, 1)
+        self.assertEqual(first['summary'], second['summary'])
+        self.assertEqual(metrics.get_counter('llm_cache.hits'), 1)
+        self.assertEqual(metrics.get_counter('llm_cache.misses'), 1)
+        self.assertEqual(metrics.get_counter('llm_cache.tokens_saved'), 1500)
+
+    def test_truncated_response_not_cached(self):
+        """잘린 응답은 캐시하지 않고 다음 분석에서 다시 호출하는지 테스트"""
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(self.db_path, ttl_seconds=3600, max_entries=10)
+        analyzer.client = MagicMock()
+        analyzer.client.complete.side_effect = [make_completion(AI_RESPONSE[:40]), make_completion()]
+
+        first = analyzer.analyze_company_risks(PUBLIC_DATA)
+        second = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        self.assertIn('텍스트 추출', first['analysis_method'])
+        self.assertEqual(second['summary'], '테스트 요약')
+        self.assertEqual(analyzer.client.complete.call_count, 2)
+
+    def test_unparseable_cache_entry_replaced(self):
+        """읽을 수 없는 캐시 항목은 삭제하고 API를 다시 호출하는지 테스트"""
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(self.db_path, ttl_seconds=3600, max_entries=10)
+        analyzer.client = MagicMock()
+        analyzer.client.complete.return_value = make_completion()
+        messages, params, _ = analyzer._build_request(PUBLIC_DATA)
+        key = analyzer.response_cache.fingerprint(analyzer.model, messages, params)
+        analyzer.response_cache.set(key, analyzer.model, '{"summary": "잘린', 100)
+
+        result = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        self.assertEqual(result['summary'], '테스트 요약')
+        self.assertEqual(analyzer.client.complete.call_count, 1)
+        self.assertEqual(analyzer.response_cache.get(key)['content'], AI_RESPONSE)
+        self.assertEqual(metrics.get_counter('llm_cache.invalid'), 1)
+
+class TestPromptAssembler(unittest.TestCase):
+    """토큰 예산 기반 프롬프트 조립 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.counter = TokenCounter()
+
+    def test_budget_and_priority(self):
+        """예산 준수 및 우선순위 테스트"""
+        assembler = PromptAssembler(300, self.counter)
+        sections = [
+            PromptSection('news', '뉴스', [f'- 뉴스 {i}: ' + '보안 사고 발생 ' * 10 for i in range(20)], priority=2),
+            PromptSection('dart', '공시', ['- 사업보고서: 2024년 사업보고서 제출'], priority=1)
+        ]
+
+        prompt, report = assembler.assemble('머리말', sections, '분석 요청')
+
+        self.assertLessEqual(report['total'], 300)
+        self.assertIn('사업보고서', prompt)
+        self.assertIn('news', report['dropped'])
+        self.assertGreater(report['sections']['dart'], 0)
+        # 구역 순서는 입력 순서 유지
+        self.assertLess(prompt.index('=== 뉴스 ==='), prompt.index('=== 공시 ==='))
+
+    def test_section_cap_and_item_truncation(self):
+        """구역 상한 및 항목 자르기 테스트"""
+        assembler = PromptAssembler(2000, self.counter)
+        long_item = '본문 ' * 400
+        sections = [
+            PromptSection('website', '웹사이트', [long_item], max_item_tokens=100),
+            PromptSection('news', '뉴스', ['- 뉴스: 짧은 기사'] * 50, max_tokens=60)
+        ]
+
+        prompt, report = assembler.assemble('', sections, '')
+
+        self.assertLessEqual(report['sections']['website'], 102)
+        self.assertLessEqual(report['sections']['news'], 60)
+        self.assertNotIn(long_item, prompt)
+
+    def test_empty_sections_use_placeholder(self):
+        """빈 구역 안내문 테스트"""
+        assembler = PromptAssembler(500, self.counter)
+        prompt, report = assembler.assemble('', [PromptSection('dart', '공시', [], empty_text='공시 정보 없음')], '')
+
+        self.assertIn('공시 정보 없음', prompt)
+        self.assertEqual(report['sections']['dart'], 0)
+
+    def test_slow_tokenizer_load_falls_back_to_heuristic(self):
+        """토크나이저 로드가 멈추면 제한 시간 뒤 근사치로 전환하고 재시도하지 않는지 테스트"""
+        if prompt_assembler.tiktoken is None:
+            self.skipTest('tiktoken 미설치')
+
+        calls = []
+
+        def slow_get_encoding(name):
+            calls.append(name)
+            time.sleep(1)
+
+        with patch.object(prompt_assembler.tiktoken, 'get_encoding', side_effect=slow_get_encoding), \
+                patch.dict(prompt_assembler._encodings, clear=True):
+            started = time.perf_counter()
+            encoding = prompt_assembler._load_encoding('test_encoding', timeout=0.05)
+            elapsed = time.perf_counter() - started
+            again = prompt_assembler._load_encoding('test_encoding', timeout=0.05)
+
+        self.assertIsNone(encoding)
+        self.assertIsNone(again)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(calls, ['test_encoding'])
+
+class TestPromptLayout(unittest.TestCase):
+    """프롬프트 캐시용 배치 테스트 클래스"""
+
+    def test_static_instructions_form_shared_prefix(self):
+        """기업이 달라도 지시문과 응답 형식이 공통 앞부분인지 테스트"""
+        analyzer = AIAnalyzer()
+        first, params, _ = analyzer._build_request(PUBLIC_DATA)
+        second, _, _ = analyzer._build_request(dict(PUBLIC_DATA, company='다른회사', news=[]))
+
+        self.assertEqual(first[0], second[0])
+        prefix = os.path.commonprefix([first[1]['content'], second[1]['content']])
+        self.assertIn(PromptTemplates.ANALYSIS_INSTRUCTIONS.strip(), prefix)
+        self.assertNotIn('테스트', prefix)
+        self.assertTrue(first[1]['content'].rstrip().endswith('웹사이트 정보 없음'))
+
+    def test_prefix_tokens_reported(self):
+        """고정 지시문 토큰 수와 캐시 최소 길이 충족 여부를 보고하는지 테스트"""
+        analyzer = AIAnalyzer()
+        _, _, report = analyzer._build_request(PUBLIC_DATA)
+
+        self.assertEqual(report['prefix'], analyzer.prompt_assembler.counter.count(PromptTemplates.ANALYSIS_INSTRUCTIONS))
+        self.assertEqual(report['prefix_cacheable'], report['prefix'] >= PromptTemplates.PROMPT_CACHE_MIN_TOKENS)
+
+class TestStreamingAnalysis(unittest.TestCase):
+    """스트리밍 분석 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.cache_dir = tempfile.mkdtemp()
+        metrics.reset()
+
+    def tearDown(self):
+        """임시 캐시 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_incremental_parser_chunk_boundaries(self):
+        """청크 경계와 무관한 필드 완성 테스트"""
+        text = '```json\n{"summary": "요약 \\"인용\\" {괄호}, 쉼표", "risks": [{"item": "a,b"}], "confidence_score": 0.9}'
+        for size in (1, 2, 3, 7, len(text)):
+            parser = IncrementalJSONParser()
+            fields = []
+            for start in range(0, len(text), size):
+                fields.extend(parser.feed(text[start:start + size]))
+
+            self.assertEqual(fields, [
+                ('summary', '요약 "인용" {괄호}, 쉼표'),
+                ('risks', [{'item': 'a,b'}]),
+                ('confidence_score', 0.9)
+            ])
+
+    def test_summary_emitted_before_lists_finish(self):
+        """목록 생성 중에도 요약이 먼저 전달되는지 테스트"""
+        events = []
+        chunks = ['{"summary": "테스트', ' 요약", "ri', 'sks": [{"item": "보안"', ', "priority": "High", "description": ""}]',
+                  ', "certifications": [], "confidence_score": 0.9}']
+
+        def stream(**kwargs):
+            for chunk in chunks:
+                events.append(('chunk', chunk))
+                yield chunk
+
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(os.path.join(self.cache_dir, 'llm.sqlite3'))
+        analyzer.client = MagicMock()
+        analyzer.client.stream.side_effect = stream
+
+        result = analyzer.analyze_company_risks_stream(PUBLIC_DATA, lambda name, value: events.append((name, value)))
+
+        # 두 번째 청크(요약 뒤 쉼표) 직후, 위험 목록이 끝나기 전에 요약 전달
+        self.assertEqual(events.index(('summary', '테스트 요약')), 2)
+        self.assertEqual([e[0] for e in events if e[0] != 'chunk'], list(AIAnalyzer.RESPONSE_FIELDS))
+        self.assertEqual(result['risks'][0]['item'], '보안')
+        self.assertEqual(metrics.snapshot()['observations']['llm.time_to_first_field_ms']['count'], 1)
+        self.assertEqual(analyzer.client.stream.call_args.kwargs['response_format']['type'], 'json_schema')
+
+    def test_concurrent_request_does_not_change_cached_tokens(self):
+        """스트리밍 중 다른 분석이 프롬프트를 만들어도 자기 프롬프트 토큰 수로 캐시하는지 테스트"""
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(os.path.join(self.cache_dir, 'llm.sqlite3'))
+        analyzer.client = MagicMock()
+        other = dict(PUBLIC_DATA, company='다른회사', news=[{'title': '기사', 'snippet': '긴 본문 ' * 200}])
+
+        def stream(**kwargs):
+            analyzer._build_request(other)
+            yield AI_RESPONSE
+
+        analyzer.client.stream.side_effect = stream
+        analyzer.analyze_company_risks_stream(PUBLIC_DATA, lambda name, value: None)
+
+        messages, params, report = analyzer._build_request(PUBLIC_DATA)
+        cached = analyzer.response_cache.get(analyzer.response_cache.fingerprint(analyzer.model, messages, params))
+        self.assertEqual(cached['total_tokens'], report['total'] + analyzer.prompt_assembler.counter.count(AI_RESPONSE))
+
+class TestMapReduceAnalysis(unittest.TestCase):
+    """출처별 요약 병렬 실행 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.cache_dir = tempfile.mkdtemp()
+        metrics.reset()
+
+    def tearDown(self):
+        """임시 캐시 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def make_analyzer(self, complete):
+        """map_reduce 모드 분석기 생성"""
+        analyzer = AIAnalyzer()
+        analyzer.analysis_mode = 'map_reduce'
+        analyzer.response_cache = LLMResponseCache(os.path.join(self.cache_dir, 'llm.sqlite3'))
+        analyzer.client = MagicMock()
+        analyzer.client.complete.side_effect = complete
+        return analyzer
+
+    def test_map_calls_run_in_parallel(self):
+        """출처별 요약 병렬 실행 후 통합 결과 파싱 테스트"""
+        def complete(**kwargs):
+            if kwargs['response_format']['type'] == 'json_object':
+                time.sleep(0.2)
+                return make_completion('{"risks": [{"item": "보안", "priority": "High", "evidence": "유출"}]}', 100)
+            return make_completion()
+
+        analyzer = self.make_analyzer(complete)
+        public_data = dict(PUBLIC_DATA, dart=[{'title': '사업보고서', 'type': '정기공시', 'snippet': ''}],
+                           website={'title': '테스트', 'description': '클라우드 서비스'})
+
+        started = time.monotonic()
+        result = analyzer.analyze_company_risks(public_data)
+        elapsed = time.monotonic() - started
+
+        # 요약 3건(각 0.2초)이 동시에 실행되므로 합계보다 짧아야 함
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(analyzer.client.complete.call_count, 4)
+        self.assertEqual(result['summary'], '테스트 요약')
+        self.assertEqual(metrics.snapshot()['observations']['llm.map_reduce.map_ms']['count'], 3)
+        reduce_prompt = analyzer.client.complete.call_args.kwargs['messages'][1]['content']
+        self.assertIn('"evidence": "유출"', reduce_prompt)
+        # 요약 응답은 캐시되므로 다시 구성해도 API를 호출하지 않고 같은 통합 프롬프트의 보고서를 얻음
+        _, _, report = analyzer._build_request(public_data)
+        self.assertEqual(analyzer.client.complete.call_count, 4)
+        self.assertEqual(report['total'], analyzer.prompt_assembler.counter.count(reduce_prompt))
+
+    def test_failed_digest_marked_and_empty_sources_skipped(self):
+        """일부 요약 실패 표시 및 자료 없는 출처 생략 테스트"""
+        def complete(**kwargs):
+            if kwargs['response_format']['type'] == 'json_object':
+                raise RuntimeError('timeout')
+            return make_completion()
+
+        analyzer = self.make_analyzer(complete)
+        result = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        # 모든 요약이 실패하면 샘플 분석으로 대체
+        self.assertIn('Sample Analysis', result['analysis_method'])
+        self.assertEqual(analyzer.client.complete.call_count, 1)
+        self.assertEqual(metrics.get_counter('llm.map_reduce.map_failures'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
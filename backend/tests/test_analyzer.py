@@ -0,0 +1,167 @@
+"""
+기업 분석 파이프라인 테스트
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services.analyzer import CompanyAnalyzer
+from app.services.crawler import CrawlerService
+from app.services.metrics import metrics
+
+REAL_NEWS = [
+    {'title': f'테스트사 신규 공장 착공 {i}', 'snippet': '생산 능력 확대', 'provenance': 'real'}
+    for i in range(3)
+]
+
+class TestPlaceholderDataGate(unittest.TestCase):
+    """샘플 데이터 차단 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.analyzer = CompanyAnalyzer()
+        self.analyzer.ai_analyzer = MagicMock()
+        self.analyzer.ai_analyzer.analyze_company_risks.return_value = {
+            'summary': 'AI 요약', 'risks': [], 'certifications': [], 'confidence_score': 0.9,
+            'analysis_method': 'AI (GPT-4o-mini)'
+        }
+        self.analyzer._save_analysis_to_db = MagicMock(return_value=None)
+
+    def crawl_with(self, news, dart, website):
+        """수집 서비스 결과 고정"""
+        crawler = self.analyzer.crawler
+        crawler.news_service.fetch_news = MagicMock(return_value=news)
+        crawler.dart_service.fetch_filings = MagicMock(return_value=dart)
+        crawler.web_scraper.scrape_website = MagicMock(return_value=website)
+
+    def test_sample_data_skips_llm_and_db(self):
+        """샘플 데이터 위주면 LLM 호출과 DB 저장 생략 테스트"""
+        crawler = self.analyzer.crawler
+        self.crawl_with(
+            crawler.news_service._get_sample_news('테스트', 3),
+            crawler.dart_service._get_sample_dart_data('테스트', 3),
+            crawler.web_scraper._get_sample_website_data('https://example.com')
+        )
+
+        result = self.analyzer.analyze('https://example.com', 'test@example.com')
+
+        self.assertTrue(result['degraded'])
+        self.assertEqual(result['data_provenance']['real_share'], 0.0)
+        self.assertLessEqual(result['confidence_score'], 0.5)
+        self.analyzer.ai_analyzer.analyze_company_risks.assert_not_called()
+        self.analyzer._save_analysis_to_db.assert_not_called()
+
+    @patch('app.services.analyzer.Config.RULE_ANALYZER_ENABLED', False)
+    def test_real_data_runs_full_pipeline(self):
+        """실데이터가 충분하면 전체 분석 실행 테스트"""
+        self.crawl_with(REAL_NEWS, [], {'title': '테스트', 'provenance': 'cached'})
+
+        result = self.analyzer.analyze('https://example.com', 'test@example.com')
+
+        self.assertFalse(result['degraded'])
+        self.assertEqual(result['data_provenance']['cached'], 1)
+        self.analyzer.ai_analyzer.analyze_company_risks.assert_called_once()
+        self.analyzer._save_analysis_to_db.assert_called_once()
+
+    @patch('app.services.analyzer.Config.RULE_ANALYZER_ENABLED', False)
+    def test_direct_crawl_skips_shared_executor(self):
+        """추측 분석을 쓰지 않으면 공용 수집 스레드 풀 없이 직접 수집하는지 테스트"""
+        self.crawl_with(REAL_NEWS, [], {'title': '테스트', 'provenance': 'real'})
+
+        with patch('app.services.crawler._crawl_executor') as executor:
+            result = self.analyzer.analyze('https://example.com', 'test@example.com')
+
+        executor.submit.assert_not_called()
+        self.assertEqual(len(result['news']), 3)
+
+    def test_provenance_summary(self):
+        """출처 집계 테스트 (태그 없는 항목은 실데이터, 소셜은 제외)"""
+        summary = CrawlerService()._summarize_provenance({
+            'news': [{'title': 'a'}, {'title': 'b', 'provenance': 'sample'}],
+            'dart': [{'title': 'c', 'provenance': 'real'}],
+            'website': {'title': 'd', 'provenance': 'cached'},
+            'social': [{'title': 'e'}]
+        })
+
+        self.assertEqual(summary, {'real': 2, 'sample': 1, 'cached': 1, 'real_share': 0.75})
+
+    def test_empty_collection_not_degraded(self):
+        """수집 항목이 없을 때 실데이터 비율 1.0 테스트 (샘플 대체가 없으므로 축소 분석하지 않음)"""
+        summary = CrawlerService()._summarize_provenance({'news': [], 'dart': [], 'website': {}, 'social': []})
+
+        self.assertEqual(summary['real_share'], 1.0)
+
+@patch('app.services.analyzer.Config.SPECULATIVE_ANALYSIS_ENABLED', True)
+@patch('app.services.analyzer.Config.RULE_ANALYZER_ENABLED', False)
+class TestSpeculativeAnalysis(unittest.TestCase):
+    """추측 분석 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정 (홈페이지 수집과 AI 분석이 각각 0.3초 소요)"""
+        metrics.reset()
+        self.analyzer = CompanyAnalyzer()
+        self.analyzer.ai_analyzer = MagicMock()
+        self.analyzer.ai_analyzer.analyze_company_risks.side_effect = self.slow_analysis
+        self.analyzer._save_analysis_to_db = MagicMock(return_value=None)
+        crawler = self.analyzer.crawler
+        crawler.news_service.fetch_news = MagicMock(return_value=REAL_NEWS)
+        crawler.dart_service.fetch_filings = MagicMock(return_value=[])
+
+    def slow_analysis(self, public_data, deadline=None):
+        """느린 AI 분석"""
+        time.sleep(0.3)
+        return {'summary': 'AI 요약', 'risks': [], 'certifications': [], 'confidence_score': 0.9,
+                'analysis_method': 'AI (GPT-4o-mini)'}
+
+    def slow_website(self, website):
+        """느린 홈페이지 수집"""
+        def scrape(homepage, deadline=None):
+            time.sleep(0.3)
+            return website
+        self.analyzer.crawler.web_scraper.scrape_website = MagicMock(side_effect=scrape)
+
+    def test_speculation_kept_when_website_adds_nothing(self):
+        """홈페이지 정보가 신호를 바꾸지 않으면 추측 결과 사용 테스트"""
+        self.slow_website({'title': '테스트', 'description': '회사 소개', 'provenance': 'real'})
+
+        started = time.monotonic()
+        result = self.analyzer.analyze('https://example.com', 'test@example.com')
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(result['website']['title'], '테스트')
+        self.assertLess(elapsed, 0.55)
+        self.analyzer.ai_analyzer.analyze_company_risks.assert_called_once()
+        self.assertEqual(self.analyzer.ai_analyzer.analyze_company_risks.call_args.args[0]['website'], {})
+        self.assertEqual(metrics.get_counter('analysis.speculation.kept'), 1)
+        self.assertGreater(metrics.snapshot()['observations']['analysis.speculation.saved_ms']['max'], 200)
+
+    def test_rerun_when_website_changes_signals(self):
+        """홈페이지에 강한 리스크 신호가 있으면 재분석 테스트"""
+        self.slow_website({'title': '테스트', 'description': '랜섬웨어 해킹 피해 공지', 'provenance': 'real'})
+
+        self.analyzer.analyze('https://example.com', 'test@example.com')
+
+        calls = self.analyzer.ai_analyzer.analyze_company_risks.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[1].args[0]['website']['description'], '랜섬웨어 해킹 피해 공지')
+        self.assertEqual(metrics.get_counter('analysis.speculation.rerun'), 1)
+        self.assertEqual(metrics.snapshot()['gauges']['analysis.speculation.kept_share'], 0.0)
+        # 버린 추측 분석은 끝난 뒤 낭비된 LLM 호출로 기록
+        for _ in range(50):
+            if metrics.get_counter('analysis.speculation.wasted_llm_calls'):
+                break
+            time.sleep(0.01)
+        self.assertEqual(metrics.get_counter('analysis.speculation.wasted_llm_calls'), 1)
+
+    def test_completion_times_recorded_by_collectors(self):
+        """출처별 완료 시각이 수집 스레드에서 기록되어 결과 대기 직후에도 있는지 테스트"""
+        self.slow_website({'title': '테스트', 'provenance': 'real'})
+
+        job = self.analyzer.crawler.start_crawl('https://example.com', '테스트')
+        job.result()
+
+        self.assertEqual(set(job.completed_at), set(job.futures))
+        self.assertGreaterEqual(job.completed_at['website'] - job.started, 0.3)
+
+if __name__ == '__main__':
+    unittest.main()
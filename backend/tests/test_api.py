@@ -4,7 +4,9 @@ API 엔드포인트 테스트
 
 import unittest
 import json
+from unittest.mock import patch
 from main import create_app
+from app.services.preflight import PreflightResult
 
 class TestAPI(unittest.TestCase):
     """API 테스트 클래스"""
@@ -24,8 +26,13 @@ class TestAPI(unittest.TestCase):
         self.assertTrue(data['success'])
         self.assertEqual(data['data']['status'], 'healthy')
     
-    def test_analyze_company_success(self):
+    @patch('app.routes.preflight_checker.check')
+    def test_analyze_company_success(self, mock_check):
         """기업 분석 성공 테스트"""
+        mock_check.return_value = PreflightResult(
+            url='https://example.com', canonical_url='https://example.com',
+            resolvable=True, reachable=True, status_code=200
+        )
         test_data = {
             'homepage': 'https://example.com',
             'email': 'test@example.com'
@@ -42,6 +49,88 @@ class TestAPI(unittest.TestCase):
         self.assertTrue(data['success'])
         self.assertIn('data', data)
     
+    @patch('app.routes.preflight_checker.check')
+    def test_analyze_company_unresolvable_homepage(self, mock_check):
+        """DNS 조회 실패 홈페이지 거부 테스트"""
+        mock_check.return_value = PreflightResult(
+            url='https://no-such-host.example', canonical_url='https://no-such-host.example',
+            reason='DNS 조회 실패: no-such-host.example'
+        )
+        test_data = {
+            'homepage': 'https://no-such-host.example',
+            'email': 'test@example.com'
+        }
+        
+        with patch('app.routes.analyzer.analyze') as mock_analyze:
+            response = self.client.post(
+                '/api/analyze',
+                data=json.dumps(test_data),
+                content_type='application/json'
+            )
+            mock_analyze.assert_not_called()
+        
+        self.assertEqual(response.status_code, 422)
+        data = json.loads(response.data)
+        self.assertFalse(data['success'])
+        self.assertEqual(data['error_code'], 'UNREACHABLE_HOMEPAGE')
+        self.assertFalse(data['details']['resolvable'])
+    
+    @patch('app.routes.preflight_checker.check')
+    def test_analyze_company_unreachable_homepage(self, mock_check):
+        """접속 불가 홈페이지는 웹사이트 수집 생략 후 분석 테스트"""
+        mock_check.return_value = PreflightResult(
+            url='https://example.com', canonical_url='https://example.com',
+            resolvable=True, reason='응답 시간 초과 (1.5초)'
+        )
+        test_data = {
+            'homepage': 'https://example.com',
+            'email': 'test@example.com'
+        }
+        
+        with patch('app.routes.analyzer.crawler.web_scraper.scrape_website') as mock_scrape:
+            response = self.client.post(
+                '/api/analyze',
+                data=json.dumps(test_data),
+                content_type='application/json'
+            )
+            mock_scrape.assert_not_called()
+        
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['data']['website'], {})
+        self.assertFalse(data['data']['preflight']['reachable'])
+    
+    @patch('app.routes.preflight_checker.check')
+    def test_analyze_company_stream(self, mock_check):
+        """기업 분석 스트리밍 테스트"""
+        mock_check.return_value = PreflightResult(
+            url='https://example.com', canonical_url='https://example.com',
+            resolvable=True, reachable=True, status_code=200
+        )
+        test_data = {
+            'homepage': 'https://example.com',
+            'email': 'test@example.com'
+        }
+        
+        response = self.client.post(
+            '/api/analyze/stream',
+            data=json.dumps(test_data),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = [
+            (block.split('\n')[0][len('event: '):], json.loads(block.split('\n')[1][len('data: '):]))
+            for block in response.get_data(as_text=True).strip().split('\n\n')
+        ]
+        names = [event for event, _ in events]
+        self.assertEqual(names[-1], 'result')
+        field_names = [payload['name'] for event, payload in events if event == 'field']
+        self.assertEqual(field_names[0], 'summary')
+        self.assertEqual(events[-1][1]['summary'], events[names.index('field')][1]['value'])
+    
     def test_analyze_company_missing_fields(self):
         """기업 분석 필수 필드 누락 테스트"""
         test_data = {
@@ -173,6 +262,16 @@ class TestAPI(unittest.TestCase):
         self.assertTrue(data['success'])
         self.assertIn('data', data)
     
+    def test_metrics(self):
+        """서비스 지표 조회 테스트"""
+        response = self.client.get('/api/metrics')
+        self.assertEqual(response.status_code, 200)
+        
+        data = json.loads(response.data)
+        self.assertTrue(data['success'])
+        self.assertIn('counters', data['data'])
+        self.assertIn('circuit_breaker.web_scraper', data['data'])
+    
     def test_api_docs(self):
         """API 문서 조회 테스트"""
         response = self.client.get('/api/docs')
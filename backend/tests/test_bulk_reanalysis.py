@@ -0,0 +1,240 @@
+"""
+일괄 재분석 테스트
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.models.analysis import Analysis
+from app.services.ai_analyzer import AIAnalyzer
+from app.services.bulk_reanalysis import BatchBackend, BulkReanalysisRunner, LocalBatchBackend, OpenAIBatchBackend
+
+AI_RESPONSE = '{"summary": "재분석 요약", "risks": [], "certifications": [{"item": "ISO 27001", "priority": "High", "description": "정보보안"}], "confidence_score": 0.9}'
+
+class FakeDatabaseService:
+    """분석 결과 저장소 대역"""
+
+    def __init__(self, count):
+        self.analyses = [
+            Analysis(id=i, company_name=f'회사{i}', news_data=[{'title': f'뉴스 {i}', 'snippet': '보안 사고'}])
+            for i in range(1, count + 1)
+        ]
+        self.updates = {}
+        self.cleared = []
+        self.fail_updates = False
+
+    def list_analyses(self, after_id=0, limit=100):
+        return [analysis for analysis in self.analyses if analysis.id > after_id][:limit]
+
+    def get_analyses_by_ids(self, analysis_ids):
+        return [analysis for analysis in self.analyses if analysis.id in analysis_ids]
+
+    def replace_matches(self, analysis_id, company_id, matches, directory_stamp=None):
+        self.cleared.append(analysis_id)
+        return True
+
+    def update_analysis_result(self, analysis_id, fields):
+        if self.fail_updates:
+            return False
+        self.updates.setdefault(analysis_id, []).append(fields)
+        return True
+
+class TestBulkReanalysisRunner(unittest.TestCase):
+    """일괄 재분석 실행 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.temp_dir, 'checkpoint.json')
+        self.db = FakeDatabaseService(7)
+        self.ai_analyzer = AIAnalyzer()
+
+    def tearDown(self):
+        """임시 파일 삭제"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_runner(self, backend):
+        """실행기 생성"""
+        return BulkReanalysisRunner(backend, db_service=self.db, ai_analyzer=self.ai_analyzer,
+                                    checkpoint_path=self.checkpoint, batch_size=3, poll_interval=0)
+
+    def test_writes_back_all_analyses(self):
+        """전체 분석 재실행 및 저장 테스트"""
+        bodies = []
+        backend = LocalBatchBackend(lambda body: bodies.append(body) or AI_RESPONSE)
+
+        state = self.make_runner(backend).run()
+
+        self.assertEqual(state['updated'], 7)
+        self.assertEqual(len(backend.batches), 3)
+        self.assertEqual(sorted(self.db.updates), list(range(1, 8)))
+        self.assertEqual(self.db.updates[1][0]['summary'], '재분석 요약')
+        self.assertEqual(self.db.updates[1][0]['analysis_method'], 'AI Batch (GPT-4o-mini)')
+        self.assertIn('회사1', bodies[0]['messages'][1]['content'])
+        self.assertEqual(bodies[0]['response_format']['type'], 'json_schema')
+
+    def test_resume_after_interruption(self):
+        """중단 후 재실행 시 제출한 배치는 결과만 받고 이어서 진행 테스트"""
+        calls = []
+
+        def interrupted(body):
+            calls.append(body)
+            if len(calls) == 5:
+                raise KeyboardInterrupt
+            return AI_RESPONSE
+
+        # 배치를 보관하는 원격 백엔드처럼 두 실행이 같은 백엔드 사용
+        backend = LocalBatchBackend(interrupted)
+        with self.assertRaises(KeyboardInterrupt):
+            self.make_runner(backend).run()
+
+        with open(self.checkpoint, encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['pending']), 1)
+
+        resumed_calls = []
+        backend.handler = lambda body: resumed_calls.append(body) or AI_RESPONSE
+        state = self.make_runner(backend).run()
+
+        self.assertEqual(len(resumed_calls), 4)
+        self.assertEqual(state['updated'], 7)
+        self.assertTrue(all(len(updates) == 1 for updates in self.db.updates.values()))
+
+    def test_expired_batch_resubmitted(self):
+        """만료된 배치의 분석 재제출 테스트"""
+        with open(self.checkpoint, 'w', encoding='utf-8') as f:
+            json.dump({'last_id': 3, 'pending': {'lost_batch': [1, 2, 3]}, 'updated': 0, 'failed': []}, f)
+
+        state = self.make_runner(LocalBatchBackend(lambda body: AI_RESPONSE)).run()
+
+        self.assertEqual(state['updated'], 7)
+        self.assertEqual(state['failed'], [])
+        self.assertEqual(state['pending'], {})
+
+    def test_invalid_json_not_written(self):
+        """JSON이 아닌 응답은 덮어쓰지 않고 실패 기록 테스트"""
+        state = self.make_runner(LocalBatchBackend(lambda body: '응답 형식 오류')).run()
+
+        self.assertEqual(state['failed'], [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(self.db.updates, {})
+
+    def test_non_object_json_counted_as_failed(self):
+        """JSON 객체가 아닌 응답은 실행을 멈추지 않고 해당 분석만 실패 처리하는지 테스트"""
+        state = self.make_runner(LocalBatchBackend(
+            lambda body: '[]' if '회사2' in body['messages'][1]['content'] else AI_RESPONSE
+        )).run()
+
+        self.assertEqual(state['failed'], [2])
+        self.assertEqual(state['updated'], 6)
+        self.assertNotIn(2, self.db.cleared)
+
+    def test_matches_kept_when_update_fails(self):
+        """분석 결과 갱신이 실패하면 매칭 기록을 지우지 않는지 테스트"""
+        self.db.fail_updates = True
+        state = self.make_runner(LocalBatchBackend(lambda body: AI_RESPONSE)).run()
+
+        self.assertEqual(len(state['failed']), 7)
+        self.assertEqual(self.db.cleared, [])
+
+    def test_incomplete_backend_rejected_at_creation(self):
+        """메서드를 모두 구현하지 않은 백엔드는 생성 시 거부되는지 테스트"""
+        class SubmitOnlyBackend(BatchBackend):
+            def submit(self, batch_requests):
+                return 'batch'
+
+        with self.assertRaises(TypeError):
+            SubmitOnlyBackend()
+
+class OpenAIBatchStandInHandler(BaseHTTPRequestHandler):
+    """OpenAI Batch API 대역 핸들러 (첫 상태 조회는 진행 중, 이후 완료)"""
+
+    files = {}
+    batches = {}
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path == '/v1/files':
+            # multipart 본문에서 JSONL 줄만 추출
+            lines = [line for line in body.decode('utf-8').splitlines() if line.startswith('{"custom_id"')]
+            file_id = f'file-{len(self.files)}'
+            self.files[file_id] = lines
+            self.send_json({'id': file_id, 'purpose': 'batch'})
+        elif self.path == '/v1/batches':
+            request = json.loads(body)
+            batch_id = f'batch_{len(self.batches)}'
+            self.batches[batch_id] = {'input': request['input_file_id'], 'polls': 0}
+            self.send_json({'id': batch_id, 'status': 'validating'})
+
+    def do_GET(self):
+        if self.path.startswith('/v1/batches/'):
+            batch = self.batches[self.path.rsplit('/', 1)[1]]
+            batch['polls'] += 1
+            if batch['polls'] == 1:
+                self.send_json({'status': 'in_progress'})
+            else:
+                self.send_json({'status': 'completed', 'output_file_id': f"{batch['input']}-output"})
+        elif self.path.endswith('-output/content'):
+            file_id = self.path.split('/')[3][:-len('-output')]
+            records = []
+            for index, line in enumerate(self.files[file_id]):
+                request = json.loads(line)
+                if index == 0:
+                    records.append({'custom_id': request['custom_id'], 'response': None,
+                                    'error': {'code': 'server_error', 'message': '처리 실패'}})
+                else:
+                    records.append({'custom_id': request['custom_id'], 'error': None, 'response': {
+                        'status_code': 200,
+                        'body': {'choices': [{'message': {'role': 'assistant', 'content': AI_RESPONSE}}]}
+                    }})
+            content = '\n'.join(json.dumps(record, ensure_ascii=False) for record in records).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    def send_json(self, data):
+        """JSON 응답 전송"""
+        content = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestOpenAIBatchBackend(unittest.TestCase):
+    """OpenAI Batch API 백엔드 테스트 클래스"""
+
+    def setUp(self):
+        """로컬 대역 서버 시작"""
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), OpenAIBatchStandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}/v1'
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """로컬 대역 서버 종료"""
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_submit_poll_and_collect(self):
+        """파일 업로드, 배치 생성, 상태 확인, 결과 파일 처리 테스트"""
+        db = FakeDatabaseService(2)
+        runner = BulkReanalysisRunner(OpenAIBatchBackend(api_key='test-key', base_url=self.base_url),
+                                      db_service=db, checkpoint_path=os.path.join(self.temp_dir, 'cp.json'),
+                                      batch_size=10, poll_interval=0)
+
+        state = runner.run()
+
+        self.assertEqual(state['updated'], 1)
+        self.assertEqual(state['failed'], [1])
+        self.assertEqual(list(db.updates), [2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,333 @@
+"""
+컨설턴트 메모리 색인 테스트
+"""
+
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from app.models.analysis import Analysis
+from app.models.consultant import Consultant
+from app.services.consultant_index import ConsultantIndex
+from app.services.recommendation_cache import RecommendationCache
+from app.services.recommendation_service import RecommendationService
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+class FakeDatabaseService:
+    """컨설턴트 저장소 대역 (조회 횟수 기록)"""
+
+    def __init__(self, consultants):
+        self.rows = {consultant.id: consultant for consultant in consultants}
+        self.full_loads = 0
+        self.fail_loads = False
+        self.polls = []
+        self.matches = {}
+        self.analysis = Analysis(id=11, company_id=3, company_name='테스트', certifications=['ISO 27001 (High): 보안'])
+
+    def load_active_consultants(self):
+        self.full_loads += 1
+        if self.fail_loads:
+            return None
+        return [consultant for consultant in self.rows.values() if consultant.status == 'active']
+
+    def is_available(self):
+        return True
+
+    def get_consultants_stamp(self):
+        self.stamp_queries = getattr(self, 'stamp_queries', 0) + 1
+        return max(consultant.updated_at for consultant in self.rows.values())
+
+    def get_consultants_by_ids(self, consultant_ids):
+        return [self.rows[consultant_id] for consultant_id in consultant_ids if consultant_id in self.rows]
+
+    def get_consultants_updated_since(self, since):
+        self.polls.append(since)
+        since = datetime.fromisoformat(since)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return sorted((c for c in self.rows.values() if c.updated_at > since), key=lambda c: c.updated_at)
+
+    def get_latest_analysis(self, company_name):
+        return self.analysis
+
+    def replace_matches(self, analysis_id, company_id, matches, directory_stamp=None):
+        self.matches[analysis_id] = [
+            dict(match, match_rank=rank, directory_stamp=directory_stamp) for rank, match in enumerate(matches, 1)
+        ]
+        return True
+
+    def get_matches(self, analysis_id):
+        return self.matches.get(analysis_id, [])
+
+    def save(self, consultant, minutes):
+        self.rows[consultant.id] = replace(consultant, updated_at=BASE_TIME + timedelta(minutes=minutes))
+
+def make_consultants():
+    """테스트용 컨설턴트 목록"""
+    return [
+        Consultant(id=1, industry='IT', region='서울', years_experience=10,
+                   certifications=['ISO 27001', 'ISO 9001'], status='active', updated_at=BASE_TIME),
+        Consultant(id=2, industry='제조', region='경기', years_experience=5,
+                   certifications=['ISO 14001'], status='active', updated_at=BASE_TIME),
+        Consultant(id=3, industry='IT', region='부산', years_experience=2,
+                   certifications=['ISO 27001'], status='active', updated_at=BASE_TIME)
+    ]
+
+class TestConsultantIndex(unittest.TestCase):
+    """컨설턴트 색인 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDatabaseService(make_consultants())
+        self.index = ConsultantIndex(self.db, refresh_interval=3600)
+
+    def ids(self, consultants):
+        return [consultant.id for consultant in consultants]
+
+    def test_lookup_by_postings(self):
+        """업종·지역 일치 및 인증 보유 조건 조회 테스트"""
+        self.assertEqual(self.ids(self.index.lookup(industry='IT')), [1, 3])
+        self.assertEqual(self.ids(self.index.lookup(industry='IT', region='부산')), [3])
+        self.assertEqual(self.ids(self.index.lookup(certifications=['ISO 9001', 'ISO 14001'])), [1, 2])
+        self.assertEqual(self.ids(self.index.lookup(certifications=[{'item': 'ISO 27001'}], region='서울')), [1])
+        self.assertEqual(self.ids(self.index.lookup(industry='교육')), [])
+        self.assertEqual(self.ids(self.index.consultants()), [1, 2, 3])
+        self.assertEqual(self.db.full_loads, 1)
+
+    def test_poll_applies_changes(self):
+        """updated_at 변경분 반영 테스트 (추가·수정·비활성화)"""
+        self.index.consultants()
+        version = self.index.version
+        self.db.save(Consultant(id=4, industry='IT', region='서울', certifications=['ISMS-P'], status='active'), 1)
+        self.db.save(replace(self.db.rows[2], region='서울'), 2)
+        self.db.save(replace(self.db.rows[3], status='inactive'), 3)
+        self.index.refresh_interval = 0
+
+        self.assertEqual(self.ids(self.index.lookup(region='서울')), [1, 2, 4])
+        self.assertEqual(self.ids(self.index.lookup(industry='IT')), [1, 4])
+        self.assertEqual(self.index.version, version + 1)
+        self.assertEqual(self.db.full_loads, 1)
+
+        # 겹쳐 읽은 변경분은 다시 반영하지 않음
+        self.index.consultants()
+        self.assertEqual(self.index.version, version + 1)
+        self.assertGreater(self.db.polls[-1], BASE_TIME.isoformat())
+
+    def test_matrix_rebuilt_only_on_change(self):
+        """색인이 바뀔 때만 점수 계산용 배열 재생성 테스트"""
+        matrix = self.index.matrix()
+
+        self.assertIs(self.index.matrix(), matrix)
+        self.index.invalidate()
+        self.db.save(Consultant(id=5, certifications=['ISO 9001'], status='active'), 1)
+
+        self.assertEqual(len(self.index.matrix()), 4)
+        self.assertEqual(self.db.full_loads, 2)
+
+    def test_failed_reload_keeps_previous_index(self):
+        """전체 조회 실패 시 예시 데이터로 바꾸지 않고 기존 색인을 유지하는지 테스트"""
+        self.assertEqual(self.ids(self.index.consultants()), [1, 2, 3])
+        version = self.index.version
+        self.db.fail_loads = True
+        self.index.invalidate()
+
+        self.assertEqual(self.ids(self.index.consultants()), [1, 2, 3])
+        self.db.fail_loads = False
+        self.db.save(Consultant(id=4, certifications=['ISO 9001'], status='active'), 1)
+
+        # 실패한 뒤에는 다음 조회 때 다시 전체를 불러옴
+        self.assertEqual(self.ids(self.index.consultants()), [1, 2, 3, 4])
+        self.assertEqual(self.db.full_loads, 3)
+        self.assertGreater(self.index.version, version)
+
+    def test_failed_first_load_stays_empty(self):
+        """처음 전체 조회가 실패하면 빈 색인으로 두고 다시 시도하는지 테스트"""
+        self.db.fail_loads = True
+
+        self.assertEqual(self.index.consultants(), [])
+        self.db.fail_loads = False
+        self.assertEqual(self.ids(self.index.consultants()), [1, 2, 3])
+
+class TestIndexedRecommendations(unittest.TestCase):
+    """색인 기반 추천 테스트 클래스"""
+
+    def test_criteria_recommendations_without_db(self):
+        """기준별 추천이 데이터베이스를 다시 조회하지 않는지 테스트"""
+        db = FakeDatabaseService(make_consultants())
+        index = ConsultantIndex(db, refresh_interval=3600)
+        service = RecommendationService()
+
+        with patch('app.services.recommendation_service.consultant_index', index), \
+             patch('app.services.recommendation_service.recommendation_cache', RecommendationCache(max_entries=0)), \
+             patch.object(service.db_service, 'get_consultants', side_effect=AssertionError):
+            first = service.get_recommendations_by_criteria(industry='IT', certifications=['ISO 27001'])
+            second = service.get_recommendations_by_criteria(certifications=['ISO 14001'], min_experience=3)
+
+        self.assertEqual([r['consultant']['id'] for r in first['recommendations']], [1, 3])
+        self.assertEqual([r['consultant']['id'] for r in second['recommendations']], [2])
+        self.assertEqual(db.full_loads, 1)
+
+class TestStoredMatches(unittest.TestCase):
+    """matches 테이블 기록 기반 추천 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDatabaseService(make_consultants())
+        self.index = ConsultantIndex(self.db, refresh_interval=3600)
+        self.service = RecommendationService()
+        self.service.db_service = self.db
+        self.patches = [
+            patch('app.services.recommendation_service.consultant_index', self.index),
+            patch('app.services.matching_service.consultant_index', self.index),
+            patch('app.services.recommendation_service.recommendation_cache', RecommendationCache(max_entries=0))
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        """패치 해제"""
+        for patcher in self.patches:
+            patcher.stop()
+
+    def test_matches_stored_at_analysis_time(self):
+        """저장된 분석의 상위 매칭 기록 테스트"""
+        result = self.service.get_recommendations(self.db.analysis, limit=1)
+        stored = self.db.matches[11]
+
+        self.assertEqual(len(result['recommendations']), 1)
+        self.assertEqual([row['consultant_id'] for row in stored], [1, 3, 2])
+        self.assertEqual(stored[0]['directory_stamp'], BASE_TIME.isoformat())
+
+    def test_company_recommendations_served_from_table(self):
+        """컨설턴트 변경이 없으면 기록에서 추천 조회 테스트"""
+        expected = self.service.get_recommendations(self.db.analysis, limit=2)
+
+        with patch.object(self.service.matching_service, 'find_matches', side_effect=AssertionError):
+            result = self.service.get_recommendations_by_company('테스트', limit=2)
+
+        self.assertEqual(result['recommendations'], expected['recommendations'])
+        self.assertEqual(result['recommendations'][0]['certification_matches'], ['ISO 27001'])
+
+    def test_recomputed_after_directory_change(self):
+        """컨설턴트 변경 후 다시 계산해 기록 교체 테스트"""
+        self.service.get_recommendations(self.db.analysis, limit=2)
+        self.db.save(replace(self.db.rows[2], certifications=['ISO 27001'], years_experience=20), 5)
+        self.index.invalidate()
+
+        result = self.service.get_recommendations_by_company('테스트', limit=2)
+
+        self.assertEqual([r['consultant']['id'] for r in result['recommendations']], [1, 2])
+        self.assertEqual(self.db.matches[11][0]['directory_stamp'], (BASE_TIME + timedelta(minutes=5)).isoformat())
+
+    def test_failed_matching_keeps_stored_rows(self):
+        """매칭이 실패하면 기존 매칭 기록을 지우지 않는지 테스트"""
+        self.service.get_recommendations(self.db.analysis, limit=2)
+        stored = list(self.db.matches[11])
+
+        with patch.object(self.service.matching_service, 'find_matches', return_value=None):
+            result = self.service._recommend(self.db.analysis, 2)
+
+        self.assertEqual(self.db.matches[11], stored)
+        self.assertIn('note', result['summary'])
+
+    def test_database_mode_serves_stored_without_full_load(self):
+        """database 방식은 변경 기준 시각·컨설턴트를 전체 로드 없이 조회하는지 테스트"""
+        expected = self.service.get_recommendations(self.db.analysis, limit=2)
+        full_loads = self.db.full_loads
+        index = ConsultantIndex(self.db, refresh_interval=3600, backend='database')
+
+        with patch('app.services.recommendation_service.consultant_index', index), \
+             patch.object(self.service.matching_service, 'find_matches', side_effect=AssertionError):
+            result = self.service.get_recommendations_by_company('테스트', limit=2)
+            index.stamp()
+
+        self.assertEqual(result['recommendations'], expected['recommendations'])
+        self.assertEqual(self.db.full_loads, full_loads)
+        self.assertEqual(self.db.stamp_queries, 1)
+
+class TestRecommendationCache(unittest.TestCase):
+    """추천 결과 캐시 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDatabaseService(make_consultants())
+        self.index = ConsultantIndex(self.db, refresh_interval=3600)
+        self.cache = RecommendationCache(max_entries=2, ttl_seconds=3600)
+        self.service = RecommendationService()
+        self.service.db_service = self.db
+        self.patches = [
+            patch('app.services.recommendation_service.consultant_index', self.index),
+            patch('app.services.matching_service.consultant_index', self.index),
+            patch('app.services.recommendation_service.recommendation_cache', self.cache)
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        """패치 해제"""
+        for patcher in self.patches:
+            patcher.stop()
+
+    def test_repeated_requests_served_from_cache(self):
+        """분석 후 기업별 재조회가 분석 조회 외에는 캐시에서 처리되는지 테스트"""
+        first = self.service.get_recommendations(self.db.analysis, limit=2)
+
+        with patch.object(self.service, '_recommend_from_stored', side_effect=AssertionError):
+            second = self.service.get_recommendations_by_company('테스트', limit=2)
+        second['recommendations'].clear()
+        third = self.service.get_recommendations_by_company('테스트', limit=2)
+
+        self.assertEqual(third['recommendations'], first['recommendations'])
+
+    def test_directory_version_invalidates_all(self):
+        """컨설턴트 등록·변경 시 버전 증가로 전체 무효화 테스트"""
+        self.service.get_recommendations_by_criteria(certifications=['ISO 27001'], limit=2)
+        self.service.get_recommendations(self.db.analysis, limit=2)
+        self.index.invalidate()
+
+        with patch.object(self.service, '_recommend_from_stored',
+                          wraps=self.service._recommend_from_stored) as recommend, \
+             patch.object(self.service, '_recommend_by_criteria',
+                          wraps=self.service._recommend_by_criteria) as by_criteria:
+            self.service.get_recommendations_by_company('테스트', limit=2)
+            self.service.get_recommendations_by_criteria(certifications=['ISO 27001'], limit=2)
+
+        self.assertEqual(recommend.call_count, 1)
+        self.assertEqual(by_criteria.call_count, 1)
+
+    def test_fallback_not_cached(self):
+        """매칭 실패 시 폴백 추천은 캐시하지 않고 다음 요청에서 다시 계산하는지 테스트"""
+        with patch.object(self.service.matching_service, 'find_matches', return_value=None):
+            fallback = self.service.get_recommendations(self.db.analysis, limit=2)
+        result = self.service.get_recommendations(self.db.analysis, limit=2)
+
+        self.assertTrue(fallback['fallback'])
+        self.assertNotIn('fallback', result)
+        self.assertEqual(result['recommendations'][0]['certification_matches'], ['ISO 27001'])
+
+    def test_database_mode_version_without_full_load(self):
+        """database 방식의 디렉터리 버전이 전체 로드 없이 DB 변경 시각으로 바뀌는지 테스트"""
+        index = ConsultantIndex(self.db, refresh_interval=0, backend='database')
+        version = index.directory_version()
+        self.assertEqual(index.directory_version(), version)
+
+        self.db.save(replace(self.db.rows[2], years_experience=20), 5)
+
+        self.assertGreater(index.directory_version(), version)
+        self.assertEqual(self.db.full_loads, 0)
+        self.assertEqual(self.db.stamp_queries, 3)
+
+    def test_lru_eviction_and_limit_key(self):
+        """추천 수별 키 및 최대 건수 초과 시 LRU 제거 테스트"""
+        for limit in (1, 2, 3):
+            self.service.get_recommendations(self.db.analysis, limit=limit)
+
+        version = self.index.directory_version()
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get(RecommendationCache.analysis_key(self.db.analysis, 1), version))
+        self.assertEqual(len(self.cache.get(RecommendationCache.analysis_key(self.db.analysis, 3), version)
+                             ['recommendations']), 3)
+
+if __name__ == '__main__':
+    unittest.main()
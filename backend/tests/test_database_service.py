@@ -0,0 +1,184 @@
+"""
+데이터베이스 서비스 쿼리 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+from app.services.certification_catalog import certification_catalog
+from app.services.consultant_index import ConsultantIndex
+from app.services.database_service import DatabaseService
+from app.services.metrics import metrics
+from app.services.recommendation_cache import RecommendationCache
+from app.services.recommendation_service import RecommendationService
+from benchmarks.bench_matching import build_consultants
+
+class FakeQuery:
+    """PostgREST 쿼리 빌더 대역 (필터·정렬·개수 제한을 메모리에서 적용)"""
+
+    def __init__(self, rows, log):
+        self.rows = rows
+        self.log = log
+        self.columns = None
+        self.orders = []
+        self.count = None
+
+    def select(self, columns):
+        self.columns = [column.strip() for column in columns.split(',')]
+        self.log.append(('select', columns))
+        return self
+
+    def eq(self, column, value):
+        self.log.append(('eq', column, value))
+        self.rows = [row for row in self.rows if row[column] == value]
+        return self
+
+    def gte(self, column, value):
+        self.log.append(('gte', column, value))
+        self.rows = [row for row in self.rows if row[column] >= value]
+        return self
+
+    def ov(self, column, values):
+        self.log.append(('ov', column, list(values)))
+        self.rows = [row for row in self.rows if set(row[column]) & set(values)]
+        return self
+
+    def contains(self, column, values):
+        self.rows = [row for row in self.rows if set(values) <= set(row[column])]
+        return self
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self.log.append(('limit', count))
+        self.count = count
+        return self
+
+    def execute(self):
+        rows = list(self.rows)
+        for column, desc in reversed(self.orders):
+            rows.sort(key=lambda row: row[column], reverse=desc)
+        if self.count is not None:
+            rows = rows[:self.count]
+        if self.columns != ['*']:
+            rows = [{column: row[column] for column in self.columns} for row in rows]
+        return type('Result', (), {'data': rows})()
+
+class FakeRpc:
+    """DB 함수 호출 대역"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self):
+        return type('Result', (), {'data': self.rows})()
+
+class FakeClient:
+    """Supabase 클라이언트 대역"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.log = []
+
+    def table(self, name):
+        return FakeQuery(self.rows, self.log)
+
+    def rpc(self, name, params):
+        """search_consultants 함수와 같은 조건·정렬 (겹치는 인증 수 내림차순, id 순)"""
+        self.log.append(('rpc', name, params))
+        requested = set(params['p_certification_ids'])
+        rows = [
+            row for row in self.rows
+            if row['status'] == 'active'
+            and (not params['p_industry'] or row['industry'] == params['p_industry'])
+            and (not params['p_region'] or row['region'] == params['p_region'])
+            and (params['p_min_experience'] <= 0 or row['years_experience'] >= params['p_min_experience'])
+            and (not requested or requested & set(row['certification_ids']))
+        ]
+        rows.sort(key=lambda row: (-len(requested & set(row['certification_ids'])), row['id']))
+        return FakeRpc(rows[:params['p_limit']])
+
+def directory_rows(count):
+    """컨설턴트 테이블 행"""
+    rows = []
+    for consultant in build_consultants(count, seed=3):
+        row = consultant.to_dict()
+        row['certification_ids'] = certification_catalog.catalog_ids(consultant.certifications)
+        rows.append(row)
+    return rows
+
+class TestCriteriaPushdown(unittest.TestCase):
+    """기준별 추천 조건 쿼리 전달 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        metrics.reset()
+        self.client = FakeClient(directory_rows(5000))
+        self.db = DatabaseService()
+        self.db.client = self.client
+        self.service = RecommendationService()
+        self.service.db_service = self.db
+        self.service.matching_service.backend = 'database'
+        self.available = patch.object(DatabaseService, 'is_available', return_value=True)
+        self.available.start()
+        self.cache = patch('app.services.recommendation_service.recommendation_cache', RecommendationCache(max_entries=0))
+        self.cache.start()
+
+    def tearDown(self):
+        """패치 해제"""
+        self.available.stop()
+        self.cache.stop()
+
+    def rows_transferred(self):
+        return metrics.snapshot()['observations']['consultants.rows_transferred']
+
+    def test_filters_sent_to_query(self):
+        """모든 조건의 DB 함수 전달 및 전송 행 수 제한 테스트"""
+        result = self.service.get_recommendations_by_criteria(
+            industry='IT', certifications=['ISO 27001 (High)', 'ISMS-P'], region='서울', min_experience=5, limit=4
+        )
+
+        self.assertIn(('rpc', 'search_consultants', {
+            'p_certification_ids': [3, 14], 'p_industry': 'IT', 'p_region': '서울',
+            'p_min_experience': 5, 'p_limit': 4
+        }), self.client.log)
+        self.assertLessEqual(self.rows_transferred()['max'], 4)
+        for recommendation in result['recommendations']:
+            consultant = recommendation['consultant']
+            self.assertEqual((consultant['industry'], consultant['region']), ('IT', '서울'))
+            self.assertGreaterEqual(consultant['years_experience'], 5)
+            self.assertTrue(recommendation['certification_matches'])
+
+    def test_rows_transferred_bounded_by_limit(self):
+        """전체 조회 방식과 전송 행 수 비교 테스트 (디렉터리 크기 → limit)"""
+        self.db.get_consultants(industry='IT')
+        full = self.rows_transferred()['max']
+        metrics.reset()
+
+        self.service.get_recommendations_by_criteria(industry='IT', certifications=['ISO 9001'], limit=5)
+
+        self.assertGreater(full, 500)
+        self.assertLessEqual(self.rows_transferred()['max'], 5)
+
+    def test_same_top_matches_as_memory_index(self):
+        """DB 경로와 메모리 색인 경로의 상위 추천 일치 테스트 (인증을 많이 보유한 컨설턴트 우선)"""
+        criteria = {'industry': 'IT', 'certifications': ['ISO 27001', 'ISO 9001', 'GDPR'], 'limit': 5}
+        database = self.service.get_recommendations_by_criteria(**criteria)
+
+        index = ConsultantIndex(self.db, refresh_interval=3600, backend='memory')
+        self.service.matching_service.backend = 'memory'
+        with patch('app.services.recommendation_service.consultant_index', index):
+            memory = self.service.get_recommendations_by_criteria(**criteria)
+
+        def top(result):
+            return [(r['consultant']['id'], r['match_score']) for r in result['recommendations']]
+
+        self.assertEqual(len(top(memory)), 5)
+        self.assertEqual(top(database), top(memory))
+        requested = set(certification_catalog.catalog_ids(criteria['certifications']))
+        best = max(len(requested & set(row['certification_ids'])) for row in self.client.rows if row['industry'] == 'IT')
+        self.assertEqual(len(database['recommendations'][0]['certification_matches']), best)
+
+if __name__ == '__main__':
+    unittest.main()
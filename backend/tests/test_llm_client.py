@@ -0,0 +1,205 @@
+"""
+LLM 호출 클라이언트 테스트
+"""
+
+import json
+import time
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.services.llm_client import LLMClient, LLMDeadlineExceeded, parse_retry_delay
+from app.services.metrics import metrics
+
+COMPLETION = {
+    'id': 'chatcmpl-test',
+    'object': 'chat.completion',
+    'created': 1700000000,
+    'model': 'gpt-4o-mini',
+    'choices': [{
+        'index': 0,
+        'message': {'role': 'assistant', 'content': '{"summary": "테스트"}'},
+        'finish_reason': 'stop'
+    }],
+    'usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15,
+              'prompt_tokens_details': {'cached_tokens': 8}}
+}
+
+class OpenAIStandInHandler(BaseHTTPRequestHandler):
+    """OpenAI 호환 대역 핸들러 (앞선 요청 일부는 429 응답)"""
+
+    lock = threading.Lock()
+    rate_limited = 0
+    rate_limit_headers = {}
+    latency = 0.0
+    requests = 0
+    current = 0
+    peak = 0
+
+    def do_POST(self):
+        request_body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        with OpenAIStandInHandler.lock:
+            OpenAIStandInHandler.requests += 1
+            OpenAIStandInHandler.current += 1
+            OpenAIStandInHandler.peak = max(OpenAIStandInHandler.peak, OpenAIStandInHandler.current)
+            limited = OpenAIStandInHandler.rate_limited > 0
+            if limited:
+                OpenAIStandInHandler.rate_limited -= 1
+        try:
+            time.sleep(OpenAIStandInHandler.latency)
+            if limited:
+                body = json.dumps({'error': {'message': 'Rate limit reached', 'type': 'requests'}}).encode('utf-8')
+                self.send_response(429)
+                for name, value in OpenAIStandInHandler.rate_limit_headers.items():
+                    self.send_header(name, value)
+            elif request_body.get('stream'):
+                self.send_stream(COMPLETION['choices'][0]['message']['content'],
+                                 request_body.get('stream_options', {}).get('include_usage'))
+                return
+            else:
+                body = json.dumps(COMPLETION).encode('utf-8')
+                self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with OpenAIStandInHandler.lock:
+                OpenAIStandInHandler.current -= 1
+
+    def send_stream(self, content, include_usage=False):
+        """SSE 형식으로 몇 글자씩 나눠 전송 (요청 시 마지막에 사용량 조각 추가)"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        for start in range(0, len(content), 4):
+            chunk = {
+                'id': COMPLETION['id'], 'object': 'chat.completion.chunk', 'created': COMPLETION['created'],
+                'model': COMPLETION['model'],
+                'choices': [{'index': 0, 'delta': {'content': content[start:start + 4]}, 'finish_reason': None}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+        if include_usage:
+            chunk = {
+                'id': COMPLETION['id'], 'object': 'chat.completion.chunk', 'created': COMPLETION['created'],
+                'model': COMPLETION['model'], 'choices': [], 'usage': COMPLETION['usage']
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+        self.wfile.write(b'data: [DONE]\n\n')
+
+    def log_message(self, format, *args):
+        pass
+
+class TestLLMClient(unittest.TestCase):
+    """LLM 호출 클라이언트 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """로컬 대역 서버 시작"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), OpenAIStandInHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}/v1'
+
+    @classmethod
+    def tearDownClass(cls):
+        """로컬 대역 서버 종료"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """테스트 설정"""
+        OpenAIStandInHandler.rate_limited = 0
+        OpenAIStandInHandler.rate_limit_headers = {'retry-after-ms': '50'}
+        OpenAIStandInHandler.latency = 0.0
+        OpenAIStandInHandler.requests = 0
+        OpenAIStandInHandler.peak = 0
+        metrics.reset()
+
+    def make_client(self, concurrency=4, max_attempts=4):
+        """대역 서버를 사용하는 클라이언트 생성"""
+        return LLMClient(api_key='test-key', base_url=self.base_url, max_attempts=max_attempts,
+                         timeout=5, semaphore=threading.BoundedSemaphore(concurrency))
+
+    def complete_kwargs(self):
+        """요청 인자"""
+        return {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': '분석'}]}
+
+    def test_retries_after_rate_limit(self):
+        """429 응답 후 retry-after-ms 대기 후 재시도 테스트"""
+        OpenAIStandInHandler.rate_limited = 2
+        client = self.make_client()
+
+        started = time.monotonic()
+        response = client.complete(**self.complete_kwargs())
+
+        self.assertEqual(response.choices[0].message.content, '{"summary": "테스트"}')
+        self.assertEqual(OpenAIStandInHandler.requests, 3)
+        self.assertEqual(metrics.get_counter('llm.retries'), 2)
+        self.assertEqual(metrics.get_counter('llm.retries.429'), 2)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_deadline_stops_retries(self):
+        """대기 시간이 마감 시각을 넘으면 즉시 실패 테스트"""
+        OpenAIStandInHandler.rate_limited = 5
+        OpenAIStandInHandler.rate_limit_headers = {'x-ratelimit-reset-requests': '6m0s'}
+        client = self.make_client()
+
+        started = time.monotonic()
+        with self.assertRaises(LLMDeadlineExceeded):
+            client.complete(deadline=time.monotonic() + 2, **self.complete_kwargs())
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(OpenAIStandInHandler.requests, 1)
+        self.assertEqual(metrics.get_counter('llm.failures'), 1)
+
+    def test_async_concurrency_limit(self):
+        """비동기 호출 동시 실행 제한 및 대기 시간 지표 테스트"""
+        OpenAIStandInHandler.latency = 0.1
+        client = self.make_client(concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*[client.acomplete(**self.complete_kwargs()) for _ in range(6)])
+
+        responses = asyncio.run(run())
+
+        self.assertEqual(len(responses), 6)
+        self.assertLessEqual(OpenAIStandInHandler.peak, 2)
+        self.assertEqual(metrics.snapshot()['observations']['llm.queue_wait_ms']['count'], 6)
+        self.assertGreater(metrics.snapshot()['observations']['llm.queue_wait_ms']['max'], 100)
+
+    def test_stream_retries_before_first_chunk(self):
+        """스트리밍 요청의 429 재시도 및 응답 조각 수신 테스트"""
+        OpenAIStandInHandler.rate_limited = 1
+        client = self.make_client()
+
+        chunks = list(client.stream(**self.complete_kwargs()))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), '{"summary": "테스트"}')
+        self.assertEqual(metrics.get_counter('llm.retries'), 1)
+        self.assertEqual(metrics.get_counter('llm.cached_tokens'), 8)
+        self.assertEqual(metrics.snapshot()['observations']['llm.time_to_first_token_ms']['count'], 1)
+
+    def test_records_cached_prompt_tokens(self):
+        """응답 사용량의 프롬프트 캐시 토큰 기록 테스트"""
+        client = self.make_client()
+
+        client.complete(**self.complete_kwargs())
+        client.complete(**self.complete_kwargs())
+
+        self.assertEqual(metrics.get_counter('llm.prompt_tokens'), 20)
+        self.assertEqual(metrics.get_counter('llm.cached_tokens'), 16)
+        self.assertEqual(metrics.snapshot()['gauges']['llm.prompt_cache_hit_ratio'], 0.8)
+        self.assertEqual(metrics.snapshot()['observations']['llm.latency_ms.prefix_cached']['count'], 2)
+
+    def test_parse_retry_delay(self):
+        """재시도 헤더 해석 테스트"""
+        self.assertEqual(parse_retry_delay({'retry-after-ms': '250'}), 0.25)
+        self.assertEqual(parse_retry_delay({'retry-after': '3'}), 3.0)
+        self.assertEqual(parse_retry_delay({'x-ratelimit-reset-requests': '1m30s',
+                                            'x-ratelimit-reset-tokens': '20ms'}), 90.0)
+        self.assertIsNone(parse_retry_delay({}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+LLM 공급자 라우팅 테스트
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from llm_standin import StandInServer, CANNED_ANALYSIS
+from app.services.ai_analyzer import AIAnalyzer
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_providers import LLMProvider, LLMRouter, RouteRule
+
+PUBLIC_DATA = {
+    'company': '테스트',
+    'news': [{'title': '보안 사고', 'snippet': '개인정보 유출'}],
+    'dart': [{'title': '사업보고서', 'type': '정기공시', 'snippet': ''}],
+    'social': [],
+    'website': {}
+}
+
+class TestLLMRouter(unittest.TestCase):
+    """모델 라우팅 규칙 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.providers = {
+            'openai': LLMProvider('openai', api_key='key', timeout=30),
+            'fast': LLMProvider('fast', base_url='http://127.0.0.1:1/v1', api_key='key', timeout=3)
+        }
+
+    def test_first_matching_rule(self):
+        """작업·토큰 수 조건별 규칙 선택 테스트"""
+        router = LLMRouter(self.providers, [
+            RouteRule('fast', 'small-model', task='digest'),
+            RouteRule('fast', 'mini-model', max_prompt_tokens=500)
+        ])
+
+        self.assertEqual(router.route('digest', 5000).model, 'small-model')
+        self.assertEqual(router.route('analysis', 300).model, 'mini-model')
+        self.assertEqual(router.route('analysis', 3000).model, 'gpt-4o-mini')
+        self.assertEqual(router.route('analysis', 3000).provider.name, 'openai')
+
+    def test_per_provider_timeout(self):
+        """공급자별 타임아웃 및 클라이언트 재사용 테스트"""
+        router = LLMRouter(self.providers)
+
+        client = router.client(self.providers['fast'])
+
+        self.assertEqual(client.timeout, 3)
+        self.assertIs(router.client(self.providers['fast']), client)
+        self.assertIsNone(router.client(LLMProvider('nokey')))
+
+    def test_unknown_provider_rejected(self):
+        """등록되지 않은 공급자 규칙 거부 테스트"""
+        with self.assertRaises(ValueError):
+            LLMRouter(self.providers, [RouteRule('missing', 'model')])
+
+class TestStandInProvider(unittest.TestCase):
+    """로컬 대역 서버 연동 테스트 클래스"""
+
+    def setUp(self):
+        """대역 서버 시작"""
+        self.standin = StandInServer(latency=0.01)
+        self.digest_standin = StandInServer(latency=0.01)
+        self.cache_dir = tempfile.mkdtemp()
+        providers = '{"local": {"base_url": "%s", "api_key": "standin", "timeout": 5},' \
+                    ' "digest": {"base_url": "%s", "api_key": "standin", "timeout": 5}}' % (
+                        self.standin.start(), self.digest_standin.start())
+        self.config = patch.multiple('app.services.llm_providers.Config', LLM_PROVIDERS=providers,
+                                     LLM_ROUTES='[{"task": "digest", "provider": "digest", "model": "small"}]',
+                                     LLM_DEFAULT_PROVIDER='local', LLM_DEFAULT_MODEL='standin')
+        self.config.start()
+
+    def tearDown(self):
+        """대역 서버 종료"""
+        self.config.stop()
+        self.standin.stop()
+        self.digest_standin.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def make_analyzer(self):
+        """대역 공급자를 사용하는 분석기 생성"""
+        analyzer = AIAnalyzer()
+        analyzer.response_cache = LLMResponseCache(os.path.join(self.cache_dir, 'llm.sqlite3'))
+        return analyzer
+
+    def test_analysis_through_standin(self):
+        """대역 서버 응답으로 분석 및 스트리밍 테스트"""
+        analyzer = self.make_analyzer()
+        fields = []
+
+        result = analyzer.analyze_company_risks(PUBLIC_DATA)
+        analyzer.response_cache = LLMResponseCache('')
+        streamed = analyzer.analyze_company_risks_stream(PUBLIC_DATA, lambda name, value: fields.append(name))
+
+        self.assertEqual(analyzer.model, 'standin')
+        self.assertEqual(result['analysis_method'], 'AI (local/standin)')
+        self.assertEqual(streamed['analysis_method'], 'AI (local/standin)')
+        self.assertEqual(result['summary'], CANNED_ANALYSIS['summary'])
+        self.assertEqual(streamed['certifications'][0]['item'], 'ISO 27001')
+        self.assertEqual(fields, list(AIAnalyzer.RESPONSE_FIELDS))
+        self.assertEqual(self.standin.requests, 2)
+
+    def test_digest_routed_to_other_provider(self):
+        """출처별 요약 호출만 다른 공급자로 라우팅 테스트"""
+        analyzer = self.make_analyzer()
+        analyzer.analysis_mode = 'map_reduce'
+
+        result = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        self.assertEqual(result['summary'], CANNED_ANALYSIS['summary'])
+        self.assertEqual(self.digest_standin.requests, 2)
+        self.assertEqual(self.standin.requests, 1)
+
+    def test_analysis_method_reports_routed_model(self):
+        """다른 공급자·모델로 라우팅된 분석은 그 공급자·모델을 분석 방법으로 기록하는지 테스트"""
+        with patch('app.services.llm_providers.Config.LLM_ROUTES',
+                   '[{"task": "analysis", "provider": "digest", "model": "small"}]'):
+            analyzer = self.make_analyzer()
+
+        result = analyzer.analyze_company_risks(PUBLIC_DATA)
+
+        self.assertEqual(result['analysis_method'], 'AI (digest/small)')
+        self.assertEqual(self.digest_standin.requests, 1)
+        self.assertEqual(self.standin.requests, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+컨설턴트 매칭 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+from app.models.analysis import Analysis
+from app.models.consultant import Consultant
+from app.database.tables import create_tables
+from app.services.certification_catalog import CertificationCatalog, LOCAL_ID_START
+from app.services.consultant_matrix import ConsultantMatrix
+from app.services.matching_service import MatchingService
+from benchmarks.bench_matching import build_consultants
+
+class TestCertificationCatalog(unittest.TestCase):
+    """인증 카탈로그 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.catalog = CertificationCatalog()
+
+    def test_aliases_share_id(self):
+        """AI 분석 형식·별칭·표기 차이의 같은 ID 변환 테스트"""
+        iso27001 = self.catalog.intern('ISO 27001')
+
+        for label in ['ISO 27001 (High): 정보보안 관리체계 구축', {'item': 'ISO/IEC 27001', 'priority': 'High'},
+                      'iso27001:2013', '{"item": "ISO 27001", "priority": "Low"}', '정보보안경영시스템']:
+            self.assertEqual(self.catalog.intern(label), iso27001, label)
+        self.assertEqual(self.catalog.intern('GDPR 컴플라이언스'), self.catalog.intern('GDPR'))
+        self.assertNotEqual(self.catalog.intern('ISMS-P 인증'), self.catalog.intern('ISMS'))
+        self.assertEqual(self.catalog.name(self.catalog.intern({'item': 'GDPR 컴플라이언스'})), 'GDPR')
+
+    def test_unknown_certifications_interned_locally(self):
+        """카탈로그에 없는 인증의 프로세스 내 ID 테스트 (DB 저장 대상 제외)"""
+        local_id = self.catalog.intern('녹색인증')
+
+        self.assertGreaterEqual(local_id, LOCAL_ID_START)
+        self.assertEqual(self.catalog.intern('녹색 인증 (Medium)'), local_id)
+        self.assertIsNone(self.catalog.intern(''))
+        self.assertEqual(self.catalog.catalog_ids(['녹색인증', 'ISO 9001', 'ISO 9001 (High)']), [1])
+
+    def test_analysis_labels_do_not_grow_local_ids(self):
+        """분석 쪽 표기는 컨설턴트가 보유한 경우에만 프로세스 내 ID로 변환되는지 테스트"""
+        for index in range(1000):
+            self.assertIsNone(self.catalog.intern(f'사내 인증 {index} (Low): 설명 {index}', assign=False))
+        self.assertEqual(self.catalog.intern_all(['ISO 9001 (High): 품질', '미등록 인증'], assign=False), [1])
+
+        held = self.catalog.intern('녹색인증')
+        self.assertEqual(self.catalog.intern('녹색 인증 (Medium): 설명', assign=False), held)
+        self.assertEqual(len(self.catalog._local_ids), 1)
+
+    def test_database_alias_table_matches_catalog(self):
+        """DB 별칭 테이블이 카탈로그의 모든 별칭을 같은 ID로 적재하고 인증 변경 시 동기화하는지 테스트"""
+        sql = create_tables()['consultants']
+
+        for key, certification_id in self.catalog.alias_keys():
+            self.assertIn(f"('{key}', {certification_id}, ", sql)
+        self.assertIn('BEFORE INSERT OR UPDATE OF certifications ON consultants', sql)
+        self.assertIn('SET certification_ids = certification_catalog_ids(certifications)', sql)
+
+class TestVectorizedMatching(unittest.TestCase):
+    """배열 연산 매칭 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = MatchingService()
+
+    def legacy_matches(self, analysis, consultants, limit):
+        """컨설턴트별 계산 결과 (안정 정렬이므로 동점은 원래 순서)"""
+        matches = [self.service._calculate_match_score(analysis, consultant) for consultant in consultants]
+        matches = [match for match in matches if match.match_score > 0.3]
+        matches.sort(key=lambda x: x.match_score, reverse=True)
+        return matches[:limit]
+
+    def test_same_as_per_consultant_scoring(self):
+        """컨설턴트별 계산과 점수·순서 일치 테스트 (동점 포함)"""
+        consultants = build_consultants(2000, seed=7)
+        matrix = ConsultantMatrix(consultants)
+        analysis = Analysis(certifications=[{'item': 'ISO 27001'}, 'ISMS-P', 'ISO 9001', 'ISO 9001'])
+
+        for limit in (1, 5, 50):
+            expected = self.legacy_matches(analysis, consultants, limit)
+            actual = self.service.find_matches_in(matrix, analysis, limit)
+
+            self.assertEqual([match.consultant.id for match in actual], [match.consultant.id for match in expected])
+            self.assertEqual([match.match_score for match in actual], [match.match_score for match in expected])
+            self.assertEqual([match.reasons for match in actual], [match.reasons for match in expected])
+
+    def test_dict_certifications_matched(self):
+        """AI 분석 결과의 dict 인증 항목 매칭 테스트"""
+        consultant = Consultant(id=1, years_experience=10, certifications=['ISO 27001', 'ISO 9001'])
+        analysis = Analysis(certifications=[{'item': 'ISO 9001', 'priority': 'High'}, {'item': 'ISO 27001'}])
+
+        matches = self.service.find_matches_in(ConsultantMatrix([consultant]), analysis, 5)
+
+        self.assertEqual(matches[0].certification_matches, ['ISO 9001', 'ISO 27001'])
+        self.assertAlmostEqual(matches[0].match_score, 0.3 + 0.4 + 0.1 + 0.2)
+
+    def test_formatted_certifications_matched(self):
+        """저장된 분석 결과 문자열 형식("항목 (우선순위): 설명") 매칭 테스트"""
+        consultant = Consultant(id=1, years_experience=10, certifications=['GDPR', 'ISO 27001'])
+        analysis = Analysis(certifications=['ISO 27001 (High): 정보보안 관리시스템 인증', 'GDPR 컴플라이언스 (Medium)'])
+
+        matches = self.service.find_matches_in(ConsultantMatrix([consultant]), analysis, 5)
+
+        self.assertEqual(matches[0].certification_matches, ['ISO 27001', 'GDPR'])
+        self.assertEqual(self.service._check_certification_match(analysis, consultant), ['ISO 27001', 'GDPR'])
+
+    def test_many_certifications_span_words(self):
+        """인증 종류가 64개를 넘는 경우 비트셋 테스트"""
+        consultants = [Consultant(id=i, certifications=[f'인증{i}', f'인증{i + 1}']) for i in range(100)]
+        matrix = ConsultantMatrix(consultants)
+
+        counts = matrix.certification_match_counts(matrix.certification_mask(['인증70', '인증71', '없는 인증']))
+
+        self.assertEqual(matrix.word_count, 2)
+        self.assertEqual(np.flatnonzero(counts).tolist(), [69, 70, 71])
+        self.assertEqual(counts[70], 2)
+
+    def test_top_k_ties_and_threshold(self):
+        """상위 k개 동점 처리 및 최소 점수 테스트"""
+        matrix = ConsultantMatrix([])
+        scores = np.array([0.5, 0.9, 0.5, 0.2, 0.9, 0.5, 0.3])
+
+        self.assertEqual(matrix.top_k(scores, 3, 0.3).tolist(), [1, 4, 0])
+        self.assertEqual(matrix.top_k(scores, 10, 0.3).tolist(), [1, 4, 0, 2, 5])
+        self.assertEqual(matrix.top_k(scores, 0, 0.3).tolist(), [])
+
+    def test_empty_directory(self):
+        """컨설턴트가 없는 경우 테스트"""
+        matches = self.service.find_matches_in(ConsultantMatrix([]), Analysis(certifications=['ISO 9001']), 5)
+
+        self.assertEqual(matches, [])
+
+class FakeMatchDatabase:
+    """match_consultants 함수 대역 (호출 인자 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def match_consultants(self, *args):
+        self.calls.append(args)
+        return self.rows
+
+class TestDatabaseMatching(unittest.TestCase):
+    """DB 함수 매칭 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = MatchingService()
+        self.service.backend = 'database'
+        self.analysis = Analysis(certifications=['ISO 27001 (High): 정보보안', '녹색인증', 'GDPR 컴플라이언스'])
+
+    def test_rows_become_match_results(self):
+        """DB 함수 결과 행의 매칭 결과 변환 테스트"""
+        self.service.db_service = FakeMatchDatabase([{
+            'id': 7, 'name': '김지훈', 'industry': 'IT', 'region': '서울', 'years_experience': 10,
+            'certifications': ['ISO 27001', 'GDPR'], 'certification_ids': [3, 13], 'status': 'active',
+            'match_score': 0.8666, 'industry_match': True, 'region_match': True
+        }])
+
+        matches = self.service.find_matches(self.analysis, 3)
+
+        self.assertEqual(self.service.db_service.calls, [([3, 13], 3, None, None, 3)])
+        self.assertEqual(matches[0].consultant.id, 7)
+        self.assertEqual(matches[0].certification_matches, ['ISO 27001', 'GDPR'])
+        self.assertEqual(matches[0].experience_level, 'senior')
+
+    def test_falls_back_to_memory_index(self):
+        """DB 함수 사용 불가 시 메모리 색인 사용 테스트"""
+        self.service.db_service = FakeMatchDatabase(None)
+        matrix = ConsultantMatrix([Consultant(id=1, certifications=['GDPR'], status='active')])
+
+        with patch('app.services.matching_service.consultant_index') as index:
+            index.matrix.return_value = matrix
+            matches = self.service.find_matches(self.analysis, 3)
+
+        self.assertEqual([match.consultant.id for match in matches], [1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+홈페이지 사전 점검 서비스 테스트
+"""
+
+import time
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from app.services.preflight import PreflightChecker
+
+class PreflightHandler(BaseHTTPRequestHandler):
+    """HEAD를 거부하고 리다이렉트하는 대역 핸들러"""
+
+    last_range = None
+
+    def do_HEAD(self):
+        if self.path == '/old':
+            self.send_response(301)
+            self.send_header('Location', '/new')
+            self.end_headers()
+        elif self.path == '/no-head':
+            self.send_response(405)
+            self.end_headers()
+        elif self.path == '/down':
+            self.send_response(503)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.end_headers()
+
+    def do_GET(self):
+        PreflightHandler.last_range = self.headers.get('Range')
+        self.send_response(206)
+        self.send_header('Content-Length', '1')
+        self.end_headers()
+        self.wfile.write(b'<')
+
+    def log_message(self, format, *args):
+        pass
+
+class TestPreflightChecker(unittest.TestCase):
+    """사전 점검 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """로컬 대역 서버 시작"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), PreflightHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        """로컬 대역 서버 종료"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """테스트 설정"""
+        self.checker = PreflightChecker()
+        PreflightHandler.last_range = None
+
+    def test_redirect_sets_canonical_url(self):
+        """리다이렉트 최종 URL 테스트"""
+        result = self.checker.check(f'{self.base_url}/old')
+
+        self.assertTrue(result.reachable)
+        self.assertEqual(result.canonical_url, f'{self.base_url}/new')
+
+    def test_head_not_allowed_falls_back_to_range_get(self):
+        """HEAD 미지원 서버 1바이트 GET 테스트"""
+        result = self.checker.check(f'{self.base_url}/no-head')
+
+        self.assertTrue(result.reachable)
+        self.assertEqual(result.status_code, 206)
+        self.assertEqual(PreflightHandler.last_range, 'bytes=0-0')
+
+    @patch('app.services.preflight.socket.getaddrinfo', side_effect=socket.gaierror(-2, 'Name or service not known'))
+    def test_unresolvable_host(self, mock_getaddrinfo):
+        """DNS 조회 실패 테스트"""
+        result = self.checker.check('https://no-such-host.example')
+
+        self.assertFalse(result.resolvable)
+        self.assertFalse(result.reachable)
+        self.assertIn('DNS', result.reason)
+
+    def test_dns_timeout_only_skips_website(self):
+        """DNS 시간 초과는 거부하지 않고 웹사이트 수집만 생략하는지 테스트"""
+        self.checker.dns_timeout = 0.05
+        with patch('app.services.preflight.socket.getaddrinfo', side_effect=lambda *args: time.sleep(0.3)):
+            result = self.checker.check('https://slow-dns.example.com/')
+
+        self.assertTrue(result.resolvable)
+        self.assertFalse(result.reachable)
+        self.assertIn('시간 초과', result.reason)
+
+    @patch('app.services.preflight.socket.getaddrinfo',
+           side_effect=socket.gaierror(socket.EAI_AGAIN, 'Temporary failure in name resolution'))
+    def test_temporary_dns_failure_not_rejected(self, mock_getaddrinfo):
+        """일시적 DNS 오류는 거부하지 않는지 테스트"""
+        result = self.checker.check('https://example.com/')
+
+        self.assertTrue(result.resolvable)
+        self.assertFalse(result.reachable)
+
+    def test_server_error_unreachable(self):
+        """5xx 응답을 접속 불가로 처리하는지 테스트"""
+        result = self.checker.check(f'{self.base_url}/down')
+
+        self.assertTrue(result.resolvable)
+        self.assertFalse(result.reachable)
+        self.assertEqual(result.status_code, 503)
+
+    def test_connection_refused(self):
+        """접속 실패 테스트"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        result = self.checker.check(f'http://127.0.0.1:{port}/')
+
+        self.assertTrue(result.resolvable)
+        self.assertFalse(result.reachable)
+
+if __name__ == '__main__':
+    unittest.main()
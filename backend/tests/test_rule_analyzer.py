@@ -0,0 +1,106 @@
+"""
+규칙 기반 리스크 분석 테스트
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services.rule_analyzer import KeywordAutomaton, RuleBasedAnalyzer
+from app.services.analyzer import CompanyAnalyzer
+from app.services.metrics import metrics
+
+SECURITY_INCIDENT = {
+    'company': '테스트',
+    'news': [{'title': '테스트사 랜섬웨어 해킹 피해', 'snippet': '고객 개인정보 유출 정황'}],
+    'dart': [],
+    'social': [],
+    'website': {}
+}
+
+REPEATED_SECURITY_INCIDENTS = {
+    'company': '테스트',
+    'news': [
+        {'title': '테스트사 랜섬웨어 해킹 피해', 'snippet': '고객 개인정보 유출 정황'},
+        {'title': '테스트사 해킹으로 서비스 중단', 'snippet': '악성코드 감염 서버 복구 중'}
+    ],
+    'dart': [{'title': '정보보안 침해사고 발생 공시', 'snippet': '랜섬웨어 공격에 따른 보안사고'}],
+    'social': [],
+    'website': {}
+}
+
+UNEXPLAINED_NEWS = {
+    'company': '테스트',
+    'news': [{'title': f'테스트사 신규 사업 발표 {i}', 'snippet': '매출 성장 기대'} for i in range(8)],
+    'dart': [],
+    'social': [],
+    'website': {}
+}
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """키워드 자동자 테스트 클래스"""
+
+    def test_overlapping_matches(self):
+        """겹치는 키워드 검색 테스트"""
+        automaton = KeywordAutomaton(['he', 'she', 'his', 'hers'])
+
+        self.assertEqual(automaton.count('ushers ahishe'), {'she': 2, 'he': 2, 'hers': 1, 'his': 1})
+
+    def test_korean_and_case_insensitive(self):
+        """한글 및 대소문자 무시 테스트"""
+        automaton = KeywordAutomaton(['개인정보', '정보유출', 'GDPR'])
+
+        self.assertEqual(automaton.count('개인정보유출 GDPR 위반'), {'개인정보': 1, '정보유출': 1, 'gdpr': 1})
+
+    def test_whole_tokens_skip_matches_inside_words(self):
+        """단어 단위 검색 테스트 (조사는 허용, 단어 중간 일치는 제외)"""
+        automaton = KeywordAutomaton(['보안', '산재', '동의', 'security'], whole_tokens=True)
+
+        self.assertEqual(automaton.count('보안관 산재한 동의보감 cybersecurity'), {})
+        self.assertEqual(automaton.count('보안을 강화, 산재 발생, 동의 없이 security'),
+                         {'보안': 1, '산재': 1, '동의': 1, 'security': 1})
+
+class TestRuleBasedAnalyzer(unittest.TestCase):
+    """규칙 기반 분석 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.analyzer = RuleBasedAnalyzer()
+        metrics.reset()
+
+    def test_security_signals_rank_first(self):
+        """보안 사고 신호 매핑 테스트"""
+        result = self.analyzer.analyze(REPEATED_SECURITY_INCIDENTS)
+
+        self.assertEqual(result['certifications'][0]['item'], 'ISO 27001')
+        self.assertEqual(result['certifications'][0]['priority'], 'High')
+        self.assertIn('ISO 27701', [c['item'] for c in result['certifications'][:2]])
+        self.assertGreaterEqual(result['confidence_score'], 0.8)
+
+    def test_single_article_below_threshold(self):
+        """기사 한 건의 근거만으로는 LLM 생략 기준에 닿지 않는지 테스트"""
+        result = self.analyzer.analyze(SECURITY_INCIDENT)
+
+        self.assertEqual(result['certifications'][0]['item'], 'ISO 27001')
+        self.assertLess(result['confidence_score'], 0.8)
+
+    def test_unexplained_sources_lower_confidence(self):
+        """키워드로 설명되지 않는 자료가 많으면 신뢰도 하락 테스트"""
+        result = self.analyzer.analyze(UNEXPLAINED_NEWS)
+
+        self.assertLess(result['confidence_score'], 0.5)
+
+    def test_company_analyzer_skips_llm_when_confident(self):
+        """신뢰도가 기준 이상이면 LLM 생략 테스트"""
+        company_analyzer = CompanyAnalyzer()
+        company_analyzer.ai_analyzer = MagicMock()
+
+        with patch('app.services.analyzer.Config.RULE_ANALYZER_ENABLED', True), \
+                patch('app.services.analyzer.Config.RULE_ANALYZER_THRESHOLD', 0.8):
+            result = company_analyzer._run_analysis('테스트', REPEATED_SECURITY_INCIDENTS, None)
+            company_analyzer._run_analysis('테스트', UNEXPLAINED_NEWS, None)
+
+        self.assertEqual(result['analysis_method'], 'Rule-based (Tier 0)')
+        self.assertEqual(company_analyzer.ai_analyzer.analyze_company_risks.call_count, 1)
+        self.assertEqual(metrics.snapshot()['gauges']['analysis.tier0_share'], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,437 @@
+"""
+웹사이트 크롤링 서비스 테스트
+"""
+
+import time
+import shutil
+import threading
+import tempfile
+import unittest
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, MagicMock
+from app.services.web_scraper import WebScraper
+from app.services.page_cache import PageCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.charset_detector import detect_encoding
+from app.services.async_fetcher import AsyncFetchEngine
+
+SAMPLE_HTML = """
+<html>
+<head>
+    <title>테스트 주식회사</title>
+    <meta name="description" content="테스트 회사 소개">
+</head>
+<body>
+    <h1>테스트 회사</h1>
+    <p>대표이사: 홍길동 / 전화 02-123-4567</p>
+</body>
+</html>
+""".encode('utf-8')
+
+def make_response(status_code=200, content=b'', headers=None):
+    """requests 응답 객체 생성"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.encoding = 'utf-8'
+    response.raise_for_status = MagicMock()
+    return response
+
+class TestWebScraperCache(unittest.TestCase):
+    """웹페이지 캐시 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.scraper = WebScraper()
+        self.scraper.page_cache = PageCache(self.cache_dir)
+        self.scraper.breaker = CircuitBreaker('test_cache')
+        self.url = 'https://example.com'
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_first_fetch_stores_cache(self, mock_get):
+        """최초 수집 시 캐시 저장 테스트"""
+        mock_get.return_value = make_response(content=SAMPLE_HTML, headers={'ETag': '"v1"'})
+
+        info = self.scraper.scrape_website(self.url)
+
+        self.assertEqual(info['status'], 'success')
+        self.assertEqual(info['cache_status'], 'miss')
+        entry = self.scraper.page_cache.get_entry(self.url)
+        self.assertEqual(entry['etag'], '"v1"')
+        self.assertEqual(self.scraper.page_cache.get_html(entry['content_hash']), SAMPLE_HTML)
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_not_modified_reuses_extraction(self, mock_get):
+        """304 응답 시 파싱 없이 캐시 재사용 테스트"""
+        mock_get.return_value = make_response(content=SAMPLE_HTML, headers={'ETag': '"v1"'})
+        first = self.scraper.scrape_website(self.url)
+
+        mock_get.return_value = make_response(status_code=304)
+        with patch.object(self.scraper, '_parse_html') as mock_parse:
+            second = self.scraper.scrape_website(self.url)
+            mock_parse.assert_not_called()
+
+        headers = mock_get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(second['cache_status'], 'revalidated')
+        self.assertEqual(second['title'], first['title'])
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_unchanged_content_skips_parsing(self, mock_get):
+        """콘텐츠 해시 동일 시 파싱 생략 테스트"""
+        mock_get.return_value = make_response(content=SAMPLE_HTML)
+        self.scraper.scrape_website(self.url)
+
+        with patch.object(self.scraper, '_parse_html') as mock_parse:
+            info = self.scraper.scrape_website(self.url)
+            mock_parse.assert_not_called()
+
+        self.assertEqual(info['cache_status'], 'unchanged')
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_changed_content_is_reparsed(self, mock_get):
+        """콘텐츠 변경 시 재파싱 테스트"""
+        mock_get.return_value = make_response(content=SAMPLE_HTML)
+        self.scraper.scrape_website(self.url)
+
+        changed = SAMPLE_HTML.replace('테스트 주식회사'.encode('utf-8'), '변경 주식회사'.encode('utf-8'))
+        mock_get.return_value = make_response(content=changed)
+        info = self.scraper.scrape_website(self.url)
+
+        self.assertEqual(info['cache_status'], 'miss')
+        self.assertEqual(info['title'], '변경 주식회사')
+
+class TestWebScraperCircuitBreaker(unittest.TestCase):
+    """도메인 서킷 브레이커 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.scraper = WebScraper()
+        self.scraper.page_cache = PageCache('')
+        self.scraper.breaker = CircuitBreaker('test_breaker', failure_threshold=3, reset_timeout=60)
+        self.scraper.backoff_base = 0.01
+        self.url = 'https://dead.example.com'
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_breaker_opens_and_fails_fast(self, mock_get):
+        """연속 실패 후 요청 없이 즉시 폴백 테스트"""
+        mock_get.side_effect = requests.ConnectionError('unreachable')
+
+        first = self.scraper.scrape_website(self.url)
+        self.assertEqual(first['status'], 'error')
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.scraper.breaker.get_state('dead.example.com'), CircuitBreaker.OPEN)
+
+        second = self.scraper.scrape_website(self.url)
+        self.assertEqual(second['status'], 'error')
+        self.assertEqual(mock_get.call_count, 3)
+
+        snapshot = self.scraper.breaker.snapshot()
+        self.assertEqual(snapshot['open'], 1)
+        self.assertIn('dead.example.com', snapshot['keys'])
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_client_error_does_not_trip_breaker(self, mock_get):
+        """4xx 응답은 브레이커에 반영하지 않음 테스트"""
+        response = make_response(status_code=404)
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        mock_get.return_value = response
+
+        self.scraper.scrape_website(self.url)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.scraper.breaker.get_state('dead.example.com'), CircuitBreaker.CLOSED)
+
+    @patch('app.services.web_scraper.requests.get')
+    def test_deadline_stops_retries(self, mock_get):
+        """마감 시각이 지나면 재시도하지 않음 테스트"""
+        mock_get.side_effect = requests.Timeout('timeout')
+
+        self.scraper.scrape_website(self.url, deadline=time.monotonic() + 0.5)
+
+        self.assertEqual(mock_get.call_count, 0)
+
+    def test_half_open_after_reset_timeout(self):
+        """재시도 시간 경과 후 시험 요청 허용 테스트"""
+        breaker = CircuitBreaker('test_half_open', failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure('a.com')
+        self.assertFalse(breaker.allow('a.com'))
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow('a.com'))
+        self.assertEqual(breaker.get_state('a.com'), CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow('a.com'))
+
+        breaker.record_success('a.com')
+        self.assertEqual(breaker.get_state('a.com'), CircuitBreaker.CLOSED)
+
+class TestWebScraperStructuredData(unittest.TestCase):
+    """구조화 데이터 빠른 경로 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.scraper = WebScraper()
+
+    def parse(self, html):
+        """HTML 파싱"""
+        return self.scraper._parse_html(make_response(content=html.encode('utf-8')))
+
+    def test_json_ld_skips_text_scan(self):
+        """JSON-LD 정보가 본문 추출 필드를 모두 채우면 정규식 추출 생략 테스트"""
+        soup = self.parse("""
+        <html><head><script type="application/ld+json">
+        {"@context": "https://schema.org", "@graph": [
+            {"@type": "WebSite", "name": "테스트"},
+            {"@type": "Organization", "legalName": "주식회사 테스트", "taxID": "1234567890",
+             "employee": [{"@type": "Person", "name": "김철수", "jobTitle": "CTO"},
+                          {"@type": "Person", "name": "홍길동", "jobTitle": "대표이사"}],
+             "telephone": "02-123-4567", "email": "mailto:info@t.co",
+             "logo": {"@type": "ImageObject", "url": "https://t.co/logo.png"},
+             "address": {"@type": "PostalAddress", "addressRegion": "서울특별시",
+                         "addressLocality": "강남구", "streetAddress": "테헤란로 1"}}
+        ]}
+        </script></head><body>대표이사: 홍길동</body></html>
+        """)
+
+        with patch.object(self.scraper, '_extract_company_info') as mock_company, \
+                patch.object(self.scraper, '_extract_contact_info') as mock_contact:
+            info = self.scraper._build_website_info('https://t.co', soup)
+            mock_company.assert_not_called()
+            mock_contact.assert_not_called()
+
+        self.assertEqual(info['company_info'], {'legal_name': '주식회사 테스트', 'business_number': '123-45-67890',
+                                                'ceo': '홍길동'})
+        self.assertEqual(info['contact_info']['phones'], ['02-123-4567'])
+        self.assertEqual(info['contact_info']['emails'], ['info@t.co'])
+        self.assertEqual(info['contact_info']['addresses'], ['서울특별시 강남구 테헤란로 1'])
+        self.assertEqual(info['logo'], 'https://t.co/logo.png')
+        self.assertEqual(info['structured_data'], ['json-ld'])
+
+    def test_partial_structured_data_merges_with_text_scan(self):
+        """구조화 데이터가 불완전하면 정규식 추출과 병합 테스트"""
+        soup = self.parse("""
+        <html><head>
+            <meta property="og:site_name" content="테스트">
+            <meta property="og:image" content="https://t.co/og.png">
+        </head><body><p>대표이사: 홍길동 전화 02-987-6543</p></body></html>
+        """)
+
+        info = self.scraper._build_website_info('https://t.co', soup)
+
+        self.assertEqual(info['company_info']['legal_name'], '테스트')
+        self.assertEqual(info['company_info']['ceo'], '홍길동')
+        self.assertIn('02-987-6543', info['contact_info']['phones'])
+        self.assertEqual(info['structured_data'], ['opengraph'])
+
+    def test_json_ld_without_business_fields_keeps_text_scan(self):
+        """JSON-LD에 사업자등록번호·대표자가 없으면 본문 추출 결과와 병합 테스트"""
+        soup = self.parse("""
+        <html><head><script type="application/ld+json">
+        {"@type": "Organization", "legalName": "주식회사 테스트", "telephone": "02-123-4567",
+         "email": "info@t.co", "address": "서울특별시 강남구 테헤란로 1"}
+        </script></head><body>대표이사: 홍길동 사업자등록번호: 123-45-67890</body></html>
+        """)
+
+        info = self.scraper._build_website_info('https://t.co', soup)
+
+        self.assertEqual(info['company_info']['legal_name'], '주식회사 테스트')
+        self.assertEqual(info['company_info']['business_number'], '123-45-67890')
+        self.assertEqual(info['company_info']['ceo'], '홍길동')
+        self.assertEqual(info['contact_info']['phones'][0], '02-123-4567')
+
+    def test_site_name_does_not_replace_parsed_legal_name(self):
+        """og:site_name이 본문에서 찾은 법인명을 바꾸지 않는지 테스트"""
+        soup = self.parse("""
+        <html><head><meta property="og:site_name" content="테스트몰"></head>
+        <body><p>상호: 테스트유통 주식회사 대표이사: 홍길동</p></body></html>
+        """)
+
+        info = self.scraper._build_website_info('https://t.co', soup)
+
+        self.assertIn('테스트유통', info['company_info']['legal_name'])
+        self.assertNotEqual(info['company_info']['legal_name'], '테스트몰')
+
+    def test_microdata_organization(self):
+        """마이크로데이터 Organization 추출 테스트"""
+        soup = self.parse("""
+        <div itemscope itemtype="https://schema.org/Corporation">
+            <span itemprop="name">테스트 주식회사</span>
+            <span itemprop="telephone">031-111-2222</span>
+            <span itemprop="address">경기도 성남시 분당구</span>
+        </div>
+        """)
+
+        structured = self.scraper._extract_structured_data(soup)
+
+        self.assertEqual(structured['legal_name'], '테스트 주식회사')
+        self.assertEqual(structured['telephone'], '031-111-2222')
+        self.assertEqual(structured['sources'], ['microdata'])
+
+class TestCharsetDetection(unittest.TestCase):
+    """인코딩 감지 테스트 클래스"""
+
+    def test_header_charset(self):
+        """HTTP 헤더 인코딩 우선 테스트"""
+        self.assertEqual(detect_encoding(b'<html></html>', 'text/html; charset=UTF-8'), ('utf-8', 'header'))
+
+    def test_untrusted_header_falls_through_to_meta(self):
+        """ISO-8859-1 헤더는 무시하고 meta charset 사용 테스트"""
+        content = '<meta charset="euc-kr"><p>한글</p>'.encode('euc-kr')
+        self.assertEqual(detect_encoding(content, 'text/html; charset=ISO-8859-1'), ('cp949', 'meta'))
+
+    def test_bom(self):
+        """BOM 감지 테스트"""
+        content = b'\xef\xbb\xbf<html></html>'
+        self.assertEqual(detect_encoding(content, 'text/html'), ('utf-8-sig', 'bom'))
+
+    def test_statistical_fallback_for_euc_kr(self):
+        """선언 없는 EUC-KR 본문 통계적 감지 테스트"""
+        content = ('<p>정보보안 관리체계와 품질경영시스템을 운영합니다.</p>' * 50).encode('euc-kr')
+        encoding, method = detect_encoding(content, 'text/html')
+        self.assertEqual(method, 'statistical')
+        self.assertEqual(content.decode(encoding), ('<p>정보보안 관리체계와 품질경영시스템을 운영합니다.</p>' * 50))
+
+    def test_parse_html_decodes_euc_kr(self):
+        """EUC-KR 페이지 파싱 테스트"""
+        content = '<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">' \
+                  '<title>테스트 주식회사</title></head></html>'
+        response = make_response(content=content.encode('euc-kr'), headers={'Content-Type': 'text/html'})
+        soup = WebScraper()._parse_html(response)
+        self.assertEqual(soup.title.get_text(), '테스트 주식회사')
+
+class TestMainContentExtraction(unittest.TestCase):
+    """본문 발췌 추출 테스트 클래스"""
+
+    HTML = """
+    <html><body>
+      <div id="header"><ul class="gnb"><li><a href="/">홈</a></li><li><a href="/about">회사소개</a></li></ul></div>
+      <div class="cookie-consent">이 사이트는 쿠키를 사용합니다.</div>
+      <div id="container">
+        <div class="links"><a href="/a">바로가기 하나</a> <a href="/b">바로가기 둘</a></div>
+        <div class="contents">
+          <h2>회사 소개</h2>
+          <p>당사는 2005년 설립된 정보보안 전문 기업으로 ISO 27001 인증을 보유하고 있습니다.</p>
+          <p>주요 사업은 보안 컨설팅, 관제 서비스, 솔루션 개발이며 <a href="/clients">고객사</a>는 300여 곳입니다.</p>
+        </div>
+      </div>
+      <footer>Copyright 2024 테스트 주식회사. All rights reserved.</footer>
+    </body></html>
+    """
+
+    def setUp(self):
+        """테스트 설정"""
+        self.scraper = WebScraper()
+        self.soup = self.scraper._parse_html(make_response(content=self.HTML.encode('utf-8')))
+
+    def test_excludes_boilerplate(self):
+        """메뉴·쿠키 배너·푸터·링크 제외 테스트"""
+        excerpt = self.scraper._extract_main_content(self.soup)
+
+        self.assertTrue(excerpt.startswith('회사 소개 당사는 2005년 설립된'))
+        self.assertIn('300여 곳입니다.', excerpt)
+        for boilerplate in ['회사소개', '쿠키', 'Copyright', '바로가기']:
+            self.assertNotIn(boilerplate, excerpt)
+
+    def test_budget(self):
+        """글자 수 예산 테스트"""
+        excerpt = self.scraper._extract_main_content(self.soup, budget=40)
+
+        self.assertLessEqual(len(excerpt), 41)
+        self.assertTrue(excerpt.endswith('…'))
+
+    def test_website_info_includes_excerpt(self):
+        """웹사이트 정보에 본문 발췌 포함 테스트"""
+        info = self.scraper._build_website_info('https://t.co', self.soup)
+
+        self.assertIn('ISO 27001', info['content_excerpt'])
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """동시 처리 건수를 기록하는 대역 핸들러"""
+
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+
+    def do_GET(self):
+        with StandInHandler.lock:
+            StandInHandler.current += 1
+            StandInHandler.peak = max(StandInHandler.peak, StandInHandler.current)
+        try:
+            time.sleep(0.05)
+            status = 500 if self.path.startswith('/fail') else 200
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(SAMPLE_HTML)))
+            self.end_headers()
+            self.wfile.write(SAMPLE_HTML)
+        finally:
+            with StandInHandler.lock:
+                StandInHandler.current -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+class TestAsyncFetchEngine(unittest.TestCase):
+    """비동기 수집 엔진 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """로컬 대역 서버 시작"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        """로컬 대역 서버 종료"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """테스트 설정"""
+        StandInHandler.peak = 0
+
+    def test_per_host_cap(self):
+        """호스트별 동시 요청 제한 테스트"""
+        engine = AsyncFetchEngine(per_host_limit=3, politeness_delay=0)
+        urls = [f'{self.base_url}/page/{i}' for i in range(12)]
+
+        results = engine.fetch_all(urls)
+
+        self.assertEqual([r.url for r in results], urls)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertLessEqual(StandInHandler.peak, 3)
+        self.assertGreater(StandInHandler.peak, 1)
+
+    def test_politeness_delay(self):
+        """같은 호스트 요청 시작 간격 테스트"""
+        engine = AsyncFetchEngine(per_host_limit=10, politeness_delay=0.05)
+
+        started = time.perf_counter()
+        engine.fetch_all([f'{self.base_url}/page/{i}' for i in range(5)])
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.2)
+
+    def test_scrape_websites(self):
+        """웹사이트 일괄 수집 테스트"""
+        scraper = WebScraper()
+        scraper.page_cache = PageCache('')
+        scraper.breaker = CircuitBreaker('test_batch', failure_threshold=1)
+        engine = AsyncFetchEngine(per_host_limit=4, politeness_delay=0)
+
+        results = scraper.scrape_websites([f'{self.base_url}/ok', f'{self.base_url}/fail'], engine)
+
+        self.assertEqual(results[f'{self.base_url}/ok']['title'], '테스트 주식회사')
+        self.assertEqual(results[f'{self.base_url}/fail']['status'], 'error')
+        self.assertEqual(scraper.breaker.get_state('127.0.0.1'), CircuitBreaker.OPEN)
+
+if __name__ == '__main__':
+    unittest.main()